@@ -0,0 +1,111 @@
+"""
+Benchmark: `Game` x `CompactGame`.
+
+Grava partidas aleatórias (mesma sequência de jogadas para as duas
+representações) e mede jogadas/segundo aplicando e desfazendo essa sequência.
+Também mede cópia/restauração de estado (deepcopy de `Game` x snapshot do
+buffer) e mostra a memória de um estado compacto.
+
+    python benchmarks/bench_compact.py [--games 20] [--steps 300] [--repeat 5]
+"""
+
+from __future__ import annotations
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.compact import CompactGame, STATE_SIZE  # noqa: E402
+from spider.core import Game  # noqa: E402
+from spider.solver import DEAL, apply_move, legal_moves  # noqa: E402
+
+
+def record_playout(seed: int, steps: int, rng: random.Random):
+    game = Game(seed=seed)
+    line = []
+    for _ in range(steps):
+        moves = legal_moves(game)
+        if not moves:
+            break
+        mv = rng.choice(moves)
+        apply_move(game, mv)
+        line.append(mv)
+    return line
+
+
+def bench_game(seed: int, line, repeat: int) -> float:
+    game = Game(seed=seed)
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for mv in line:
+            apply_move(game, mv)
+        for _ in line:
+            game.undo()
+    return time.perf_counter() - t0
+
+
+def bench_compact(seed: int, line, repeat: int) -> float:
+    st = CompactGame.from_game(Game(seed=seed))
+    make, deal, unmake = st.make, st.deal, st.unmake
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for mv in line:
+            if mv == DEAL:
+                deal()
+            else:
+                make(*mv)
+        for _ in line:
+            unmake()
+    return time.perf_counter() - t0
+
+
+def bench_copies(seed: int, n: int):
+    game = Game(seed=seed)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        copy.deepcopy(game)
+    t_game = time.perf_counter() - t0
+
+    st = CompactGame.from_game(game)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        st.restore(st.snapshot())
+    t_compact = time.perf_counter() - t0
+    return t_game, t_compact
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--steps", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    t_game = t_compact = 0.0
+    n_moves = 0
+    for seed in range(args.games):
+        line = record_playout(seed, args.steps, rng)
+        n_moves += 2 * len(line) * args.repeat  # aplicar + desfazer
+        t_game += bench_game(seed, line, args.repeat)
+        t_compact += bench_compact(seed, line, args.repeat)
+
+    n_copies = 200
+    c_game, c_compact = bench_copies(0, n_copies)
+
+    st = CompactGame.from_game(Game(seed=0))
+    print(f"jogadas (make+unmake): {n_moves}")
+    print(f"Game        : {n_moves / t_game:12,.0f} jogadas/s")
+    print(f"CompactGame : {n_moves / t_compact:12,.0f} jogadas/s  ({t_game / t_compact:.1f}x)")
+    print(f"cópia de estado: Game {n_copies / c_game:10,.0f}/s | "
+          f"CompactGame {n_copies / c_compact:10,.0f}/s  ({c_game / c_compact:.0f}x)")
+    print(f"estado compacto: {STATE_SIZE} bytes de dados, "
+          f"{sys.getsizeof(st.buf)} bytes com o cabeçalho do bytearray")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: geração de distribuições e catálogo (`spider.deals`).
+
+Mede a vazão da construção do catálogo (distribuições/s), a latência de busca
+de uma distribuição no catálogo (mmap) contra embaralhar com PCG32 e contra
+`random.shuffle`, e o custo de criar um `Game` com e sem catálogo.
+
+    python benchmarks/bench_deals.py [--count 20000] [--lookups 100000]
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.core import Game  # noqa: E402
+from spider.deals import N_CARDS, DealCatalog, build_catalog, deal_order  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=20000, help="seeds no catálogo")
+    parser.add_argument("--lookups", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "deals.spdk")
+        t0 = time.perf_counter()
+        build_catalog(path, 0, args.count)
+        t_build = time.perf_counter() - t0
+        print(f"construção: {args.count / t_build:10,.0f} distribuições/s "
+              f"({os.path.getsize(path):,} bytes)")
+
+        rng = random.Random(0)
+        seeds = [rng.randrange(args.count) for _ in range(args.lookups)]
+        with DealCatalog(path) as cat:
+            deal = cat.deal
+            t0 = time.perf_counter()
+            for s in seeds:
+                deal(s)
+            t_lookup = (time.perf_counter() - t0) / len(seeds)
+
+            n = min(2000, len(seeds))
+            t0 = time.perf_counter()
+            for s in seeds[:n]:
+                deal_order(s)
+            t_pcg = (time.perf_counter() - t0) / n
+
+            order = list(range(N_CARDS))
+            t0 = time.perf_counter()
+            for s in seeds[:n]:
+                random.Random(s).shuffle(order)
+            t_py = (time.perf_counter() - t0) / n
+
+            print(f"busca no catálogo : {t_lookup * 1e6:8.2f} µs/distribuição")
+            print(f"PCG32 + Fisher-Yates: {t_pcg * 1e6:8.2f} µs/distribuição")
+            print(f"random.shuffle    : {t_py * 1e6:8.2f} µs/distribuição (referência, não portável)")
+
+            t0 = time.perf_counter()
+            for s in seeds[:n]:
+                Game(seed=s)
+            t_game = (time.perf_counter() - t0) / n
+            t0 = time.perf_counter()
+            for s in seeds[:n]:
+                Game(seed=s, deal=deal(s))
+            t_game_cat = (time.perf_counter() - t0) / n
+            print(f"Game(seed)             : {t_game * 1e6:8.1f} µs")
+            print(f"Game(seed, deal=catálogo): {t_game_cat * 1e6:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
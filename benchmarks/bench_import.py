@@ -0,0 +1,53 @@
+"""
+Benchmark: tempo de import do núcleo headless x camada visual.
+
+Cada medição roda um processo novo (como os trabalhadores em lote) e mede
+`import spider.core` e `import spider.view`. Também confirma que o núcleo não
+carrega arcade/pyglet.
+
+    python benchmarks/bench_import.py [--runs 10]
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPET = """
+import sys, time
+t0 = time.perf_counter()
+import {module}
+dt = time.perf_counter() - t0
+heavy = sorted(m for m in ("arcade", "pyglet", "pymunk") if m in sys.modules)
+print(dt, ",".join(heavy))
+"""
+
+
+def measure(module: str, runs: int):
+    times = []
+    heavy = ""
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", SNIPPET.format(module=module)],
+                             cwd=ROOT, capture_output=True, text=True, check=True)
+        dt, _, heavy = out.stdout.strip().partition(" ")
+        times.append(float(dt))
+    return statistics.median(times), heavy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for module in ("spider.core", "spider.view"):
+        med, heavy = measure(module, args.runs)
+        print(f"import {module:12s}: {med * 1000:8.1f} ms (mediana de {args.runs}) "
+              f"| carregou: {heavy or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark: janela com várias mesas (spider.multiview), headless.
+
+Para cada quantidade de mesas, um processo novo cria `MultiTableView` (uma
+mesa humana, as demais com bots jogando a cada `--interval` s) e roda N
+quadros de 1/60 s. Mede o tempo de CPU por quadro (`on_update` + envio do
+`on_draw`, o que o jogo controla) e o quadro completo até a GPU terminar
+(`ctx.finish()`; no rasterizador por software do modo headless este número
+é dominado pela GPU emulada, inclusive o `clear`, medido à parte).
+
+    python benchmarks/bench_multiview.py [--boards 4,9,16] [--frames 300] [--interval 0.1]
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPET = """
+import json, os, statistics, sys, time
+os.environ["ARCADE_HEADLESS"] = "1"
+from spider.multiview import MultiTableView
+n, frames, interval = int(sys.argv[1]), int(sys.argv[2]), float(sys.argv[3])
+view = MultiTableView(n, humans=1, interval=interval, texture_cache=None)
+for _ in range(30):  # texturas e glifos no atlas
+    view.on_update(1 / 60)
+    view.on_draw()
+view.ctx.finish()
+
+clear = []
+for _ in range(30):
+    t = time.perf_counter()
+    view.clear()
+    view.ctx.finish()
+    clear.append(time.perf_counter() - t)
+
+cpu, full = [], []
+refreshed = view.refreshed
+for _ in range(frames):
+    t = time.perf_counter()
+    view.on_update(1 / 60)
+    view.on_draw()
+    cpu.append(time.perf_counter() - t)
+    view.ctx.finish()
+    full.append(time.perf_counter() - t)
+
+def p(xs, q):
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(q * len(xs)))] * 1e3
+
+print(json.dumps({"cpu50": p(cpu, 0.5), "cpu99": p(cpu, 0.99), "full50": p(full, 0.5),
+                  "full99": p(full, 0.99), "clear": p(clear, 0.5),
+                  "refresh": (view.refreshed - refreshed) / frames,
+                  "sprites": len(view.sprites)}))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boards", default="4,9,16", help="quantidades de mesas, separadas por vírgula")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--interval", type=float, default=0.1, help="s entre jogadas de cada bot")
+    args = parser.parse_args()
+
+    print(f"{args.frames} quadros de 1/60 s; bots jogando a cada {args.interval} s")
+    print(f"{'mesas':>5s} {'sprites':>8s} {'mesas/quadro':>13s} {'CPU p50':>9s} {'CPU p99':>9s} "
+          f"{'quadro p50':>11s} {'quadro p99':>11s} {'só clear':>9s}")
+    for n in (int(s) for s in args.boards.split(",")):
+        out = subprocess.run([sys.executable, "-c", SNIPPET, str(n), str(args.frames), str(args.interval)],
+                             cwd=ROOT, capture_output=True, text=True, check=True)
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        print(f"{n:5d} {r['sprites']:8d} {r['refresh']:13.2f} {r['cpu50']:7.2f}ms {r['cpu99']:7.2f}ms "
+              f"{r['full50']:9.1f}ms {r['full99']:9.1f}ms {r['clear']:7.1f}ms")
+    print("60 FPS = 16,7 ms por quadro")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark: reiniciar partidas criando `Game` novo contra reaproveitar objetos.
+
+Compara, para N reinícios com distribuições já calculadas (o embaralhamento
+fica fora da medida):
+
+- `Game(seed, deal=...)`: objetos novos a cada partida (o que `reset` fazia);
+- `game.reset(seed, deal=...)`: mesmas cartas, colunas e estoque;
+- `GamePool.acquire` / `release`: partidas recicladas entre "sessões".
+
+Para cada um: tempo por reinício, coletas do GC por geração, tempo gasto no
+GC e pico de memória transitória (`tracemalloc`). Com `--live M`, M partidas
+ficam vivas (como sessões de um servidor) e cada reinício troca uma delas.
+
+    python benchmarks/bench_reset.py [--n 20000] [--live 5000]
+"""
+
+from __future__ import annotations
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.core import Game, GamePool  # noqa: E402
+from spider.deals import deal_order  # noqa: E402
+
+
+def _gc_collections() -> List[int]:
+    return [s["collections"] for s in gc.get_stats()]
+
+
+def measure(fn: Callable[[int], None], n: int, live: int) -> Dict:
+    gc_time = [0.0]
+    started = [0.0]
+
+    def on_gc(phase: str, info: Dict) -> None:
+        if phase == "start":
+            started[0] = time.perf_counter()
+        else:
+            gc_time[0] += time.perf_counter() - started[0]
+
+    fn(0)  # aquecimento
+    gc.collect()
+    before = _gc_collections()
+    gc.callbacks.append(on_gc)
+    t0 = time.perf_counter()
+    for k in range(n):
+        fn(k)
+    wall = time.perf_counter() - t0
+    gc.callbacks.remove(on_gc)
+    collections = [a - b for a, b in zip(_gc_collections(), before)]
+
+    # memória transitória: pico acima do que já estava alocado. Antes, uma volta
+    # completa nas partidas vivas para que todas tenham sido alocadas com o
+    # tracemalloc ligado (liberar um bloco não rastreado não desconta nada).
+    tracemalloc.start()
+    for k in range(live):
+        fn(k)
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    for k in range(max(1, n // 20)):
+        fn(k)
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return {
+        "us": wall / n * 1e6,
+        "collections": collections,
+        "gc_ms": gc_time[0] * 1e3,
+        "peak_kb": peak / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=20000, help="reinícios por variante")
+    parser.add_argument("--live", type=int, default=1, help="partidas vivas ao mesmo tempo")
+    args = parser.parse_args()
+
+    deals = [deal_order(s) for s in range(64)]
+    live = [Game(seed=k, deal=deals[k % 64]) for k in range(args.live)]
+    pool = GamePool()
+
+    def fresh(k: int) -> None:
+        live[k % len(live)] = Game(seed=k, deal=deals[k % 64])
+
+    def reset(k: int) -> None:
+        live[k % len(live)].reset(seed=k, deal=deals[k % 64])
+
+    def pooled(k: int) -> None:
+        # sessão encerrada devolve a partida; a próxima sessão a reaproveita
+        i = k % len(live)
+        pool.release(live[i])
+        live[i] = pool.acquire(seed=k, deal=deals[k % 64])
+
+    print(f"{args.n} reinícios, {args.live} partidas vivas (distribuições pré-calculadas)")
+    print(f"{'variante':24s} {'µs/reinício':>12s} {'GC gen0/1/2':>16s} {'tempo GC':>10s} "
+          f"{'pico memória':>13s}")
+    for name, fn in (("Game(seed, deal)", fresh), ("game.reset(seed, deal)", reset),
+                     ("GamePool acquire/release", pooled)):
+        r = measure(fn, args.n, args.live)
+        gens = "/".join(str(c) for c in r["collections"])
+        print(f"{name:24s} {r['us']:12.1f} {gens:>16s} {r['gc_ms']:8.1f} ms {r['peak_kb']:10.1f} KB")
+    print(f"pool: {pool.created} criadas, {pool.reused} reaproveitadas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark: abertura da janela, primeiro quadro e texto em regime (headless).
+
+Cada medição roda um processo novo com `ARCADE_HEADLESS=1` e mede:
+
+- `import spider.view`, construção de `SpiderView` e o primeiro `on_draw`
+  (com `ctx.finish()`, ou seja, até a GPU terminar);
+- quantas texturas de carta foram desenhadas com Pillow até ali;
+- N quadros em regime com o HUD mudando a cada quadro (o pior caso do timer):
+  tempo de CPU do `on_draw` e quantas vezes houve layout/shaping de texto
+  (`pyglet` `TextLayout._get_glyphs`) ou rasterização de glifos (Pillow);
+- troca para cartas 25% maiores (`TableRenderer.set_textures`): tempo do
+  quadro seguinte e texturas desenhadas.
+
+Variantes: sem cache de texturas, cache frio (diretório vazio; a folha é
+gravada ao fim) e cache quente (a folha gravada pela variante anterior).
+
+    python benchmarks/bench_startup.py [--runs 5] [--frames 200]
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPET = """
+import json, os, sys, time
+os.environ["ARCADE_HEADLESS"] = "1"
+cache = sys.argv[1] or None
+frames = int(sys.argv[2])
+t0 = time.perf_counter()
+import spider.view as sv
+t1 = time.perf_counter()
+view = sv.SpiderView(autosave_path=None, texture_cache=cache, stats_path=None)
+t2 = time.perf_counter()
+view.on_draw()
+view.ctx.finish()
+t3 = time.perf_counter()
+drawn = view.renderer.tex.drawn
+
+from PIL import ImageDraw
+from pyglet.text.layout import TextLayout
+counts = {"layout": 0, "raster": 0}
+
+def counting(cls, name, key):
+    orig = getattr(cls, name)
+    def wrapper(*a, **k):
+        counts[key] += 1
+        return orig(*a, **k)
+    setattr(cls, name, wrapper)
+
+counting(TextLayout, "_get_glyphs", "layout")
+counting(ImageDraw.ImageDraw, "text", "raster")
+for _ in range(10):  # glifos do HUD que ainda não apareceram
+    view.elapsed_time += 1
+    view.on_draw()
+view.ctx.finish()
+counts.update(layout=0, raster=0)
+cpu = 0.0
+for _ in range(frames):
+    view.elapsed_time += 1
+    t = time.perf_counter()
+    view.on_draw()
+    cpu += time.perf_counter() - t
+    view.ctx.finish()
+steady = dict(counts)
+
+tex = view.renderer.tex
+big = sv.CardTextures(round(tex.card_w * 1.25), round(tex.card_h * 1.25),
+                      round(tex.stock_w * 1.25), round(tex.stock_h * 1.25),
+                      sv.CARD_COLOR, sv.CARD_BACK, sv.CARD_BORDER, sv.SUIT_COLOR, sv.FONT_SIZE,
+                      cache_dir=cache)
+t4 = time.perf_counter()
+view.renderer.set_textures(big)
+view.on_draw()
+view.ctx.finish()
+t5 = time.perf_counter()
+resize_drawn = big.drawn
+if cache:
+    tex.save_cache()
+    big.save_cache()
+print(json.dumps({"import": t1 - t0, "ctor": t2 - t1, "first": t3 - t2, "drawn": drawn,
+                  "steady_ms": cpu / frames * 1e3, "layout": steady["layout"],
+                  "raster": steady["raster"], "resize": t5 - t4, "resize_drawn": resize_drawn}))
+"""
+
+
+def run_once(cache: str, frames: int) -> dict:
+    out = subprocess.run([sys.executable, "-c", SNIPPET, cache, str(frames)],
+                         cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--frames", type=int, default=200, help="quadros em regime por medição")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="spider-cache-")
+    try:
+        variants = []
+        for name in ("sem cache", "cache frio", "cache quente"):
+            results = []
+            for _ in range(args.runs):
+                if name == "cache frio":
+                    shutil.rmtree(tmp)
+                    os.makedirs(tmp)
+                results.append(run_once("" if name == "sem cache" else tmp, args.frames))
+            variants.append((name, results))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"mediana de {args.runs} processos; regime = {args.frames} quadros com o HUD mudando")
+    print(f"{'variante':13s} {'import':>8s} {'janela':>8s} {'1º quadro':>10s} {'desenhadas':>10s} "
+          f"{'regime CPU':>11s} {'layout/raster':>14s} {'troca tam.':>11s} {'desenhadas':>10s}")
+    for name, results in variants:
+        def med(key: str) -> float:
+            return statistics.median(r[key] for r in results)
+        print(f"{name:13s} {med('import') * 1e3:6.0f}ms {med('ctor') * 1e3:6.0f}ms "
+              f"{med('first') * 1e3:8.1f}ms {med('drawn'):10.0f} "
+              f"{med('steady_ms'):9.3f}ms {med('layout'):6.0f}/{med('raster'):<7.0f} "
+              f"{med('resize') * 1e3:9.1f}ms {med('resize_drawn'):10.0f}")
+
+
+if __name__ == "__main__":
+    main()
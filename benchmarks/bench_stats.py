@@ -0,0 +1,101 @@
+"""
+Benchmark: estatísticas das partidas (spider.stats) com milhões de linhas.
+
+Preenche um banco temporário com `--rows` partidas sintéticas (seeds com
+algumas partidas cada, variantes de 1/2/4 naipes, ~30% de vitórias) pela
+`StatsStore.record` e mede:
+
+- o custo de `record` para quem chama (só enfileira) e a vazão da thread de
+  gravação (lotes de `--batch` partidas por transação);
+- as consultas, em seeds sorteadas: vitória mais rápida da seed, resumo da
+  seed, recordes pessoais por tempo e por movimentos, totais e taxa de vitória;
+- opcionalmente (`--export`), `to_dataframe()` de todas as partidas.
+
+    python benchmarks/bench_stats.py [--rows 2000000] [--batch 512] [--queries 2000] [--export]
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from spider.stats import ABANDONED, LOST, WON, StatsStore  # noqa: E402
+
+
+def timed(fn, args_list) -> Tuple[float, float]:
+    """Mediana e máximo de ms por chamada."""
+    samples = []
+    for args in args_list:
+        t0 = time.perf_counter()
+        fn(*args)
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1e3, max(samples) * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--batch", type=int, default=512, help="partidas por transação")
+    parser.add_argument("--queries", type=int, default=2000, help="consultas de cada tipo")
+    parser.add_argument("--export", action="store_true", help="mede também to_dataframe()")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="spider-stats-")
+    try:
+        store = StatsStore(os.path.join(tmp, "stats.sqlite"), batch_size=args.batch)
+        rng = random.Random(0)
+        n_seeds = max(1, args.rows // 4)
+        t_record = 0.0
+        t0 = time.perf_counter()
+        for k in range(args.rows):
+            r = rng.random()
+            outcome = WON if r < 0.3 else LOST if r < 0.6 else ABANDONED
+            row = (rng.randrange(n_seeds), rng.choice((1, 2, 2, 2, 4)), outcome,
+                   rng.randint(80, 600), rng.uniform(60, 3600), rng.randint(0, 8), 1.7e9 + k)
+            t = time.perf_counter()
+            store.record(*row)
+            t_record += time.perf_counter() - t
+        store.flush()
+        t_fill = time.perf_counter() - t0
+        size = os.path.getsize(store.path) + sum(
+            os.path.getsize(store.path + ext) for ext in ("-wal", "-shm") if os.path.exists(store.path + ext))
+        print(f"{args.rows:,} partidas em {t_fill:.1f}s ({args.rows / t_fill:,.0f}/s, {store.batches} lotes), "
+              f"record {t_record / args.rows * 1e6:.1f} µs para quem chama, banco {size / 2**20:.0f} MiB")
+
+        seeds = [(rng.randrange(n_seeds), 2) for _ in range(args.queries)]
+        print(f"consultas ({args.queries} de cada, seeds sorteadas): mediana / máximo")
+        for name, fn, arg_list in (
+                ("vitória mais rápida da seed", store.fastest, seeds),
+                ("resumo da seed", store.seed_totals, seeds),
+                ("10 melhores tempos", store.personal_bests, [(2, 10)] * args.queries),
+                ("10 menos movimentos", lambda s, n: store.personal_bests(s, n, by="moves"),
+                 [(2, 10)] * args.queries),
+                ("totais / taxa de vitória", store.totals, [(2,)] * args.queries),
+                ("totais de todas as variantes", store.totals, [()] * args.queries)):
+            med, worst = timed(fn, arg_list)
+            print(f"  {name:30s} {med:8.3f} ms {worst:8.3f} ms")
+        t = store.totals(2)
+        print(f"2 naipes: {t.games:,} partidas, taxa de vitória {t.win_rate:.1%}")
+
+        if args.export:
+            t0 = time.perf_counter()
+            df = store.to_dataframe()
+            dt = time.perf_counter() - t0
+            print(f"to_dataframe: {len(df):,} linhas em {dt:.1f}s ({len(df) / dt:,.0f}/s), "
+                  f"{df.memory_usage(deep=True).sum() / 2**20:.0f} MiB")
+        store.close()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark: as variantes de 1, 2 e 4 naipes lado a lado (modelo, headless).
+
+Para cada variante (`spider.core.VARIANTS`), na mesma seed e com as mesmas
+jogadas aleatórias:
+
+- `Game(seed)` e `Game.reset` (baralho e distribuição da variante);
+- validação de jogada (`Column.movable_subsequence_from` + `Game.can_receive`)
+  de toda carta movível para toda coluna, em posições reais;
+- jogadas aleatórias legais (`solver.legal_moves` + `apply_move`) e quantas
+  sequências K→A elas removem.
+
+A variante de 2 naipes é a referência (coluna "x 2 naipes"). Para conferir que
+ela não ficou mais lenta entre commits, use `benchmarks/suite.py --compare`
+(cenários playout, validate, movable_deep).
+
+    python benchmarks/bench_variants.py [--seeds 8] [--moves 150] [--repeat 5]
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from spider.core import VARIANTS, Game, Variant  # noqa: E402
+from spider.deals import deal_order  # noqa: E402
+from spider.solver import apply_move, legal_moves  # noqa: E402
+
+
+def timed(fn: Callable[[], int], repeat: int) -> float:
+    """Mediana de ns por operação (`fn` devolve o número de operações)."""
+    fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        n = fn()
+        samples.append((time.perf_counter() - t0) / max(n, 1) * 1e9)
+    return statistics.median(samples)
+
+
+def positions(variant: Variant, seeds: int, moves: int) -> List[Game]:
+    out = []
+    for seed in range(seeds):
+        game = Game(seed=seed, variant=variant)
+        rng = random.Random(seed)
+        for _ in range(moves // 2):
+            mv = legal_moves(game)
+            if not mv:
+                break
+            apply_move(game, rng.choice(mv))
+        out.append(game)
+    return out
+
+
+def measure(variant: Variant, seeds: int, moves: int, repeat: int) -> Dict[str, float]:
+    deals = [deal_order(seed) for seed in range(seeds)]
+
+    def create() -> int:
+        for seed in range(seeds):
+            Game(seed=seed, deal=deals[seed], variant=variant)
+        return seeds
+
+    game = Game(seed=0, variant=variant)
+
+    def reset() -> int:
+        for k in range(10 * seeds):
+            game.reset(seed=k, deal=deals[k % seeds])
+        return 10 * seeds
+
+    games = positions(variant, seeds, moves)
+
+    def validate() -> int:
+        n = 0
+        for g in games:
+            cols = g.columns
+            can_receive = g.can_receive
+            for src in cols:
+                for idx in range(len(src.cards)):
+                    seq = src.movable_subsequence_from(idx)
+                    if seq is None:
+                        continue
+                    for dest in cols:
+                        if dest is not src:
+                            can_receive(dest, seq)
+                            n += 1
+        return n
+
+    removed = []
+
+    def playout() -> int:
+        rng = random.Random(1)
+        n = 0
+        removed.clear()
+        for seed in range(seeds):
+            g = Game(seed=seed, deal=deals[seed], variant=variant)
+            for _ in range(moves):
+                mv = legal_moves(g)
+                if not mv:
+                    break
+                apply_move(g, rng.choice(mv))
+                n += 1
+            removed.append(g.removed_sequences)
+        return n
+
+    return {
+        "create": timed(create, repeat),
+        "reset": timed(reset, repeat),
+        "validate": timed(validate, repeat),
+        "playout": timed(playout, repeat),
+        "removed": statistics.mean(removed),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seeds", type=int, default=8)
+    parser.add_argument("--moves", type=int, default=150, help="jogadas aleatórias por seed")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {n: measure(v, args.seeds, args.moves, args.repeat) for n, v in sorted(VARIANTS.items())}
+    base = results[2]
+    print(f"{args.seeds} seeds, até {args.moves} jogadas aleatórias; mediana de {args.repeat} rodadas")
+    print(f"{'variante':10s} {'Game()':>10s} {'reset':>10s} {'validação':>11s} {'jogada':>10s} "
+          f"{'K→A/partida':>12s} {'x 2 naipes (validação/jogada)':>30s}")
+    for n, r in results.items():
+        print(f"{VARIANTS[n].name:10s} {r['create'] / 1e3:8.1f}µs {r['reset'] / 1e3:8.1f}µs "
+              f"{r['validate']:9.0f}ns {r['playout'] / 1e3:8.1f}µs {r['removed']:12.2f} "
+              f"{r['validate'] / base['validate']:17.2f} / {r['playout'] / base['playout']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+"""
+Suíte de benchmarks dos caminhos quentes (modelo e renderização).
+
+Cenários (tempo por operação, mediana de `--repeat` rodadas):
+
+- playout        jogadas aleatórias legais (`Game.move`/`deal`) em várias seeds
+- playout_1s     o mesmo na variante de 1 naipe
+- playout_4s     o mesmo na variante de 4 naipes
+- move_undo      `Game.move` + `Game.undo` sobre uma linha gravada
+- deal_undo      tempestade de `Game.deal` + `Game.undo`
+- movable_deep   `Column.movable_subsequence_from` + `Game.can_receive` em coluna
+                 alta (validação de arraste)
+- validate       `movable_subsequence_from` + `can_receive` de toda carta para toda
+                 coluna em posições reais de 2 naipes (também `validate_4s`)
+- pick           hit-test da mesa (`TableLayout.pick`, o mesmo de `pick_column_card`)
+- reset          `Game.reset` com distribuições pré-calculadas (reaproveita objetos)
+- vecsim         jogadas aleatórias no simulador em lote (`spider.vecsim`, 2000 partidas)
+- draw           `SpiderView.on_draw` sem e com mudança no modelo (contexto
+                 Arcade headless; pulado se não houver OpenGL)
+
+Resultados em JSON (com commit e versão do Python) para comparar execuções:
+
+    python benchmarks/suite.py --out bench/base.json
+    python benchmarks/suite.py --compare bench/base.json --threshold 0.15 [--threshold-for draw=0.3]
+
+Com `--compare`, o processo sai com código 1 se algum cenário ficar mais lento
+que a referência além do limite (fração: 0.15 = 15%).
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from spider.core import FOUR_SUITS, ONE_SUIT, TWO_SUITS, Card, Game, Sequence, Suit, Variant  # noqa: E402
+from spider.solver import DEAL, apply_move, legal_moves  # noqa: E402
+
+# Um cenário prepara o estado e devolve `run() -> número de operações`.
+Scenario = Callable[[], Callable[[], int]]
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+def scenario(name: str):
+    def register(fn: Scenario) -> Scenario:
+        SCENARIOS[name] = fn
+        return fn
+    return register
+
+
+def _record_line(seed: int, steps: int, rng: random.Random,
+                 variant: Variant = TWO_SUITS) -> List[Tuple[int, int, int]]:
+    game = Game(seed=seed, variant=variant)
+    line = []
+    for _ in range(steps):
+        moves = legal_moves(game)
+        if not moves:
+            break
+        mv = rng.choice(moves)
+        apply_move(game, mv)
+        line.append(mv)
+    return line
+
+
+# =========================
+# Cenários do modelo
+# =========================
+
+def _playout(variant: Variant):
+    def run() -> int:
+        rng = random.Random(1)
+        n = 0
+        for seed in range(8):
+            game = Game(seed=seed, variant=variant)
+            for _ in range(150):
+                moves = legal_moves(game)
+                if not moves:
+                    break
+                apply_move(game, rng.choice(moves))
+                n += 1
+        return n
+    return run
+
+
+@scenario("playout")
+def bench_playout():
+    return _playout(TWO_SUITS)
+
+
+@scenario("playout_1s")
+def bench_playout_1s():
+    return _playout(ONE_SUIT)
+
+
+@scenario("playout_4s")
+def bench_playout_4s():
+    return _playout(FOUR_SUITS)
+
+
+@scenario("move_undo")
+def bench_move_undo():
+    lines = [(seed, _record_line(seed, 300, random.Random(seed))) for seed in range(6)]
+    games = [(Game(seed=seed), line) for seed, line in lines]
+
+    def run() -> int:
+        n = 0
+        for game, line in games:
+            for mv in line:
+                apply_move(game, mv)
+            for _ in line:
+                game.undo()
+            n += 2 * len(line)
+        return n
+    return run
+
+
+@scenario("deal_undo")
+def bench_deal_undo():
+    game = Game(seed=3)
+
+    def run() -> int:
+        n = 0
+        for _ in range(400):
+            k = 0
+            while game.deal():
+                k += 1
+            for _ in range(k):
+                game.undo()
+            n += 2 * k
+        return n
+    return run
+
+
+@scenario("movable_deep")
+def bench_movable_deep():
+    game = Game(seed=0)
+    col = game.columns[0]
+    # coluna alta: 5 viradas para baixo + K→2 de espadas (sem o Ás: não é removida)
+    col.cards = [Card(v, Suit.H, False) for v in range(1, 6)]
+    col.cards += [Card(v, Suit.S, True) for v in range(13, 1, -1)]
+    col.reindex()
+    dest = game.columns[1]
+    dest.cards = [Card(9, Suit.S, True)]
+    dest.reindex()
+    n_cards = len(col.cards)
+
+    def run() -> int:
+        n = 0
+        movable = col.movable_subsequence_from
+        can_receive = game.can_receive
+        for _ in range(2000):
+            for idx in range(n_cards):
+                seq: Optional[Sequence] = movable(idx)
+                if seq is not None:
+                    can_receive(dest, seq)
+                n += 1
+        return n
+    return run
+
+
+def _validate(variant: Variant):
+    # posições depois de algumas jogadas: colunas com sequências de vários tamanhos
+    games = []
+    for seed in range(4):
+        game = Game(seed=seed, variant=variant)
+        for mv in _record_line(seed, 80, random.Random(seed), variant):
+            apply_move(game, mv)
+        games.append(game)
+
+    def run() -> int:
+        n = 0
+        for _ in range(20):
+            for game in games:
+                cols = game.columns
+                can_receive = game.can_receive
+                for src in cols:
+                    for idx in range(len(src.cards)):
+                        seq = src.movable_subsequence_from(idx)
+                        if seq is None:
+                            continue
+                        for dest in cols:
+                            if dest is not src:
+                                can_receive(dest, seq)
+                                n += 1
+        return n
+    return run
+
+
+@scenario("validate")
+def bench_validate():
+    return _validate(TWO_SUITS)
+
+
+@scenario("validate_4s")
+def bench_validate_4s():
+    return _validate(FOUR_SUITS)
+
+
+@scenario("pick")
+def bench_pick():
+    from spider.layout import TableLayout
+    game = Game(seed=0)
+    for mv in _record_line(0, 120, random.Random(0)):
+        apply_move(game, mv)
+    layout = TableLayout(10, 90, 100, 660, 80, 110, 28, 100)
+    layout.update(game)
+    rng = random.Random(2)
+    points = [(rng.uniform(0, 1200), rng.uniform(0, 800)) for _ in range(20000)]
+
+    def run() -> int:
+        pick = layout.pick
+        for x, y in points:
+            pick(x, y)
+        return len(points)
+    return run
+
+
+@scenario("reset")
+def bench_reset():
+    from spider.deals import deal_order
+    deals = [deal_order(seed) for seed in range(16)]
+    game = Game(seed=0)
+
+    def run() -> int:
+        for k in range(400):
+            game.reset(seed=k, deal=deals[k % 16])
+        return 400
+    return run
+
+
+@scenario("vecsim")
+def bench_vecsim():
+    from spider.vecsim import BatchSim, rollout
+    seeds = range(2000)
+    sim = BatchSim(seeds)
+    initial = [a.copy() for a in (sim.cards, sim.height, sim.down, sim.run, sim.top,
+                                  sim.stock_n, sim.removed)]
+
+    def run() -> int:
+        for dst, src in zip((sim.cards, sim.height, sim.down, sim.run, sim.top,
+                             sim.stock_n, sim.removed), initial):
+            dst[...] = src
+        return int(rollout(sim, "random", max_moves=100)["moves"].sum())
+    return run
+
+
+# =========================
+# Renderização (headless)
+# =========================
+
+_VIEW = None
+
+
+def _view():
+    """Janela única (Arcade permite uma por processo), criada sob demanda."""
+    global _VIEW
+    if _VIEW is None:
+        os.environ.setdefault("ARCADE_HEADLESS", "1")
+        from spider.view import SpiderView
+        _VIEW = SpiderView(autosave_path=None, texture_cache=None, stats_path=None)
+        _VIEW.game = Game(seed=0)
+        for mv in _record_line(0, 80, random.Random(0)):
+            apply_move(_VIEW.game, mv)
+    return _VIEW
+
+
+@scenario("draw")
+def bench_draw():
+    view = _view()
+    view.on_draw()  # texturas/glifos no primeiro quadro
+
+    def run() -> int:
+        for _ in range(30):
+            view.on_draw()
+        return 30
+    return run
+
+
+@scenario("draw_dirty")
+def bench_draw_dirty():
+    view = _view()
+    game = view.game
+    moves = [mv for mv in legal_moves(game) if mv != DEAL] or [DEAL]
+
+    def run() -> int:
+        # cada quadro com o modelo alterado: a mesa é remontada
+        for k in range(20):
+            if k % 2 == 0:
+                apply_move(game, moves[0])
+            else:
+                game.undo()
+            view.on_draw()
+        return 20
+    return run
+
+
+# =========================
+# Execução / comparação
+# =========================
+
+def measure(name: str, repeat: int) -> Dict:
+    run = SCENARIOS[name]()
+    run()  # aquecimento
+    samples = []
+    ops = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        ops = run()
+        samples.append((time.perf_counter() - t0) / max(ops, 1) * 1e9)
+    return {
+        "ns_per_op": statistics.median(samples),
+        "min_ns_per_op": min(samples),
+        "ops": ops,
+        "repeat": repeat,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def compare(results: Dict, baseline: Dict, threshold: float,
+            per_name: Dict[str, float]) -> List[str]:
+    """Cenários mais lentos que a referência além do limite."""
+    regressions = []
+    for name, cur in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base or "ns_per_op" not in cur:
+            continue
+        ratio = cur["ns_per_op"] / base["ns_per_op"]
+        limit = per_name.get(name, threshold)
+        flag = ""
+        if ratio > 1 + limit:
+            regressions.append(name)
+            flag = f"  REGRESSÃO (limite +{limit:.0%})"
+        print(f"  {name:14s} {base['ns_per_op']:12,.0f} -> {cur['ns_per_op']:12,.0f} ns/op "
+              f"({ratio - 1:+.1%}){flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks dos caminhos quentes do Spider.")
+    parser.add_argument("--only", default="", help="cenários separados por vírgula")
+    parser.add_argument("--skip-render", action="store_true")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--out", help="grava os resultados em JSON")
+    parser.add_argument("--compare", help="JSON de referência")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="regressão tolerada (fração), padrão 0.15")
+    parser.add_argument("--threshold-for", action="append", default=[], metavar="NOME=FRAÇÃO",
+                        help="limite por cenário (pode repetir)")
+    args = parser.parse_args()
+
+    names = [n for n in args.only.split(",") if n] or list(SCENARIOS)
+    if args.skip_render:
+        names = [n for n in names if not n.startswith("draw")]
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"cenários desconhecidos: {', '.join(unknown)}")
+    per_name = {}
+    for item in args.threshold_for:
+        name, _, frac = item.partition("=")
+        per_name[name] = float(frac)
+
+    results = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scenarios": {},
+    }
+    for name in names:
+        try:
+            res = measure(name, args.repeat)
+        except Exception as e:  # ex.: sem OpenGL para os cenários de desenho
+            results["scenarios"][name] = {"skipped": f"{type(e).__name__}: {e}"}
+            print(f"{name:14s} pulado ({type(e).__name__}: {e})")
+            continue
+        results["scenarios"][name] = res
+        print(f"{name:14s} {res['ns_per_op']:12,.0f} ns/op  (mín {res['min_ns_per_op']:,.0f}, "
+              f"{res['ops']} ops x {res['repeat']})")
+
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"comparação com {baseline.get('commit')} ({args.compare}):")
+        regressions = compare(results, baseline, args.threshold, per_name)
+        if regressions:
+            print(f"regressões: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,24 @@
+"""
+Paciência Spider (1, 2 ou 4 naipes).
+
+O modelo (`spider.core`) é reexportado aqui e não depende do Arcade.
+A interface gráfica fica em `spider.view` e só é importada quando usada
+(`spider.SpiderView`, `spider.main` ou `python -m spider`).
+"""
+
+from .core import (Card, Column, Deck, Game, History, Move, Sequence, Stock, Suit, SUIT_LABEL,
+                   VARIANTS, Variant)
+
+__all__ = [
+    "Card", "Column", "Deck", "Game", "History", "Move", "Sequence", "Stock", "Suit", "SUIT_LABEL",
+    "VARIANTS", "Variant",
+    "SpiderView", "main",
+]
+
+
+def __getattr__(name):
+    # Import tardio da camada visual: evita carregar arcade/pyglet no modo headless.
+    if name in ("SpiderView", "main"):
+        from . import view
+        return getattr(view, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,99 @@
+"""
+Interpolação de posições de sprites (sem Arcade).
+
+- `Animator.move(obj, start, end, ...)` leva `obj.position` de `start` a
+  `end` em `duration` s (easing cúbico de saída). Cada objeto tem no máximo
+  uma interpolação: pedir outra a partir de onde ele está substitui a
+  anterior, então ações repetidas (distribuir, desfazer) nunca acumulam
+  trabalho — o custo é limitado pelo número de sprites na mesa.
+- `update(dt)` avança todas as interpolações de uma vez (chamado uma vez por
+  `on_update`). O avanço é pelo tempo real: quadros lentos pulam etapas em
+  vez de atrasar a animação; um quadro acima de `max_dt` (carga, janela
+  travada) termina tudo na hora.
+- O modelo não espera a animação: a mesa já está na posição final para
+  hit-test e regras; só o desenho acompanha.
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, List, Optional, Tuple
+
+Point = Tuple[float, float]
+
+
+class Tween:
+    __slots__ = ("obj", "x0", "y0", "x1", "y1", "elapsed", "duration", "on_done")
+
+    def __init__(self, obj, start: Point, end: Point, duration: float, delay: float,
+                 on_done: Optional[Callable[[object], None]]) -> None:
+        self.obj = obj
+        self.x0, self.y0 = start
+        self.x1, self.y1 = end
+        self.elapsed = -delay
+        self.duration = duration
+        self.on_done = on_done
+
+
+class Animator:
+    def __init__(self, duration: float = 0.18, max_dt: float = 0.1) -> None:
+        self.duration = duration
+        self.max_dt = max_dt
+        self._tweens: Dict[int, Tween] = {}
+        self.skipped = 0  # interpolações terminadas antes do fim por carga
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._tweens)
+
+    def __len__(self) -> int:
+        return len(self._tweens)
+
+    def move(self, obj, start: Point, end: Point, delay: float = 0.0,
+             duration: Optional[float] = None,
+             on_done: Optional[Callable[[object], None]] = None) -> None:
+        """Anima `obj` de `start` a `end` (substitui uma interpolação anterior do mesmo objeto)."""
+        obj.position = start
+        self._tweens[id(obj)] = Tween(obj, start, end,
+                                      self.duration if duration is None else duration,
+                                      delay, on_done)
+
+    def cancel(self, obj) -> None:
+        """Para de animar `obj` onde ele está (ex.: começou a ser arrastado)."""
+        self._tweens.pop(id(obj), None)
+
+    def target(self, obj) -> Optional[Point]:
+        tw = self._tweens.get(id(obj))
+        return (tw.x1, tw.y1) if tw is not None else None
+
+    def finish(self) -> None:
+        """Leva tudo à posição final imediatamente."""
+        tweens = list(self._tweens.values())
+        self._tweens.clear()
+        for tw in tweens:
+            tw.obj.position = (tw.x1, tw.y1)
+            if tw.on_done is not None:
+                tw.on_done(tw.obj)
+
+    def update(self, dt: float) -> None:
+        if not self._tweens:
+            return
+        if dt > self.max_dt:
+            self.skipped += len(self._tweens)
+            self.finish()
+            return
+        done: List[Tween] = []
+        for tw in self._tweens.values():
+            tw.elapsed += dt
+            if tw.elapsed <= 0:
+                continue
+            t = tw.elapsed / tw.duration
+            if t >= 1:
+                tw.obj.position = (tw.x1, tw.y1)
+                done.append(tw)
+                continue
+            k = 1 - (1 - t) ** 3
+            tw.obj.position = (tw.x0 + (tw.x1 - tw.x0) * k, tw.y0 + (tw.y1 - tw.y0) * k)
+        for tw in done:
+            if self._tweens.get(id(tw.obj)) is tw:
+                del self._tweens[id(tw.obj)]
+            if tw.on_done is not None:
+                tw.on_done(tw.obj)
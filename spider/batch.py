@@ -0,0 +1,394 @@
+"""
+Execução em lote (headless) de partidas por seed.
+
+- Distribui as seeds em lotes (shards) entre processos (`ProcessPoolExecutor`).
+- Política de jogo plugável: random, greedy ou solver.
+- Grava um resultado por partida (JSONL ou CSV) à medida que os lotes terminam.
+- `--resume` pula as seeds já presentes no arquivo de saída com a mesma
+  política e variante (cada linha grava `policy` e `suits`); uma linha
+  cortada no fim é descartada. Sem `--resume`, um arquivo existente só é
+  substituído com `--overwrite`.
+- `--catalog` usa distribuições pré-calculadas (spider.deals) em vez de embaralhar.
+- `--suits` escolhe a variante (1, 2 ou 4 naipes; a mesma seed dá a mesma
+  permutação do baralho de cada variante).
+
+Uso:
+    python -m spider.batch --seeds 0:100000 --policy greedy --workers 8 --out resultados.jsonl
+"""
+
+from __future__ import annotations
+import argparse
+import csv
+import json
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .core import TWO_SUITS, VARIANTS, Game, GamePool, Variant, decode_move
+from .deals import DealCatalog
+from .solver import (BUDGET_EXHAUSTED, DEAL, SolverMove, Solver,
+                     apply_move, dead_end, legal_moves, ordered_moves, state_key)
+
+WON = "won"
+LOST = "lost"
+MAX_MOVES = "max_moves"
+
+# Após tantas jogadas seguidas sem revelar carta, remover K→A ou distribuir,
+# verifica (com orçamento de posições) se a partida só anda em círculos
+DEAD_END_AFTER = 50
+DEAD_END_STATES = 2000
+
+# Cada processo joga as seeds em sequência: uma partida reaproveitada (cartas,
+# colunas e estoque) em vez de uma nova por seed
+_POOL = GamePool(max_size=1)
+
+FIELDS = ["seed", "policy", "suits", "outcome", "moves", "deals", "removed_sequences", "wall_time"]
+
+
+# =========================
+# Políticas
+# =========================
+
+class Policy:
+    """Escolhe a próxima jogada; None encerra a partida."""
+
+    name = "base"
+
+    def start(self, game: Game, seed: int) -> None:
+        pass
+
+    def choose(self, game: Game) -> Optional[SolverMove]:
+        raise NotImplementedError
+
+    def outcome_when_stuck(self) -> str:
+        return LOST
+
+
+class RandomPolicy(Policy):
+    """Jogada legal aleatória (reprodutível pela seed)."""
+
+    name = "random"
+
+    def start(self, game: Game, seed: int) -> None:
+        self.rng = random.Random(seed)
+
+    def choose(self, game: Game) -> Optional[SolverMove]:
+        moves = legal_moves(game)
+        return self.rng.choice(moves) if moves else None
+
+
+class GreedyPolicy(Policy):
+    """Melhor jogada pela ordenação do solver que leve a uma posição inédita."""
+
+    name = "greedy"
+
+    def start(self, game: Game, seed: int) -> None:
+        self.seen: Set[Hashable] = {state_key(game)}
+
+    def choose(self, game: Game) -> Optional[SolverMove]:
+        for mv in ordered_moves(game):
+            if not apply_move(game, mv):
+                continue
+            key = state_key(game)
+            game.undo()
+            if key not in self.seen:
+                self.seen.add(key)
+                return mv
+        return None
+
+
+class SolverPolicy(Policy):
+    """Resolve a partida com o solver e segue a linha vencedora."""
+
+    name = "solver"
+
+    def __init__(self, max_nodes: int = 200_000, max_time: float = 10.0) -> None:
+        self.max_nodes = max_nodes
+        self.max_time = max_time
+
+    def start(self, game: Game, seed: int) -> None:
+        result = Solver(game, max_nodes=self.max_nodes, max_time=self.max_time).solve()
+        self.status = result.status
+        self.line: Iterator[SolverMove] = iter(result.line)
+
+    def choose(self, game: Game) -> Optional[SolverMove]:
+        return next(self.line, None)
+
+    def outcome_when_stuck(self) -> str:
+        return BUDGET_EXHAUSTED if self.status == BUDGET_EXHAUSTED else LOST
+
+
+def make_policy(name: str, **kwargs) -> Policy:
+    if name == "random":
+        return RandomPolicy()
+    if name == "greedy":
+        return GreedyPolicy()
+    if name == "solver":
+        return SolverPolicy(**kwargs)
+    raise ValueError(f"política desconhecida: {name}")
+
+
+POLICY_NAMES = ("random", "greedy", "solver")
+
+
+# =========================
+# Partidas
+# =========================
+
+def play_seed(seed: int, policy: Policy, max_moves: int = 2000,
+              deal: Optional[bytes] = None, variant: Variant = TWO_SUITS) -> Dict:
+    t0 = time.perf_counter()
+    game = _POOL.acquire(seed, deal, variant)
+    policy.start(game, seed)
+    moves = deals = idle = 0
+    hist = game.historico
+    while True:
+        if game.is_won():
+            outcome = WON
+            break
+        if game.is_lost() or (idle >= DEAD_END_AFTER and idle % DEAD_END_AFTER == 0
+                              and dead_end(game, DEAD_END_STATES) is True):
+            outcome = LOST
+            break
+        if moves >= max_moves:
+            outcome = MAX_MOVES
+            break
+        mv = policy.choose(game)
+        if mv is None or not apply_move(game, mv):
+            outcome = policy.outcome_when_stuck()
+            break
+        moves += 1
+        if mv == DEAL:
+            deals += 1
+            idle = 0
+        else:
+            m = decode_move(hist.codes[hist.pos - 1])
+            idle = 0 if m.revelou_origem or m.removeu_sequencia else idle + 1
+    result = {
+        "seed": seed,
+        "policy": policy.name,
+        "suits": len(variant.suits),
+        "outcome": outcome,
+        "moves": moves,
+        "deals": deals,
+        "removed_sequences": game.removed_sequences,
+        "wall_time": round(time.perf_counter() - t0, 6),
+    }
+    _POOL.release(game)
+    return result
+
+
+def run_shard(seeds: List[int], policy_name: str, max_moves: int,
+              solver_nodes: int, solver_time: float,
+              catalog: Optional[str] = None, suits: int = 2) -> List[Dict]:
+    """Executado no processo trabalhador: joga um lote de seeds."""
+    kwargs = {}
+    if policy_name == "solver":
+        kwargs = {"max_nodes": solver_nodes, "max_time": solver_time}
+    policy = make_policy(policy_name, **kwargs)
+    variant = VARIANTS[suits]
+    if catalog is None:
+        return [play_seed(seed, policy, max_moves, None, variant) for seed in seeds]
+    with DealCatalog(catalog) as cat:
+        return [play_seed(seed, policy, max_moves, cat.get(seed), variant) for seed in seeds]
+
+
+# =========================
+# Saída / retomada
+# =========================
+
+def completed_seeds(path: str, policy: str, suits: int = 2) -> Set[int]:
+    """Seeds já gravadas em `path` (JSONL ou CSV) com esta política e variante.
+
+    Linhas truncadas são ignoradas; linhas sem `suits` (arquivos anteriores a
+    esse campo) contam como 2 naipes.
+    """
+    done: Set[int] = set()
+    if not os.path.exists(path):
+        return done
+    want: Tuple[str, int] = (policy, suits)
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            rows: Iterable = csv.DictReader(f)
+        else:
+            rows = (_json_row(line) for line in f)
+        for row in rows:
+            try:
+                if (row["policy"], int(row.get("suits") or 2)) == want:
+                    done.add(int(row["seed"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+    return done
+
+
+def _json_row(line: str) -> Optional[Dict]:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+class ResultWriter:
+    """Grava resultados em modo append, um flush por lote."""
+
+    def __init__(self, path: str) -> None:
+        self.csv = path.endswith(".csv")
+        # execução interrompida pode ter deixado a última linha pela metade
+        new_file = _drop_partial_line(path) == 0
+        if self.csv and not new_file:
+            with open(path, newline="", encoding="utf-8") as f:
+                header = next(csv.reader(f), None)
+            if header != FIELDS:
+                raise ValueError(f"{path}: colunas {header} diferem de {FIELDS}; use outro arquivo")
+        self.f = open(path, "a", newline="", encoding="utf-8")
+        if self.csv:
+            self.writer = csv.DictWriter(self.f, fieldnames=FIELDS)
+            if new_file:
+                self.writer.writeheader()
+
+    def write(self, rows: Iterable[Dict]) -> None:
+        for row in rows:
+            if self.csv:
+                self.writer.writerow(row)
+            else:
+                self.f.write(json.dumps(row) + "\n")
+        self.f.flush()
+
+    def close(self) -> None:
+        self.f.close()
+
+
+def _drop_partial_line(path: str, chunk: int = 4096) -> int:
+    """Corta `path` depois da última quebra de linha. Retorna o tamanho final (0 se não existe)."""
+    if not os.path.exists(path):
+        return 0
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        while pos > 0:
+            start = max(0, pos - chunk)
+            f.seek(start)
+            nl = f.read(pos - start).rfind(b"\n")
+            if nl >= 0:
+                pos = start + nl + 1
+                break
+            pos = start
+        if pos != end:
+            f.truncate(pos)
+    return pos
+
+
+def shards(seeds: Iterable[int], size: int) -> Iterator[List[int]]:
+    buf: List[int] = []
+    for seed in seeds:
+        buf.append(seed)
+        if len(buf) >= size:
+            yield buf
+            buf = []
+    if buf:
+        yield buf
+
+
+def parse_seed_range(spec: str) -> range:
+    """Intervalo "A:B" (B exclusivo) ou "N" (apenas a seed N)."""
+    if ":" in spec:
+        a, b = spec.split(":", 1)
+        return range(int(a), int(b))
+    return range(int(spec), int(spec) + 1)
+
+
+def run_batch(seeds: Iterable[int], out: str, policy: str = "greedy",
+              workers: Optional[int] = None, shard_size: int = 64,
+              max_moves: int = 2000, resume: bool = False,
+              solver_nodes: int = 200_000, solver_time: float = 10.0,
+              catalog: Optional[str] = None, suits: int = 2,
+              overwrite: bool = False) -> Dict[str, int]:
+    """Joga `seeds` em paralelo e grava em `out`. Retorna contagem por resultado.
+
+    Um `out` com conteúdo só é apagado com `overwrite`; sem `resume` nem
+    `overwrite`, dá FileExistsError.
+    """
+    workers = workers or os.cpu_count() or 1
+    if resume:
+        _drop_partial_line(out)   # antes da leitura: a linha cortada não conta como feita
+        done = completed_seeds(out, policy, suits)
+        seeds = (s for s in seeds if s not in done)
+    elif os.path.exists(out) and os.path.getsize(out):
+        if not overwrite:
+            raise FileExistsError(f"{out}: já existe; use --resume para continuar ou --overwrite para substituir")
+        os.remove(out)
+
+    writer = ResultWriter(out)
+    counts: Dict[str, int] = {}
+    pending = set()
+    # no máximo alguns lotes por processo em voo: memória limitada para milhões de seeds
+    max_pending = workers * 4
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for shard in shards(seeds, shard_size):
+                pending.add(pool.submit(run_shard, shard, policy, max_moves,
+                                        solver_nodes, solver_time, catalog, suits))
+                if len(pending) >= max_pending:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    _collect(finished, writer, counts)
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                _collect(finished, writer, counts)
+    finally:
+        writer.close()
+    return counts
+
+
+def _collect(futures, writer: ResultWriter, counts: Dict[str, int]) -> None:
+    for fut in futures:
+        rows = fut.result()
+        writer.write(rows)
+        for row in rows:
+            counts[row["outcome"]] = counts.get(row["outcome"], 0) + 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Partidas em lote do Spider (headless).")
+    parser.add_argument("--seeds", default="0:1000", help='intervalo "A:B" (B exclusivo)')
+    parser.add_argument("--policy", choices=POLICY_NAMES, default="greedy")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--shard-size", type=int, default=64)
+    parser.add_argument("--max-moves", type=int, default=2000)
+    parser.add_argument("--out", default="resultados.jsonl", help=".jsonl ou .csv")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--resume", action="store_true",
+                      help="continua o arquivo de saída, pulando as seeds já gravadas")
+    mode.add_argument("--overwrite", action="store_true", help="substitui o arquivo de saída")
+    parser.add_argument("--solver-nodes", type=int, default=200_000)
+    parser.add_argument("--solver-time", type=float, default=10.0)
+    parser.add_argument("--catalog", default=None,
+                        help="catálogo de distribuições (python -m spider.deals build)")
+    parser.add_argument("--suits", type=int, choices=sorted(VARIANTS), default=2,
+                        help="naipes do baralho (padrão 2)")
+    args = parser.parse_args()
+
+    exists = os.path.exists(args.out) and os.path.getsize(args.out) > 0
+    if exists and not (args.resume or args.overwrite):
+        parser.error(f"{args.out} já existe; use --resume para continuar ou --overwrite para substituir")
+    if args.resume and args.out.endswith(".csv") and exists:
+        try:
+            ResultWriter(args.out).close()   # confere as colunas antes de abrir os processos
+        except ValueError as e:
+            parser.error(str(e))
+    t0 = time.perf_counter()
+    counts = run_batch(parse_seed_range(args.seeds), args.out, args.policy,
+                       args.workers, args.shard_size, args.max_moves, args.resume,
+                       args.solver_nodes, args.solver_time, args.catalog, args.suits,
+                       args.overwrite)
+    elapsed = time.perf_counter() - t0
+    total = sum(counts.values())
+    won = counts.get(WON, 0)
+    rate = won / total if total else 0.0
+    print(f"{total} partidas em {elapsed:.1f}s ({total / max(elapsed, 1e-9):.1f}/s) "
+          f"| vitórias {won} ({rate:.1%}) | {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+"""
+Estado compacto do Spider (2 naipes) com make/unmake no próprio buffer.
+
+Mesmas regras de `Game.move` / `Game.deal` / `Game.undo`, mas:
+- Carta = inteiro pequeno: valor (bits 0-3) | naipe (bit 4) | face_up (bit 5).
+- Todo o estado fica em um único `bytearray` (menos de 1 KB):
+      [alturas das 10 colunas][sequência mononaipe do topo de cada coluna]
+      [tam. estoque][sequências removidas]
+      [estoque (50)][10 colunas x COL_CAP]
+- `make` / `deal` / `unmake` alteram o buffer no lugar e registram 6 bytes de
+  histórico; nenhum objeto (listas, cartas, sequências) é criado por jogada.
+- O tamanho da sequência mononaipe do topo de cada coluna é mantido no buffer,
+  então validar uma jogada e detectar K→A não exige percorrer a coluna.
+
+Conversão de/para `Game` com `CompactGame.from_game` e `CompactGame.to_game`.
+Só a variante de 2 naipes (`core.TWO_SUITS`) cabe no bit de naipe.
+
+Desempenho: a meta era ~10x `Game` em make+unmake; o medido fica em ~5-6x
+(`benchmarks/bench_compact.py`). Sem objetos por jogada o que sobra é o
+próprio interpretador: cada jogada ainda faz algumas dezenas de leituras e
+escritas indexadas no `bytearray`, cada uma uma operação de bytecode, e o
+`Game` já movia cartas com fatias de lista. Cópia de estado (snapshot do
+buffer x deepcopy) ganha três ordens de grandeza. Passar disso pede sair do
+laço por jogada em Python, como o `spider.vecsim` faz com NumPy.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple
+
+from .core import TWO_SUITS, Card, Game, Suit
+
+N_COLS = 10
+STOCK_CAP = 50
+# Maior coluna possível: até 5 cartas viradas para baixo por baixo de, no
+# máximo, 6 trechos descendentes (carta inicial + 5 distribuições) de até 13.
+COL_CAP = 5 + 6 * 13
+
+VALUE_MASK = 0x0F
+SUIT_BIT = 0x10
+FACE_UP = 0x20
+
+# Layout do buffer
+OFF_HEIGHTS = 0
+OFF_RUNS = OFF_HEIGHTS + N_COLS      # tamanho da sequência mononaipe no topo
+OFF_STOCK_N = OFF_RUNS + N_COLS
+OFF_REMOVED = OFF_STOCK_N + 1
+OFF_STOCK = OFF_REMOVED + 1
+OFF_COLS = OFF_STOCK + STOCK_CAP
+STATE_SIZE = OFF_COLS + N_COLS * COL_CAP
+
+# Flags do registro de histórico
+F_REVEAL_FROM = 0x01   # topo da origem foi virado
+F_REMOVED = 0x02       # destino completou K→A (naipe no bit SUIT_BIT)
+F_REVEAL_DEST = 0x04   # topo do destino foi virado após a remoção
+F_DEAL = 0x08
+# SUIT_BIT (0x10) reaproveitado para o naipe da sequência removida
+
+HIST_REC = 6           # origem, destino, quantidade, flags, runs anteriores (origem, destino)
+
+_SUIT_CODE = {Suit.S: 0, Suit.H: SUIT_BIT}
+_CODE_SUIT = {0: Suit.S, SUIT_BIT: Suit.H}
+
+
+def encode_card(card: Card) -> int:
+    return card.value | _SUIT_CODE[card.suit] | (FACE_UP if card.face_up else 0)
+
+
+class CompactGame:
+    """Estado do jogo em um `bytearray` de tamanho fixo (`STATE_SIZE` bytes)."""
+
+    __slots__ = ("buf", "hist", "hist_n")
+
+    def __init__(self) -> None:
+        self.buf = bytearray(STATE_SIZE)
+        self.hist = bytearray(HIST_REC * 256)
+        self.hist_n = 0
+
+    # ---------- conversão ----------
+    @classmethod
+    def from_game(cls, game: Game) -> "CompactGame":
+        """Copia a posição de `game` (o histórico de `game` não é convertido)."""
+        if game.variant.suits != TWO_SUITS.suits:
+            raise ValueError(f"estado compacto só representa 2 naipes (partida de {game.variant.name})")
+        st = cls()
+        buf = st.buf
+        for ci, col in enumerate(game.columns):
+            if len(col.cards) > COL_CAP:
+                raise ValueError(f"coluna {ci} excede {COL_CAP} cartas")
+            base = OFF_COLS + ci * COL_CAP
+            for k, card in enumerate(col.cards):
+                buf[base + k] = encode_card(card)
+            buf[OFF_HEIGHTS + ci] = len(col.cards)
+        for k, card in enumerate(game.stock.cards):
+            buf[OFF_STOCK + k] = encode_card(card)
+        buf[OFF_STOCK_N] = len(game.stock.cards)
+        buf[OFF_REMOVED] = game.removed_sequences
+        for ci in range(N_COLS):
+            buf[OFF_RUNS + ci] = st._scan_run(ci)
+        return st
+
+    def to_game(self, seed: Optional[int] = None) -> Game:
+        """Cria um `Game` com a mesma posição (histórico vazio).
+
+        As cartas são as do baralho do próprio `Game` (cópias na ordem de
+        `Deck.create`), então `deck` fica completo e na ordem de criação e
+        `snapshot()` / `Game.from_snapshot` continuam valendo para a posição.
+        """
+        game = Game(seed=seed)
+        copies: Dict[Tuple[str, int], List[Card]] = {}
+        for card in reversed(game.deck):
+            copies.setdefault((card.suit, card.value), []).append(card)
+
+        def make_card(code: int) -> Card:
+            suit = _CODE_SUIT[code & SUIT_BIT]
+            value = code & VALUE_MASK
+            free = copies.get((suit, value))
+            if not free:
+                raise ValueError(f"mais cópias de {value}{suit} do que o baralho tem")
+            card = free.pop()
+            card.face_up = bool(code & FACE_UP)
+            return card
+
+        buf = self.buf
+        for ci, col in enumerate(game.columns):
+            base = OFF_COLS + ci * COL_CAP
+            col.cards = [make_card(buf[base + k]) for k in range(buf[OFF_HEIGHTS + ci])]
+            col.reindex()
+        game.stock.cards = [make_card(buf[OFF_STOCK + k]) for k in range(buf[OFF_STOCK_N])]
+        game.removed_sequences = buf[OFF_REMOVED]
+        game.removed_runs = []
+        game.historico.clear()
+        game.reindex()
+        return game
+
+    def snapshot(self) -> bytes:
+        return bytes(self.buf)
+
+    def restore(self, snap: bytes) -> None:
+        self.buf[:] = snap
+        self.hist_n = 0
+
+    # ---------- consultas ----------
+    @property
+    def removed_sequences(self) -> int:
+        return self.buf[OFF_REMOVED]
+
+    def height(self, ci: int) -> int:
+        return self.buf[OFF_HEIGHTS + ci]
+
+    def stock_count(self) -> int:
+        return self.buf[OFF_STOCK_N]
+
+    def card(self, ci: int, idx: int) -> int:
+        return self.buf[OFF_COLS + ci * COL_CAP + idx]
+
+    def run_start(self, ci: int) -> int:
+        """Índice da base da maior sequência movível no topo (altura se vazia)."""
+        return self.buf[OFF_HEIGHTS + ci] - self.buf[OFF_RUNS + ci]
+
+    def legal_moves(self, out: List[int]) -> List[int]:
+        """Preenche `out` com jogadas codificadas por `pack_move` (deal = -1)."""
+        out.clear()
+        buf = self.buf
+        tops = [0] * N_COLS
+        first_empty = -1
+        for j in range(N_COLS):
+            h = buf[OFF_HEIGHTS + j]
+            if h:
+                tops[j] = buf[OFF_COLS + j * COL_CAP + h - 1] & VALUE_MASK
+            elif first_empty < 0:
+                first_empty = j
+        for i in range(N_COLS):
+            h = buf[OFF_HEIGHTS + i]
+            base = OFF_COLS + i * COL_CAP
+            for idx in range(self.run_start(i), h):
+                v = buf[base + idx] & VALUE_MASK
+                for j in range(N_COLS):
+                    if j == i:
+                        continue
+                    t = tops[j]
+                    if t == 0:
+                        if j == first_empty and idx > 0:
+                            out.append(i | (idx << 4) | (j << 11))
+                    elif t == v + 1:
+                        out.append(i | (idx << 4) | (j << 11))
+        if first_empty < 0 and buf[OFF_STOCK_N] >= N_COLS:
+            out.append(-1)
+        return out
+
+    # ---------- make / unmake ----------
+    def _scan_run(self, ci: int) -> int:
+        """Recalcula o tamanho da sequência mononaipe no topo da coluna."""
+        buf = self.buf
+        h = buf[OFF_HEIGHTS + ci]
+        base = OFF_COLS + ci * COL_CAP
+        p = base + h - 1
+        if h == 0 or not buf[p] & FACE_UP:
+            return 0
+        while p > base and buf[p - 1] == buf[p] + 1:
+            p -= 1
+        return base + h - p
+
+    def _push_hist(self, a: int, b: int, n: int, flags: int, ra: int, rb: int) -> None:
+        hist = self.hist
+        k = self.hist_n
+        if k + HIST_REC > len(hist):
+            hist.extend(bytes(len(hist)))  # dobra a capacidade (amortizado)
+        hist[k] = a
+        hist[k + 1] = b
+        hist[k + 2] = n
+        hist[k + 3] = flags
+        hist[k + 4] = ra
+        hist[k + 5] = rb
+        self.hist_n = k + HIST_REC
+
+    def make(self, i: int, idx: int, j: int,
+             _H=OFF_HEIGHTS, _R=OFF_RUNS, _C=OFF_COLS, _CAP=COL_CAP,
+             _UP=FACE_UP, _V=VALUE_MASK) -> bool:
+        """Equivalente a `Game.move(i, idx, j)`."""
+        if i == j:
+            return False
+        buf = self.buf
+        hi = buf[_H + i]
+        n = hi - idx
+        # movível: cartas de idx até o topo dentro da sequência mononaipe do topo
+        if idx < 0 or n <= 0 or n > buf[_R + i]:
+            return False
+        src = _C + i * _CAP
+        stop = src + idx
+        base = buf[stop]
+
+        hj = buf[_H + j]
+        dst = _C + j * _CAP
+        run_i = buf[_R + i]
+        run_j = buf[_R + j]
+        if hj:
+            top = buf[dst + hj - 1]
+            if (top & _V) != (base & _V) + 1:
+                return False
+            new_run_j = run_j + n if top == base + 1 else n
+        else:
+            new_run_j = n
+        if hj + n > _CAP:
+            return False
+
+        # Efetivar movimento
+        if n == 1:
+            buf[dst + hj] = base
+        else:
+            buf[dst + hj:dst + hj + n] = buf[stop:stop + n]
+        hj += n
+        hi = idx
+        flags = 0
+        if run_i > n:
+            buf[_R + i] = run_i - n
+        elif hi:
+            if not buf[src + hi - 1] & _UP:
+                buf[src + hi - 1] |= _UP
+                flags = F_REVEAL_FROM
+                buf[_R + i] = 1
+            else:
+                buf[_H + i] = hi
+                buf[_R + i] = self._scan_run(i)
+        else:
+            buf[_R + i] = 0
+
+        # Sequência completa K→A mononaipe no destino?
+        if new_run_j >= 13 and buf[dst + hj - 1] & _V == 1:
+            flags |= F_REMOVED | (buf[dst + hj - 1] & SUIT_BIT)
+            hj -= 13
+            buf[OFF_REMOVED] += 1
+            new_run_j -= 13
+            if hj and not new_run_j:
+                if not buf[dst + hj - 1] & _UP:
+                    buf[dst + hj - 1] |= _UP
+                    flags |= F_REVEAL_DEST
+                buf[_H + j] = hj
+                new_run_j = self._scan_run(j)
+
+        buf[_H + i] = hi
+        buf[_H + j] = hj
+        buf[_R + j] = new_run_j
+
+        # Registro de histórico (equivalente a _push_hist, sem a chamada extra)
+        hist = self.hist
+        k = self.hist_n
+        if k + HIST_REC > len(hist):
+            hist.extend(bytes(len(hist)))
+        hist[k] = i
+        hist[k + 1] = j
+        hist[k + 2] = n
+        hist[k + 3] = flags
+        hist[k + 4] = run_i
+        hist[k + 5] = run_j
+        self.hist_n = k + HIST_REC
+        return True
+
+    def deal(self) -> bool:
+        """Equivalente a `Game.deal()`."""
+        buf = self.buf
+        sn = buf[OFF_STOCK_N]
+        if sn < N_COLS:
+            return False
+        for ci in range(N_COLS):
+            h = buf[OFF_HEIGHTS + ci]
+            if not h or h >= COL_CAP:
+                return False
+        for ci in range(N_COLS):
+            sn -= 1
+            h = buf[OFF_HEIGHTS + ci]
+            p = OFF_COLS + ci * COL_CAP + h
+            card = buf[OFF_STOCK + sn] | FACE_UP
+            buf[p] = card
+            buf[OFF_HEIGHTS + ci] = h + 1
+            if buf[p - 1] == card + 1:
+                buf[OFF_RUNS + ci] += 1
+            else:
+                buf[OFF_RUNS + ci] = 1
+        buf[OFF_STOCK_N] = sn
+        self._push_hist(0, 0, N_COLS, F_DEAL, 0, 0)
+        return True
+
+    def unmake(self, _H=OFF_HEIGHTS, _R=OFF_RUNS, _C=OFF_COLS, _CAP=COL_CAP,
+               _UP=FACE_UP) -> bool:
+        """Equivalente a `Game.undo()`."""
+        k = self.hist_n
+        if k == 0:
+            return False
+        k -= HIST_REC
+        self.hist_n = k
+        hist = self.hist
+        buf = self.buf
+        flags = hist[k + 3]
+
+        if flags & F_DEAL:
+            sn = buf[OFF_STOCK_N]
+            for ci in range(N_COLS - 1, -1, -1):
+                h = buf[_H + ci] - 1
+                buf[OFF_STOCK + sn] = buf[_C + ci * _CAP + h] & ~_UP
+                buf[_H + ci] = h
+                buf[_R + ci] = self._scan_run(ci)
+                sn += 1
+            buf[OFF_STOCK_N] = sn
+            return True
+
+        i = hist[k]
+        j = hist[k + 1]
+        n = hist[k + 2]
+        src = _C + i * _CAP
+        dst = _C + j * _CAP
+        hi = buf[_H + i]
+        hj = buf[_H + j]
+
+        if flags & F_REVEAL_DEST:
+            buf[dst + hj - 1] &= ~_UP
+        if flags & F_REMOVED:
+            suit = flags & SUIT_BIT
+            for v in range(13, 0, -1):
+                buf[dst + hj] = v | suit | _UP
+                hj += 1
+            buf[OFF_REMOVED] -= 1
+        if flags & F_REVEAL_FROM:
+            buf[src + hi - 1] &= ~_UP
+
+        hj -= n
+        if n == 1:
+            buf[src + hi] = buf[dst + hj]
+        else:
+            buf[src + hi:src + hi + n] = buf[dst + hj:dst + hj + n]
+        buf[_H + i] = hi + n
+        buf[_H + j] = hj
+        buf[_R + i] = hist[k + 4]
+        buf[_R + j] = hist[k + 5]
+        return True
+
+    def apply(self, mv: int) -> bool:
+        """Aplica uma jogada codificada por `pack_move` (ou -1 para deal)."""
+        if mv < 0:
+            return self.deal()
+        return self.make(mv & 0xF, (mv >> 4) & 0x7F, mv >> 11)
+
+
+def pack_move(i: int, idx: int, j: int) -> int:
+    return i | (idx << 4) | (j << 11)
+
+
+def unpack_move(mv: int):
+    return mv & 0xF, (mv >> 4) & 0x7F, mv >> 11
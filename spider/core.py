@@ -0,0 +1,905 @@
+"""
+Núcleo do Spider: modelo do jogo sem dependência do Arcade.
+
+Pode ser importado em processos headless (solver, lote, servidores) sem
+carregar pyglet/OpenGL e sem precisar de display.
+
+Variantes (`Variant`, `VARIANTS`): 1, 2 (padrão) ou 4 naipes, sempre com 104
+cartas em 10 colunas. A variante define a composição do baralho, a
+distribuição inicial e quantas sequências K→A vencem a partida.
+"""
+
+from __future__ import annotations
+import random
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# =========================
+# Núcleo do jogo (modelo)
+# =========================
+
+class Suit:
+    S = "S"  # espadas
+    H = "H"  # copas
+    D = "D"  # ouros
+    C = "C"  # paus
+
+SUIT_LABEL = {Suit.S: "♠", Suit.H: "♥", Suit.D: "♦", Suit.C: "♣"}
+# Naipe em 2 bits (ver `Card.key`)
+SUIT_INDEX = {Suit.S: 0, Suit.H: 1, Suit.D: 2, Suit.C: 3}
+
+@dataclass
+class Card:
+    value: int          # 1=A ... 13=K
+    suit: str           # "S" | "H" | "D" | "C"
+    face_up: bool = False
+    id: str = ""
+    # naipe << 4 | valor: mesma chave = mesma carta (cópias). "Um abaixo e do
+    # mesmo naipe" vira uma comparação de inteiros: below.key == above.key + 1.
+    key: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.key = SUIT_INDEX[self.suit] << 4 | self.value
+
+    def label(self) -> str:
+        faces = {1: "A", 11: "J", 12: "Q", 13: "K"}
+        v = faces.get(self.value, str(self.value))
+        return f"{v}{SUIT_LABEL[self.suit]}"
+
+    def one_below(self, other: "Card") -> bool:
+        return self.value == other.value - 1
+
+@dataclass
+class Sequence:
+    cards: List[Card]
+    # Resultado já conhecido de is_desc_same_suit (ex.: vindo do índice da Column)
+    _desc_same_suit: Optional[bool] = field(default=None, repr=False, compare=False)
+
+    def is_desc_same_suit(self) -> bool:
+        if self._desc_same_suit is not None:
+            return self._desc_same_suit
+        cards = self.cards
+        for i in range(1, len(cards)):
+            if cards[i].key != cards[i - 1].key - 1:
+                return False
+        return True
+
+    def top(self) -> Card:
+        return self.cards[-1]
+
+    def base(self) -> Card:
+        return self.cards[0]
+
+    def size(self) -> int:
+        return len(self.cards)
+
+@dataclass
+class Move:
+    """Entrada do histórico decodificada (para inspeção; não guarda cartas)."""
+    origem_col: int
+    destino_col: int
+    qtd_cartas: int
+    tipo: str = "move"  # "move" ou "deal"
+    revelou_origem: bool = False
+    removeu_sequencia: bool = False
+    revelou_destino: bool = False
+
+# =========================
+# Histórico compacto
+# =========================
+
+# Cada jogada ocupa 16 bits:
+#   bits 0-3 coluna de origem | 4-7 coluna de destino | 8-11 quantidade de cartas
+#   bit 12 revelou o topo da origem | bit 13 removeu K→A no destino
+#   bit 14 revelou o topo do destino (após a remoção)
+# A distribuição do estoque é o código DEAL_CODE. As cartas das sequências
+# removidas ficam em `Game.removed_runs`, não no histórico.
+DEAL_CODE = 0xFFFF
+_REV_ORIGEM = 1 << 12
+_REMOVED = 1 << 13
+_REV_DESTINO = 1 << 14
+
+def decode_move(code: int) -> Move:
+    if code == DEAL_CODE:
+        return Move(-1, -1, 10, tipo="deal")
+    return Move(code & 0xF, (code >> 4) & 0xF, (code >> 8) & 0xF,
+                revelou_origem=bool(code & _REV_ORIGEM),
+                removeu_sequencia=bool(code & _REMOVED),
+                revelou_destino=bool(code & _REV_DESTINO))
+
+class History:
+    """Histórico de jogadas com undo/redo e checkpoints opcionais.
+
+    - `codes`: um código de 16 bits por jogada (`array('H')`, 2 bytes cada).
+    - `pos`: cursor; `codes[:pos]` pode ser desfeito e `codes[pos:]` refeito.
+    - `checkpoints`: a cada `checkpoint_every` jogadas (0 = desligado), um
+      instantâneo da posição (`Game.snapshot()`) para saltos longos em `Game.goto`.
+    - `cuts`: quantas vezes `codes` foi cortado (`truncate`/`clear`); quem
+      acompanha o histórico (ex.: `SessionWriter`) só precisa comparar códigos
+      já vistos quando esse número muda.
+    """
+
+    __slots__ = ("codes", "pos", "checkpoint_every", "checkpoints", "cuts")
+
+    def __init__(self, checkpoint_every: int = 0) -> None:
+        self.codes = array("H")
+        self.pos = 0
+        self.checkpoint_every = checkpoint_every
+        self.checkpoints: Dict[int, bytes] = {}
+        self.cuts = 0
+
+    def __len__(self) -> int:
+        return self.pos
+
+    def clear(self) -> None:
+        del self.codes[:]
+        self.pos = 0
+        self.checkpoints.clear()
+        self.cuts += 1
+
+    def can_undo(self) -> bool:
+        return self.pos > 0
+
+    def can_redo(self) -> bool:
+        return self.pos < len(self.codes)
+
+    def truncate(self) -> None:
+        """Descarta as jogadas à frente do cursor (nova jogada após undo)."""
+        del self.codes[self.pos:]
+        self.cuts += 1
+        if self.checkpoints:
+            for k in [k for k in self.checkpoints if k > self.pos]:
+                del self.checkpoints[k]
+
+    def checkpoint_before(self, n: int) -> Optional[int]:
+        """Maior posição com checkpoint que seja <= n."""
+        every = self.checkpoint_every
+        if not every:
+            return None
+        k = (n // every) * every
+        while k >= 0 and k not in self.checkpoints:
+            k -= every
+        return k if k >= 0 else None
+
+    def moves(self) -> List[Move]:
+        """Jogadas até o cursor, decodificadas."""
+        return [decode_move(c) for c in self.codes[:self.pos]]
+
+    def nbytes(self) -> int:
+        """Memória dos dados do histórico (códigos + checkpoints)."""
+        return (self.codes.itemsize * len(self.codes)
+                + sum(len(s) for s in self.checkpoints.values()))
+
+# =========================
+# Hash de Zobrist
+# =========================
+
+# Uma chave de 64 bits por (coluna, linha, carta, face_up) e uma por tamanho do
+# estoque. A carta entra só por `Card.key` (valor e naipe): cópias como S5-0 e
+# S5-x0 têm a mesma chave, então posições que só trocam cópias colidem de
+# propósito. A chave da coluna c é a chave de (linha, carta) rotacionada 7*c
+# bits; como a rotação preserva o xor, o hash de uma coluna desrotacionado não
+# depende da posição dela na mesa (ver `Column.shape_hash`).
+N_COLS = 10
+ZOBRIST_ROWS = 104
+_Z_CODES = 128  # key (6 bits: 4 naipes x 16) x face_up; valores 0, 14 e 15 não usados
+_Z_ROT = 7
+_MASK64 = (1 << 64) - 1
+
+def _rotl64(x: int, r: int) -> int:
+    r &= 63
+    return ((x << r) | (x >> (64 - r))) & _MASK64 if r else x
+
+def _rotl64_lanes(data: bytes, r: int) -> bytes:
+    """Rotaciona `r` bits cada inteiro de 64 bits (ordem nativa, a de `array`) de `data`.
+
+    Todas as chaves de uma vez, como um único inteiro grande com máscaras por
+    faixa: a tabela de 4 naipes é grande demais para rotacionar item a item no
+    import.
+    """
+    lanes = len(data) // 8
+    order = sys.byteorder
+    x = int.from_bytes(data, order)
+    hi = int.from_bytes(((_MASK64 << r) & _MASK64).to_bytes(8, order) * lanes, order)
+    lo = int.from_bytes(((1 << r) - 1).to_bytes(8, order) * lanes, order)
+    return (((x << r) & hi) | ((x >> (64 - r)) & lo)).to_bytes(len(data), order)
+
+_zrng = random.Random(0x5350_4944_4552)
+_z_base = _zrng.randbytes(8 * ZOBRIST_ROWS * _Z_CODES)
+_Z_CELL = array("Q", _z_base)
+for _r in range(_Z_ROT, _Z_ROT * N_COLS, _Z_ROT):
+    _Z_CELL.frombytes(_rotl64_lanes(_z_base, _r))
+_Z_STOCK = array("Q")
+_Z_STOCK.frombytes(_zrng.randbytes(8 * (ZOBRIST_ROWS + 1)))
+del _zrng, _z_base, _r
+
+def zobrist_code(card: Card) -> int:
+    """Índice da carta na tabela de Zobrist (0..127)."""
+    return card.key << 1 | card.face_up
+
+def _zfold(h: int, cards: List[Card], start: int, stop: int, base: int) -> int:
+    """`h` xor as chaves de cards[start:stop] (linha = índice na coluna)."""
+    z = _Z_CELL
+    for row in range(start, stop):
+        c = cards[row]
+        h ^= z[(base + row) << 7 | c.key << 1 | c.face_up]
+    return h
+
+class Column:
+    """Pilha de cartas com índice incremental do topo.
+
+    - `_down`: quantas cartas viradas para baixo há na base da coluna.
+    - `_run`: tamanho da sequência decrescente mononaipe (face up) no topo.
+    - `_hash`: xor das chaves de Zobrist das cartas da coluna.
+
+    O índice é mantido por push/push_seq/pop/pop_n/reveal_top_if_needed/hide_top.
+    Quem alterar `cards` diretamente deve chamar `reindex()`.
+    """
+
+    def __init__(self, index: int = 0) -> None:
+        self.cards: List[Card] = []
+        self._down = 0
+        self._run = 0
+        self._hash = 0
+        # primeira linha desta coluna na tabela de Zobrist
+        self._zbase = index * ZOBRIST_ROWS
+        self._zrot = _Z_ROT * index
+
+    def reindex(self) -> None:
+        """Recalcula o índice percorrendo a coluna."""
+        cards = self.cards
+        down = 0
+        while down < len(cards) and not cards[down].face_up:
+            down += 1
+        self._down = down
+        self._run = self._scan_run()
+        self._hash = _zfold(0, cards, 0, len(cards), self._zbase)
+
+    def shape_hash(self) -> int:
+        """Hash das cartas da coluna independente de qual coluna ela é (O(1))."""
+        return _rotl64(self._hash, -self._zrot)
+
+    def _zkey(self, row: int, card: Card) -> int:
+        return _Z_CELL[(self._zbase + row) * _Z_CODES + zobrist_code(card)]
+
+    def _scan_run(self) -> int:
+        cards = self.cards
+        n = len(cards)
+        if n == 0 or not cards[-1].face_up:
+            return 0
+        k = 1
+        while k < n:
+            below, above = cards[n - k - 1], cards[n - k]
+            if not below.face_up or below.key != above.key + 1:
+                break
+            k += 1
+        return k
+
+    def push(self, card: Card) -> None:
+        cards = self.cards
+        self._hash ^= self._zkey(len(cards), card)
+        if not card.face_up:
+            if len(cards) == self._down:
+                self._down += 1
+                cards.append(card)
+            else:
+                cards.append(card)
+                self.reindex()
+            return
+        if self._run and cards[-1].key == card.key + 1:
+            self._run += 1
+        else:
+            self._run = 1
+        cards.append(card)
+
+    def push_seq(self, seq: Sequence) -> None:
+        if seq._desc_same_suit and seq.cards:
+            # sequência movível: já é decrescente, mononaipe e virada para cima
+            base = seq.cards[0]
+            cards = self.cards
+            if self._run and cards[-1].key == base.key + 1:
+                self._run += len(seq.cards)
+            else:
+                self._run = len(seq.cards)
+            start = len(cards)
+            cards.extend(seq.cards)
+            self._hash = _zfold(self._hash, cards, start, len(cards), self._zbase)
+            return
+        for card in seq.cards:
+            self.push(card)
+
+    def pop(self) -> Card:
+        return self.pop_n(1).cards[0]
+
+    def pop_n(self, n: int) -> Sequence:
+        cards = self.cards
+        self._hash = _zfold(self._hash, cards, len(cards) - n, len(cards), self._zbase)
+        seq = cards[-n:]
+        del cards[-n:]
+        if n < self._run:
+            self._run -= n
+            known = True
+        else:
+            known = n == self._run
+            if self._down > len(self.cards):
+                self._down = len(self.cards)
+            self._run = self._scan_run()
+        return Sequence(seq, _desc_same_suit=known or None)
+
+    def top(self) -> Optional[Card]:
+        return self.cards[-1] if self.cards else None
+
+    def empty(self) -> bool:
+        return not self.cards
+
+    def run_length(self) -> int:
+        """Tamanho da sequência mononaipe movível no topo (O(1))."""
+        return self._run
+
+    def face_down_count(self) -> int:
+        return self._down
+
+    def has_complete_run(self) -> bool:
+        """Topo forma K→A mononaipe (O(1))."""
+        return self._run >= 13 and self.cards[-1].value == 1
+
+    def reveal_top_if_needed(self) -> None:
+        if self.cards and not self.cards[-1].face_up:
+            row, card = len(self.cards) - 1, self.cards[-1]
+            self._hash ^= self._zkey(row, card)
+            card.face_up = True
+            self._hash ^= self._zkey(row, card)
+            self._down = row
+            self._run = 1
+
+    def hide_top(self) -> None:
+        """Desvira o topo (undo de uma revelação)."""
+        if self.cards and self.cards[-1].face_up:
+            row, card = len(self.cards) - 1, self.cards[-1]
+            self._hash ^= self._zkey(row, card)
+            card.face_up = False
+            self._hash ^= self._zkey(row, card)
+            self._down = len(self.cards)
+            self._run = 0
+
+    def movable_subsequence_from(self, idx: int) -> Optional[Sequence]:
+        n = len(self.cards)
+        if idx < 0 or idx >= n or n - idx > self._run:
+            return None
+        return Sequence(self.cards[idx:], _desc_same_suit=True)
+
+class Stock:
+    def __init__(self) -> None:
+        self.cards: List[Card] = []
+
+    def available(self) -> bool:
+        return len(self.cards) >= 10
+
+# =========================
+# Variantes
+# =========================
+
+N_CARDS = 104
+
+@dataclass(frozen=True)
+class Variant:
+    """Variante do jogo: naipes do baralho e distribuição inicial.
+
+    As 104 cartas são `copies` cópias de cada carta de `suits`. `deal_counts`
+    é quantas cartas cada coluna recebe no início (a última de cada coluna
+    virada para cima); o resto vai para o estoque, em distribuições de 10.
+    A partida é vencida ao remover `sequences` sequências K→A.
+    """
+    name: str
+    suits: Tuple[str, ...]
+    deal_counts: Tuple[int, ...] = (6,) * 4 + (5,) * 6
+
+    def __post_init__(self) -> None:
+        if not self.suits or N_CARDS % (13 * len(self.suits)):
+            raise ValueError(f"{self.name}: {N_CARDS} cartas não se dividem entre {len(self.suits)} naipes")
+        if len(self.deal_counts) != N_COLS or min(self.deal_counts) < 1:
+            raise ValueError(f"{self.name}: a distribuição precisa de {N_COLS} colunas não vazias")
+        if (N_CARDS - sum(self.deal_counts)) % N_COLS:
+            raise ValueError(f"{self.name}: o estoque precisa ter um múltiplo de {N_COLS} cartas")
+
+    @property
+    def copies(self) -> int:
+        return N_CARDS // (13 * len(self.suits))
+
+    @property
+    def sequences(self) -> int:
+        return N_CARDS // 13
+
+ONE_SUIT = Variant("1 naipe", (Suit.S,))
+TWO_SUITS = Variant("2 naipes", (Suit.S, Suit.H))
+FOUR_SUITS = Variant("4 naipes", (Suit.S, Suit.H, Suit.D, Suit.C))
+# por número de naipes (`--suits` das ferramentas)
+VARIANTS: Dict[int, Variant] = {len(v.suits): v for v in (ONE_SUIT, TWO_SUITS, FOUR_SUITS)}
+
+def _two_suits_double_deck_spec() -> List[Tuple[int, str, str]]:
+    spec: List[Tuple[int, str, str]] = []
+    for deck_i in range(2):
+        for suit in (Suit.S, Suit.H):
+            for v in range(1, 14):
+                spec.append((v, suit, f"{suit}{v}-{deck_i}"))
+        # duplicar S e H para completar 104 cartas
+        for suit in (Suit.S, Suit.H):
+            for v in range(1, 14):
+                spec.append((v, suit, f"{suit}{v}-x{deck_i}"))
+    assert len(spec) == 104
+    return spec
+
+def _deck_spec(variant: Variant) -> List[Tuple[int, str, str]]:
+    if variant.suits == TWO_SUITS.suits:
+        # ordem e ids históricos (replays, catálogos e instantâneos já gravados)
+        return _two_suits_double_deck_spec()
+    return [(v, suit, f"{suit}{v}-{k}")
+            for k in range(variant.copies) for suit in variant.suits for v in range(1, 14)]
+
+class Deck:
+    # (valor, naipe, id) na ordem canônica; calculado uma vez por variante
+    _SPEC = _two_suits_double_deck_spec()
+    _SPECS: Dict[Variant, List[Tuple[int, str, str]]] = {TWO_SUITS: _SPEC}
+    _IDS: Dict[Variant, List[str]] = {}
+
+    IDS = [cid for _, _, cid in _SPEC]
+
+    @staticmethod
+    def spec(variant: Variant = TWO_SUITS) -> List[Tuple[int, str, str]]:
+        spec = Deck._SPECS.get(variant)
+        if spec is None:
+            spec = Deck._SPECS[variant] = _deck_spec(variant)
+        return spec
+
+    @staticmethod
+    def ids(variant: Variant = TWO_SUITS) -> List[str]:
+        ids = Deck._IDS.get(variant)
+        if ids is None:
+            ids = Deck._IDS[variant] = [cid for _, _, cid in Deck.spec(variant)]
+        return ids
+
+    @staticmethod
+    def create(variant: Variant = TWO_SUITS) -> List[Card]:
+        return [Card(v, suit, False, cid) for v, suit, cid in Deck.spec(variant)]
+
+    @staticmethod
+    def create_two_suits_double_deck() -> List[Card]:
+        return Deck.create(TWO_SUITS)
+
+# Instantâneo de posição (checkpoints): um byte por carta com o índice da carta
+# em `Game.deck` e o bit FACE_UP.
+_SNAP_FACE_UP = 0x80
+
+_ZERO_COUNTS = (0,) * 15
+
+# Seeds válidas: 0 <= seed < MAX_SEED (cabem no u64 do arquivo de sessão e no
+# INTEGER com sinal do banco de estatísticas)
+MAX_SEED = 1 << 63
+
+
+def _check_seed(seed: Optional[int]) -> int:
+    """A seed informada (validada) ou uma sorteada."""
+    if seed is None:
+        return random.randrange(MAX_SEED)
+    if not isinstance(seed, int) or isinstance(seed, bool) or not 0 <= seed < MAX_SEED:
+        raise ValueError(f"seed fora do intervalo [0, 2**63): {seed!r}")
+    return seed
+
+class Game:
+    def __init__(self, seed: Optional[int] = None, checkpoint_every: int = 0,
+                 deal: Optional[bytes] = None, variant: Variant = TWO_SUITS) -> None:
+        """`deal`: permutação já calculada para a seed (ex.: `DealCatalog.deal`)."""
+        # A seed é sempre conhecida (sorteada se não informada) para que a
+        # partida possa ser salva e reproduzida.
+        self.seed = _check_seed(seed)
+        self.variant = variant
+        # Todas as cartas da partida, na ordem canônica de `Deck` (índice usado
+        # por `deal_order` e pelos instantâneos); reaproveitadas em `reset`.
+        self.deck: List[Card] = Deck.create(variant)
+        self.columns: List[Column] = [Column(ci) for ci in range(N_COLS)]
+        self.stock = Stock()
+        self.removed_sequences = 0
+        # Cartas das sequências K→A removidas (para desfazer a remoção)
+        self.removed_runs: List[List[Card]] = []
+        self.historico = History(checkpoint_every)
+        # Contagem incremental de jogadas (ver `legal_move_count`): por valor, quantos
+        # topos de coluna há e quantas colunas aceitariam mover para um topo desse
+        # valor (índices até 14: o destino de uma sequência com topo K)
+        self._top_count = [0] * 15
+        self._cover = [0] * 15
+        self._n_moves = 0
+        self._n_empty = 0
+        self._empty_src = 0
+        # Incrementado a cada move/deal/undo/reset bem-sucedido (a view compara
+        # com a última versão vista para saber se precisa redesenhar a mesa).
+        self.version = 0
+        self._start(deal)
+        if checkpoint_every:
+            self.historico.checkpoints[0] = self.snapshot()
+
+    def _start(self, deal: Optional[bytes] = None) -> None:
+        """Distribui a partida da seed usando as cartas, colunas e estoque existentes."""
+        deck = self.deck
+        if [c.id for c in deck] != Deck.ids(self.variant):
+            # baralho trocado/reordenado (ex.: `CompactGame.to_game`) ou de outra
+            # variante: os índices de `deal` e dos instantâneos pressupõem a
+            # ordem canônica da variante
+            deck = self.deck = Deck.create(self.variant)
+        else:
+            for card in deck:
+                card.face_up = False
+        # Embaralhamento portável (spider.deals): mesma seed, mesma distribuição.
+        # Import local: `python -m spider.deals` não deve encontrar o módulo já carregado.
+        if deal is None:
+            from .deals import deal_order
+            deal = deal_order(self.seed)
+
+        idx = 0
+        for col_i, count in enumerate(self.variant.deal_counts):
+            col = self.columns[col_i]
+            col.cards[:] = [deck[i] for i in deal[idx:idx + count]]
+            col.cards[-1].face_up = True
+            col.reindex()
+            idx += count
+
+        self.stock.cards[:] = [deck[i] for i in deal[idx:]]
+        self.reindex()
+
+    @property
+    def zobrist(self) -> int:
+        """Hash de 64 bits da posição (colunas, faces e tamanho do estoque).
+
+        Mantido de forma incremental pelas colunas; cópias da mesma carta têm
+        a mesma chave. Não distingue `removed_sequences` (já implícito no
+        número de cartas na mesa e no estoque).
+        """
+        h = _Z_STOCK[len(self.stock.cards)]
+        for col in self.columns:
+            h ^= col._hash
+        return h
+
+    # ---------- contagem de jogadas ----------
+    def reindex(self) -> None:
+        """Recalcula a contagem de jogadas (após alterar colunas diretamente)."""
+        self._top_count[:] = _ZERO_COUNTS
+        self._cover[:] = _ZERO_COUNTS
+        self._n_moves = self._n_empty = self._empty_src = 0
+        for col in self.columns:
+            self._tally(col, 1)
+
+    def _tally(self, col: Column, s: int) -> None:
+        """Soma (s=1) ou retira (s=-1) a contribuição da coluna na contagem.
+
+        Chamado antes e depois de cada alteração de coluna; custa O(run).
+        """
+        cards = col.cards
+        if not cards:
+            self._n_empty += s
+            return
+        t = cards[-1].value
+        r = col._run
+        top_count, cover = self._top_count, self._cover
+        n = 0
+        if s > 0:
+            for v in range(t + 1, t + r + 1):   # destinos possíveis da sequência do topo
+                cover[v] += 1
+                n += top_count[v]
+            n += cover[t]                       # colunas que podem mover para esta
+            top_count[t] += 1
+        else:
+            top_count[t] -= 1
+            n += cover[t]
+            for v in range(t + 1, t + r + 1):
+                cover[v] -= 1
+                n += top_count[v]
+        self._n_moves += s * n
+        # para coluna vazia: cada carta da sequência do topo, menos a coluna inteira
+        self._empty_src += s * (r - (r == len(cards)))
+
+    def legal_move_count(self) -> int:
+        """Número de movimentos de `solver.legal_moves` (sem a distribuição), em O(1)."""
+        return self._n_moves + (self._empty_src if self._n_empty else 0)
+
+    def can_deal(self) -> bool:
+        return not self._n_empty and self.stock.available()
+
+    def is_won(self) -> bool:
+        """Todas as sequências K→A da variante removidas."""
+        return self.removed_sequences >= self.variant.sequences
+
+    def is_lost(self) -> bool:
+        """Sem movimentos e sem distribuição possível (partida não vencida)."""
+        return (not self.is_won() and not self.can_deal()
+                and self.legal_move_count() == 0)
+
+    def can_receive(self, dest: Column, seq: Sequence) -> bool:
+        cards = dest.cards
+        if not cards:
+            return True
+        # o destino aceita qualquer naipe: só o valor importa
+        if seq.cards[0].value + 1 != cards[-1].value:
+            return False
+        return len(seq.cards) == 1 or seq.is_desc_same_suit()
+
+    # ---------- jogadas ----------
+    def _do_move(self, col_i: int, idx: int, col_j: int) -> int:
+        """Executa o movimento; retorna o código do histórico ou -1 se inválido."""
+        if col_i == col_j:
+            return -1
+
+        col_from = self.columns[col_i]
+        col_to = self.columns[col_j]
+
+        seq = col_from.movable_subsequence_from(idx)
+        if seq is None:
+            return -1
+        if not self.can_receive(col_to, seq):
+            return -1
+
+        # Efetivar movimento
+        self._tally(col_from, -1)
+        self._tally(col_to, -1)
+        n = len(seq.cards)
+        col_to.push_seq(col_from.pop_n(n))
+        code = col_i | col_j << 4 | n << 8
+
+        # Revelar topo da coluna de origem (se necessário)
+        if col_from.cards and not col_from.cards[-1].face_up:
+            col_from.reveal_top_if_needed()
+            code |= _REV_ORIGEM
+
+        # Verificar se gerou sequência completa no destino (K -> A mononaipe)
+        if col_to.has_complete_run():
+            self.removed_runs.append(col_to.pop_n(13).cards)
+            self.removed_sequences += 1
+            code |= _REMOVED
+            if col_to.cards and not col_to.cards[-1].face_up:
+                col_to.reveal_top_if_needed()
+                code |= _REV_DESTINO
+        self._tally(col_from, 1)
+        self._tally(col_to, 1)
+        return code
+
+    def _do_deal(self) -> bool:
+        if any(col.empty() for col in self.columns):
+            return False
+        if len(self.stock.cards) < 10:
+            return False
+        for col in self.columns:
+            self._tally(col, -1)
+            card = self.stock.cards.pop()
+            card.face_up = True
+            col.push(card)
+            self._tally(col, 1)
+        return True
+
+    def _undo_code(self, code: int) -> None:
+        if code == DEAL_CODE:
+            for col in reversed(self.columns):
+                self._tally(col, -1)
+                card = col.pop()
+                card.face_up = False
+                self.stock.cards.append(card)
+                self._tally(col, 1)
+            return
+
+        origem = self.columns[code & 0xF]
+        dest = self.columns[(code >> 4) & 0xF]
+        self._tally(origem, -1)
+        self._tally(dest, -1)
+        # Desvira o novo topo do destino (após remoção K→A) e restaura a sequência
+        if code & _REV_DESTINO:
+            dest.hide_top()
+        if code & _REMOVED:
+            dest.push_seq(Sequence(self.removed_runs.pop(), _desc_same_suit=True))
+            self.removed_sequences -= 1
+        # Desvira o topo revelado na origem e volta as cartas movidas
+        if code & _REV_ORIGEM:
+            origem.hide_top()
+        origem.push_seq(dest.pop_n((code >> 8) & 0xF))
+        self._tally(origem, 1)
+        self._tally(dest, 1)
+
+    def _redo_code(self, code: int) -> None:
+        if code == DEAL_CODE:
+            ok = self._do_deal()
+        else:
+            origem = code & 0xF
+            idx = len(self.columns[origem].cards) - ((code >> 8) & 0xF)
+            ok = self._do_move(origem, idx, (code >> 4) & 0xF) == code
+        if not ok:
+            raise RuntimeError(f"histórico inconsistente: código {code:#06x}")
+
+    def _record(self, code: int) -> None:
+        hist = self.historico
+        if hist.pos < len(hist.codes):
+            hist.truncate()
+        hist.codes.append(code)
+        hist.pos += 1
+        every = hist.checkpoint_every
+        if every and hist.pos % every == 0:
+            hist.checkpoints[hist.pos] = self.snapshot()
+        self.version += 1
+
+    def move(self, col_i: int, idx: int, col_j: int) -> bool:
+        code = self._do_move(col_i, idx, col_j)
+        if code < 0:
+            return False
+        self._record(code)
+        return True
+
+    def deal(self) -> bool:
+        """Distribui 10 cartas (1 por coluna) e registra no histórico para permitir undo."""
+        if not self._do_deal():
+            return False
+        self._record(DEAL_CODE)
+        return True
+
+    def undo(self) -> bool:
+        """Desfaz o último movimento (normal ou distribuição), se houver."""
+        hist = self.historico
+        if hist.pos == 0:
+            return False
+        hist.pos -= 1
+        self._undo_code(hist.codes[hist.pos])
+        self.version += 1
+        return True
+
+    def redo(self) -> bool:
+        """Refaz a próxima jogada desfeita, se houver."""
+        hist = self.historico
+        if hist.pos == len(hist.codes):
+            return False
+        self._redo_code(hist.codes[hist.pos])
+        hist.pos += 1
+        self.version += 1
+        return True
+
+    def play_code(self, code: int) -> bool:
+        """Executa a jogada descrita por um código do histórico (ex.: lido de um replay)."""
+        if code == DEAL_CODE:
+            return self.deal()
+        origem = code & 0xF
+        idx = len(self.columns[origem].cards) - ((code >> 8) & 0xF)
+        return self.move(origem, idx, (code >> 4) & 0xF)
+
+    def goto(self, n: int) -> bool:
+        """Vai para a posição `n` do histórico (0 = início da partida).
+
+        Usa o checkpoint mais próximo quando ele exige menos jogadas que
+        desfazer/refazer a partir da posição atual.
+        """
+        hist = self.historico
+        if not 0 <= n <= len(hist.codes):
+            return False
+        if n == hist.pos:
+            return True
+        c = hist.checkpoint_before(n)
+        if c is not None and n - c < abs(hist.pos - n):
+            self.restore(hist.checkpoints[c])
+            hist.pos = c
+        codes = hist.codes
+        while hist.pos > n:
+            hist.pos -= 1
+            self._undo_code(codes[hist.pos])
+        while hist.pos < n:
+            self._redo_code(codes[hist.pos])
+            hist.pos += 1
+        self.version += 1
+        return True
+
+    # ---------- instantâneos ----------
+    def snapshot(self) -> bytes:
+        """Posição completa em bytes (sem o histórico).
+
+        Formato: removidas, qtd. de sequências guardadas, estoque (tamanho +
+        cartas), colunas (tamanho + cartas), cartas das sequências removidas.
+        Cada carta é o índice em `deck` | 0x80 se virada para cima.
+        """
+        index = {id(c): i for i, c in enumerate(self.deck)}
+
+        def enc(cards: List[Card]) -> List[int]:
+            return [index[id(c)] | (_SNAP_FACE_UP if c.face_up else 0) for c in cards]
+
+        out = [self.removed_sequences, len(self.removed_runs),
+               len(self.stock.cards), *enc(self.stock.cards)]
+        for col in self.columns:
+            out.append(len(col.cards))
+            out.extend(enc(col.cards))
+        for run in self.removed_runs:
+            out.extend(enc(run))
+        return bytes(out)
+
+    @classmethod
+    def from_snapshot(cls, snap: bytes, seed: int = 0, variant: Variant = TWO_SUITS) -> "Game":
+        """Nova partida na posição de `snapshot()` (histórico vazio).
+
+        Funciona com instantâneos de qualquer partida da mesma variante: o
+        baralho é criado sempre na mesma ordem, então os índices das cartas
+        coincidem. `seed` só é guardada em `game.seed` (a posição vem do
+        instantâneo).
+        """
+        game = cls(seed=seed, variant=variant)
+        game.restore(snap)
+        game.version = 0
+        return game
+
+    def restore(self, snap: bytes) -> None:
+        """Volta à posição de `snapshot()` (o histórico não é alterado)."""
+        deck = self.deck
+
+        def dec(codes) -> List[Card]:
+            cards = []
+            for b in codes:
+                card = deck[b & ~_SNAP_FACE_UP]
+                card.face_up = bool(b & _SNAP_FACE_UP)
+                cards.append(card)
+            return cards
+
+        self.removed_sequences = snap[0]
+        n_runs = snap[1]
+        k = 3 + snap[2]
+        self.stock.cards = dec(snap[3:k])
+        for col in self.columns:
+            n = snap[k]
+            col.cards = dec(snap[k + 1:k + 1 + n])
+            col.reindex()
+            k += 1 + n
+        self.removed_runs = [dec(snap[k + 13 * r:k + 13 * (r + 1)]) for r in range(n_runs)]
+        self.reindex()
+        self.version += 1
+
+    def reset(self, seed: Optional[int] = None, deal: Optional[bytes] = None,
+              variant: Optional[Variant] = None) -> None:
+        """Nova partida reaproveitando cartas, colunas e estoque (sem realocar).
+
+        `variant=None` mantém a variante atual; outra variante troca o baralho.
+        O histórico é um objeto novo: `SessionWriter.sync` usa a identidade
+        dele para perceber a troca de partida.
+        """
+        self.seed = _check_seed(seed)
+        if variant is not None:
+            self.variant = variant
+        self.removed_sequences = 0
+        self.removed_runs.clear()
+        every = self.historico.checkpoint_every
+        self.historico = History(every)
+        self._start(deal)
+        if every:
+            self.historico.checkpoints[0] = self.snapshot()
+        self.version += 1
+
+
+class GamePool:
+    """Partidas recicladas para cargas que reiniciam muitas vezes (lote, servidor).
+
+    `acquire` devolve um `Game` liberado antes com `release`, já reiniciado
+    por `Game.reset` (mesmas cartas, colunas e estoque), ou cria um novo se o
+    pool estiver vazio. Quem chama `release` não deve usar mais a partida.
+    """
+
+    def __init__(self, max_size: int = 1024, checkpoint_every: int = 0) -> None:
+        self.max_size = max_size
+        self.checkpoint_every = checkpoint_every
+        self._free: List[Game] = []
+        self.created = 0
+        self.reused = 0
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self, seed: Optional[int] = None, deal: Optional[bytes] = None,
+                variant: Variant = TWO_SUITS) -> Game:
+        if self._free:
+            game = self._free.pop()
+            game.reset(seed, deal, variant)
+            self.reused += 1
+            return game
+        self.created += 1
+        return Game(seed, self.checkpoint_every, deal, variant)
+
+    def release(self, game: Game) -> None:
+        if len(self._free) < self.max_size:
+            self._free.append(game)
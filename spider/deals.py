@@ -0,0 +1,177 @@
+"""
+Distribuições determinísticas e catálogo de distribuições (sem Arcade).
+
+- `deal_order(seed)`: permutação das 104 cartas (índices na ordem de
+  `Deck.create(variant)`; a mesma para todas as variantes) por Fisher-Yates com PCG32
+  (XSH-RR, 64 bits de estado) e sorteio limitado sem viés por rejeição.
+  Não depende de `random` do Python: a mesma seed dá a mesma distribuição em
+  qualquer versão/plataforma. `SHUFFLE_VERSION` identifica o algoritmo.
+- `DealCatalog`: arquivo com as permutações de um intervalo de seeds,
+  lido via `mmap` (busca "distribuição #N" sem embaralhar).
+
+    python -m spider.deals build --seeds 0:100000 --out deals.spdk
+    python -m spider.deals show deals.spdk --seed 42
+"""
+
+from __future__ import annotations
+import argparse
+import mmap
+import os
+import struct
+from typing import Optional
+
+N_CARDS = 104
+SHUFFLE_VERSION = 1
+
+_MASK64 = (1 << 64) - 1
+_MASK32 = (1 << 32) - 1
+_PCG_MULT = 6364136223846793005
+_PCG_INC = 1442695040888963407  # sequência fixa (ímpar)
+
+
+class PCG32:
+    """Gerador PCG32 (XSH-RR), como na implementação de referência pcg32_random_r."""
+
+    __slots__ = ("state",)
+
+    def __init__(self, seed: int) -> None:
+        # inicialização de referência (pcg32_srandom_r)
+        self.state = 0
+        self.next32()
+        self.state = (self.state + (seed & _MASK64)) & _MASK64
+        self.next32()
+
+    def next32(self) -> int:
+        old = self.state
+        self.state = (old * _PCG_MULT + _PCG_INC) & _MASK64
+        xorshifted = (((old >> 18) ^ old) >> 27) & _MASK32
+        rot = old >> 59
+        return ((xorshifted >> rot) | (xorshifted << ((-rot) & 31))) & _MASK32
+
+    def below(self, n: int) -> int:
+        """Inteiro uniforme em [0, n) (rejeição: sem viés de módulo)."""
+        threshold = (1 << 32) % n
+        while True:
+            r = self.next32()
+            if r >= threshold:
+                return r % n
+
+
+def deal_order(seed: int) -> bytes:
+    """Permutação de 0..103 da distribuição da `seed` (Fisher-Yates)."""
+    order = bytearray(range(N_CARDS))
+    # PCG32.next32/below em linha (mesma sequência; ~2x mais rápido)
+    state = PCG32(seed).state
+    mult, inc, m64, m32 = _PCG_MULT, _PCG_INC, _MASK64, _MASK32
+    for i in range(N_CARDS - 1, 0, -1):
+        n = i + 1
+        threshold = (1 << 32) % n
+        while True:
+            old = state
+            state = (old * mult + inc) & m64
+            x = (((old >> 18) ^ old) >> 27) & m32
+            rot = old >> 59
+            r = ((x >> rot) | (x << ((-rot) & 31))) & m32
+            if r >= threshold:
+                break
+        j = r % n
+        order[i], order[j] = order[j], order[i]
+    return bytes(order)
+
+
+# =========================
+# Catálogo
+# =========================
+
+CATALOG_MAGIC = b"SPDK"
+_CATALOG_HEAD = struct.Struct("<4sBQI")  # magic, versão do embaralhamento, primeira seed, quantidade
+
+
+class CatalogError(ValueError):
+    pass
+
+
+def build_catalog(path: str, start: int, count: int) -> None:
+    """Grava as permutações das seeds [start, start + count)."""
+    with open(path, "wb") as f:
+        f.write(_CATALOG_HEAD.pack(CATALOG_MAGIC, SHUFFLE_VERSION, start, count))
+        chunk = bytearray()
+        for seed in range(start, start + count):
+            chunk += deal_order(seed)
+            if len(chunk) >= 1 << 20:
+                f.write(chunk)
+                chunk.clear()
+        f.write(chunk)
+
+
+class DealCatalog:
+    """Permutações pré-calculadas via `mmap`; `deal(seed)` é uma fatia do arquivo."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._f = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._f.close()
+            raise CatalogError(f"{path}: arquivo vazio")
+        magic, version, self.start, self.count = _CATALOG_HEAD.unpack_from(self._mm, 0)
+        if magic != CATALOG_MAGIC:
+            self.close()
+            raise CatalogError(f"{path}: não é um catálogo de distribuições")
+        if version != SHUFFLE_VERSION:
+            self.close()
+            raise CatalogError(f"{path}: embaralhamento versão {version}, esperado {SHUFFLE_VERSION}")
+        if len(self._mm) < _CATALOG_HEAD.size + self.count * N_CARDS:
+            self.close()
+            raise CatalogError(f"{path}: arquivo truncado")
+
+    def __contains__(self, seed: int) -> bool:
+        return self.start <= seed < self.start + self.count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def deal(self, seed: int) -> bytes:
+        if seed not in self:
+            raise KeyError(seed)
+        off = _CATALOG_HEAD.size + (seed - self.start) * N_CARDS
+        return self._mm[off:off + N_CARDS]
+
+    def get(self, seed: int) -> Optional[bytes]:
+        return self.deal(seed) if seed in self else None
+
+    def close(self) -> None:
+        self._mm.close()
+        self._f.close()
+
+    def __enter__(self) -> "DealCatalog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Catálogo de distribuições do Spider.")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="gera o catálogo para um intervalo de seeds")
+    b.add_argument("--seeds", default="0:100000", help='intervalo "A:B" (B exclusivo)')
+    b.add_argument("--out", default="deals.spdk")
+    s = sub.add_parser("show", help="mostra a permutação de uma seed")
+    s.add_argument("path")
+    s.add_argument("--seed", type=int, required=True)
+    args = parser.parse_args()
+
+    if args.cmd == "build":
+        a, _, z = args.seeds.partition(":")
+        start, stop = int(a), int(z)
+        build_catalog(args.out, start, stop - start)
+        print(f"{stop - start} distribuições em {args.out} ({os.path.getsize(args.out)} bytes)")
+    else:
+        with DealCatalog(args.path) as cat:
+            print(list(cat.deal(args.seed)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Dicas e jogada automática com busca em segundo plano (sem Arcade).
+
+- `HintEngine.request(game)` devolve a dica da posição se já estiver em cache;
+  senão captura a posição (`Game.snapshot()`, microssegundos) e a envia para
+  uma thread de busca. O quadro nunca espera pela busca.
+- A thread roda o `Solver` com orçamento pequeno sobre uma cópia da posição.
+  Se achar a vitória, a dica é o primeiro movimento da linha e todas as
+  posições da linha entram no cache (jogada automática sem nova busca).
+  Senão, a dica é o melhor movimento pela ordenação do solver.
+- Os resultados voltam por uma fila lida em `poll()` (chamada no `on_update`).
+- `invalidate()` cancela a busca em andamento quando o modelo muda.
+- Cache por posição (chave: `Game.zobrist`), com limite de entradas (LRU).
+- `dead_end(game)`: a mesma thread roda `solver.dead_end` (partida que só anda
+  em círculos) uma vez por posição; o veredito fica em cache e chega pelo `poll()`.
+
+A busca vê as cartas viradas para baixo (o solver conhece a posição inteira).
+"""
+
+from __future__ import annotations
+import queue
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from .core import Game, Variant
+from .solver import DEAL, SOLVED, SolverMove, Solver, apply_move, dead_end, ordered_moves
+
+# "Token" dos pedidos de `dead_end` na fila (os de dica são positivos)
+_DEAD_END = -1
+
+
+@dataclass
+class Hint:
+    move: Optional[SolverMove]                  # None = sem jogadas possíveis
+    candidates: List[SolverMove] = field(default_factory=list)  # ordenados
+    solved: bool = False                        # `move` leva a uma vitória encontrada
+
+    def is_deal(self) -> bool:
+        return self.move == DEAL
+
+
+class HintEngine:
+    def __init__(self, max_nodes: int = 50_000, max_time: float = 2.0,
+                 cache_size: int = 4096) -> None:
+        self.max_nodes = max_nodes
+        self.max_time = max_time
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[int, Hint]" = OrderedDict()
+        self._inbox: "queue.Queue[Optional[Tuple[int, int, bytes, Variant, int]]]" = queue.Queue()
+        self._outbox: "queue.Queue[Tuple[int, list]]" = queue.Queue()
+        # Identifica a requisição atual; a thread abandona buscas de outro token
+        self._token = 0
+        self._pending: Optional[int] = None
+        # Vereditos de `solver.dead_end` por posição (True/False/None = inconclusivo)
+        self._dead: "OrderedDict[int, Optional[bool]]" = OrderedDict()
+        self._dead_pending: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------- lado do jogo (thread do Arcade) ----------
+    def cached(self, game: Game) -> Optional[Hint]:
+        key = game.zobrist
+        hint = self._cache.get(key)
+        if hint is not None:
+            self._cache.move_to_end(key)
+        return hint
+
+    def request(self, game: Game) -> Optional[Hint]:
+        """Dica da posição atual, se pronta; senão agenda a busca e retorna None."""
+        hint = self.cached(game)
+        if hint is not None:
+            return hint
+        key = game.zobrist
+        if self._pending == key:
+            return None
+        self._token += 1
+        self._pending = key
+        self._ensure_thread()
+        self._inbox.put((self._token, key, game.snapshot(), game.variant, 0))
+        return None
+
+    def dead_end(self, game: Game, max_states: int) -> Tuple[bool, Optional[bool]]:
+        """Veredito de `solver.dead_end` para a posição atual: (pronto, veredito).
+
+        Sem veredito em cache, agenda a verificação na thread e retorna
+        (False, None); o resultado chega pelo `poll()`.
+        """
+        key = game.zobrist
+        if key in self._dead:
+            self._dead.move_to_end(key)
+            return True, self._dead[key]
+        if self._dead_pending != key:
+            self._dead_pending = key
+            self._ensure_thread()
+            self._inbox.put((_DEAD_END, key, game.snapshot(), game.variant, max_states))
+        return False, None
+
+    def invalidate(self) -> None:
+        """A posição mudou: a busca em andamento (se houver) é abandonada."""
+        if self._pending is not None:
+            self._token += 1
+            self._pending = None
+
+    def poll(self) -> int:
+        """Move para o cache os resultados prontos. Retorna quantos chegaram."""
+        n = 0
+        while True:
+            try:
+                token, entries = self._outbox.get_nowait()
+            except queue.Empty:
+                return n
+            if token == _DEAD_END:
+                for key, verdict in entries:
+                    self._dead[key] = verdict
+                    if key == self._dead_pending:
+                        self._dead_pending = None
+                while len(self._dead) > self.cache_size:
+                    self._dead.popitem(last=False)
+                n += 1
+                continue
+            for key, hint in entries:
+                self._store(key, hint)
+            if token == self._token:
+                self._pending = None
+            n += 1
+
+    @property
+    def busy(self) -> bool:
+        return self._pending is not None or self._dead_pending is not None
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._token += 1
+            self._inbox.put(None)
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _store(self, key: int, hint: Hint) -> None:
+        self._cache[key] = hint
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="spider-hints", daemon=True)
+            self._thread.start()
+
+    # ---------- thread de busca ----------
+    def _worker(self) -> None:
+        while True:
+            job = self._inbox.get()
+            if job is None:
+                return
+            token, key, snap, variant, max_states = job
+            if token == _DEAD_END:
+                if key == self._dead_pending:  # senão a posição já mudou de novo
+                    verdict = dead_end(Game.from_snapshot(snap, variant=variant), max_states)
+                    self._outbox.put((_DEAD_END, [(key, verdict)]))
+                continue
+            if token != self._token:
+                continue  # já substituída por outra requisição
+            entries = self.search(Game.from_snapshot(snap, variant=variant), key,
+                                  stop=lambda t=token: t != self._token)
+            if entries is not None:
+                self._outbox.put((token, entries))
+
+    def search(self, game: Game, key: int, stop=None) -> Optional[List[Tuple[int, Hint]]]:
+        """Busca a dica de `game` (chave `key`). None se cancelada por `stop()`.
+
+        Retorna pares (chave da posição, dica); com vitória encontrada, inclui
+        uma entrada para cada posição da linha vencedora.
+        """
+        candidates = ordered_moves(game)
+        if not candidates:
+            return [(key, Hint(None))]
+
+        result = Solver(game, max_nodes=self.max_nodes, max_time=self.max_time, stop=stop).solve()
+        if stop is not None and stop():
+            return None
+        if result.status != SOLVED or not result.line:
+            return [(key, Hint(candidates[0], candidates))]
+
+        line = result.line
+        first = [line[0]] + [mv for mv in candidates if mv != line[0]]
+        entries = [(key, Hint(line[0], first, solved=True))]
+        for k, mv in enumerate(line[:-1]):
+            apply_move(game, mv)
+            nxt = line[k + 1]
+            entries.append((game.zobrist, Hint(nxt, [nxt], solved=True)))
+        return entries
@@ -0,0 +1,85 @@
+"""
+Layout da mesa e hit-test por aritmética (sem Arcade).
+
+A coluna sob o ponteiro sai direto de `x` (COL_LEFT / COL_SPACING_X) e a
+carta, de `y` (deslocamento vertical da coluna). Colunas altas são
+comprimidas: o deslocamento entre cartas diminui para a coluna caber acima
+de `min_y`. O índice é recalculado só quando `Game.version` muda.
+"""
+
+from __future__ import annotations
+import math
+from typing import List, Optional, Tuple
+
+from .core import Game
+
+
+class TableLayout:
+    def __init__(self, n_cols: int, left: float, spacing_x: float, top_y: float,
+                 card_w: float, card_h: float, stack_dy: float, min_y: float) -> None:
+        self.n_cols = n_cols
+        self.left = left
+        self.spacing_x = spacing_x
+        self.top_y = top_y
+        self.half_w = card_w / 2
+        self.half_h = card_h / 2
+        self.stack_dy = stack_dy
+        # distância máxima entre o centro da primeira e da última carta
+        self.span = top_y - min_y
+        self.dy: List[float] = [float(stack_dy)] * n_cols
+        self.heights: List[int] = [0] * n_cols
+        self.version = -1
+
+    def update(self, game: Game) -> None:
+        """Recalcula alturas e compressão das colunas se o modelo mudou."""
+        if game.version == self.version:
+            return
+        for ci, col in enumerate(game.columns):
+            n = len(col.cards)
+            self.heights[ci] = n
+            if n > 1 and (n - 1) * self.stack_dy > self.span:
+                self.dy[ci] = self.span / (n - 1)
+            else:
+                self.dy[ci] = self.stack_dy
+        self.version = game.version
+
+    def col_x(self, ci: int) -> float:
+        return self.left + ci * self.spacing_x
+
+    def card_pos(self, ci: int, idx: int) -> Tuple[float, float]:
+        return self.left + ci * self.spacing_x, self.top_y - idx * self.dy[ci]
+
+    def column_at(self, x: float) -> int:
+        """Coluna cuja largura contém `x`, ou -1."""
+        ci = int(math.floor((x - self.left) / self.spacing_x + 0.5))
+        if ci < 0 or ci >= self.n_cols:
+            return -1
+        if abs(x - (self.left + ci * self.spacing_x)) > self.half_w:
+            return -1
+        return ci
+
+    def pick(self, x: float, y: float) -> Optional[Tuple[int, int]]:
+        """(coluna, índice) da carta visível no ponto; índice -1 = coluna vazia.
+
+        Mesmo resultado da varredura por retângulos: a carta de maior índice
+        que contém o ponto.
+        """
+        ci = self.column_at(x)
+        if ci < 0:
+            return None
+        n = self.heights[ci]
+        top = self.top_y
+        if n == 0:
+            # área da coluna vazia se estende duas cartas abaixo do espaço
+            if top - self.half_h - 2 * self.stack_dy <= y <= top + self.half_h:
+                return (ci, -1)
+            return None
+        dy = self.dy[ci]
+        idx = int(math.floor((top + self.half_h - y) / dy))
+        if idx < 0:
+            return None
+        if idx > n - 1:
+            idx = n - 1
+        if top - idx * dy - self.half_h > y:
+            return None
+        return (ci, idx)
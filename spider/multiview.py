@@ -0,0 +1,431 @@
+"""
+Várias mesas em uma janela (torneios em quiosque, telas de espectador).
+
+- Grade de 1 a 16 partidas (`Game`), cada uma no seu viewport, com layout
+  próprio (`TableLayout` escalado) e cartas menores.
+- Cada mesa é jogada por uma pessoa (clique na carta, clique na coluna de
+  destino; Espaço/U/Y/R na mesa sob o ponteiro), por um bot (política de
+  spider.batch) ou refaz uma partida de um arquivo de sessões.
+- Um único `SpriteList` e um único atlas para todas as mesas: cada mesa tem
+  uma faixa fixa de sprites (cartas e rótulo) atualizada no lugar, então a
+  tela inteira sai em uma chamada de desenho, mais uma para os contornos.
+- Atualização por mesa limitada: bots/replays jogam em intervalos próprios
+  (defasados entre mesas) e no máximo `MAX_REFRESH_PER_FRAME` mesas alteradas
+  são redesenhadas por quadro; as demais ficam para os quadros seguintes.
+
+    python -m spider.multiview [--boards 16] [--humans 1] [--policy greedy]
+                               [--interval 0.25] [--replay sessoes.spdr] [--suits 2]
+"""
+
+from __future__ import annotations
+import argparse
+import logging
+import math
+import os
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+import arcade
+from arcade.shape_list import ShapeElementList, create_rectangle_outline
+
+from .batch import make_policy
+from .core import FOUR_SUITS, TWO_SUITS, VARIANTS, Game, Sequence, Variant
+from .layout import TableLayout
+from .render import ATLAS_SIZE, CardTextures, GlyphCache
+from .savefile import TAG_MOVE, TAG_REDO, TAG_UNDO, ReplayArchive
+from .solver import apply_move
+from .view import (BG_COLOR, CARD_BACK, CARD_BORDER, CARD_COLOR, FONT_SIZE, HINT_HIGHLIGHT,
+                   SUIT_COLOR, TEXTURE_CACHE_DIR, VALID_HIGHLIGHT)
+
+log = logging.getLogger(__name__)
+
+SCREEN_W = 1600
+SCREEN_H = 900
+SCREEN_TITLE = "Spider — várias mesas"
+
+# Sprites por mesa: todas as cartas (104) mais o rótulo
+LABEL_CHARS = 40
+SLOT = 104 + LABEL_CHARS
+LABEL_FONT = 9
+
+# Mesas com mudança redesenhadas por quadro (as demais esperam a vez)
+MAX_REFRESH_PER_FRAME = 4
+# Pausa (s) antes de um bot/replay recomeçar depois do fim da partida
+RESTART_DELAY = 2.0
+
+HUMAN = "humano"
+BOT = "bot"
+REPLAY = "replay"
+
+
+def grid(n: int, width: float, height: float, margin: float = 8) -> List[Tuple[float, float, float, float]]:
+    """Viewports (x, y, largura, altura) de `n` mesas, da esquerda para a direita e de cima para baixo."""
+    cols = math.ceil(math.sqrt(n))
+    rows = math.ceil(n / cols)
+    w, h = width / cols, height / rows
+    return [((k % cols) * w + margin / 2, height - (k // cols + 1) * h + margin / 2,
+             w - margin, h - margin) for k in range(n)]
+
+
+# =========================
+# Controle das mesas
+# =========================
+
+class BotDriver:
+    """Joga com uma política de spider.batch; ao terminar, começa a próxima seed."""
+
+    kind = BOT
+
+    def __init__(self, policy: str, seed_step: int) -> None:
+        self.policy = make_policy(policy)
+        self.seed_step = seed_step
+
+    def start(self, board: "Board") -> None:
+        self.policy.start(board.game, board.game.seed)
+
+    def step(self, board: "Board") -> bool:
+        """Uma jogada; False quando a partida acabou."""
+        game = board.game
+        if game.is_won():
+            return False
+        mv = self.policy.choose(game)
+        if mv is None:
+            return False
+        return apply_move(game, mv)
+
+    def restart(self, board: "Board") -> None:
+        board.game.reset(seed=board.game.seed + self.seed_step)
+        self.start(board)
+
+
+class ReplayDriver:
+    """Refaz uma partida gravada (spider.savefile), uma ação por passo, em laço."""
+
+    kind = REPLAY
+
+    def __init__(self, archive: ReplayArchive, index: int) -> None:
+        self.archive = archive
+        self.record = archive.game(index)
+        self._actions = iter(())
+
+    def start(self, board: "Board") -> None:
+        rec = self.record
+        board.game = self.archive.position(rec, 0)
+        self._actions = self.archive.actions(rec)
+
+    def step(self, board: "Board") -> bool:
+        action = next(self._actions, None)
+        if action is None:
+            return False
+        tag, code = action
+        game = board.game
+        if tag == TAG_MOVE:
+            return game.play_code(code)
+        if tag == TAG_UNDO:
+            return game.undo()
+        if tag == TAG_REDO:
+            return game.redo()
+        return False
+
+    def restart(self, board: "Board") -> None:
+        self.start(board)
+
+
+class Board:
+    """Uma mesa da grade: partida, viewport, layout escalado e faixa de sprites."""
+
+    def __init__(self, index: int, game: Game, viewport: Tuple[float, float, float, float],
+                 driver=None, interval: float = 0.25) -> None:
+        self.index = index
+        self.game = game
+        self.viewport = viewport
+        self.driver = driver
+        self.interval = interval
+        # defasagem: mesas com o mesmo intervalo não jogam no mesmo quadro
+        self.wait = interval * (index % 8) / 8
+        self.finished = False
+        self.shown_version = -1
+        self.shown_cards = 0
+        self.label = ""
+        self.selected: Optional[Tuple[int, int]] = None
+        # por coluna: (início na faixa, hash de Zobrist, tamanho, espaçamento) já desenhados
+        self.col_keys: List[Optional[tuple]] = [None] * len(game.columns)
+
+        x, y, w, h = viewport
+        n_cols = len(game.columns)
+        spacing = w / (n_cols + 0.5)
+        self.card_w = int(spacing * 0.84)
+        self.card_h = int(self.card_w * 1.375)
+        self.label_h = LABEL_FONT * 2
+        top = y + h - self.label_h - self.card_h / 2
+        self.layout = TableLayout(n_cols, x + spacing * 0.75, spacing, top,
+                                  self.card_w, self.card_h, self.card_h * 0.25,
+                                  y + self.card_h / 2 + 2)
+        if driver is not None:
+            driver.start(self)
+
+    @property
+    def kind(self) -> str:
+        return self.driver.kind if self.driver is not None else HUMAN
+
+    def contains(self, px: float, py: float) -> bool:
+        x, y, w, h = self.viewport
+        return x <= px < x + w and y <= py < y + h
+
+    def update(self, dt: float) -> None:
+        """Passos do bot/replay no ritmo da mesa; recomeça depois do fim."""
+        if self.driver is None:
+            return
+        self.wait -= dt
+        if self.wait > 0:
+            return
+        if self.finished:
+            self.finished = False
+            self.driver.restart(self)
+            self.shown_version = -1  # o replay troca o objeto Game
+            self.wait = self.interval
+            return
+        # atraso longo (janela travada): no máximo um passo, sem recuperar o atraso
+        self.wait = max(self.wait + self.interval, 0.0)
+        if not self.driver.step(self):
+            self.finished = True
+            self.wait = RESTART_DELAY
+
+    def status(self) -> str:
+        game = self.game
+        if game.is_won():
+            state = "venceu"
+        elif self.finished or game.is_lost():
+            state = "sem jogadas"
+        else:
+            state = self.kind
+        return (f"#{game.seed}  {game.removed_sequences}/{game.variant.sequences}  estoque {len(game.stock.cards)}"
+                f"  {state}")[:LABEL_CHARS]
+
+
+# =========================
+# Janela
+# =========================
+
+class MultiTableView(arcade.Window):
+    def __init__(self, n_boards: int = 16, humans: int = 1, policy: str = "greedy",
+                 interval: float = 0.25, replay: Optional[str] = None, seed: int = 0,
+                 width: int = SCREEN_W, height: int = SCREEN_H,
+                 texture_cache: Optional[str] = TEXTURE_CACHE_DIR,
+                 variant: Variant = TWO_SUITS) -> None:
+        super().__init__(width, height, SCREEN_TITLE)
+        arcade.set_background_color(BG_COLOR)
+        self.archive = ReplayArchive(replay) if replay else None
+        self._closed = False
+        n_games = sum(1 for _ in self.archive.games()) if self.archive else 0
+
+        self.boards: List[Board] = []
+        for k, vp in enumerate(grid(n_boards, width, height)):
+            game = Game(seed=seed + k, variant=variant)
+            if k < humans:
+                driver = None
+            elif n_games:
+                driver = ReplayDriver(self.archive, (k - humans) % n_games)
+            else:
+                driver = BotDriver(policy, seed_step=n_boards)
+            self.boards.append(Board(k, game, vp, driver, interval))
+
+        # Todas as mesas têm o mesmo tamanho de carta: um jogo de texturas
+        b0 = self.boards[0]
+        font = max(6.0, FONT_SIZE * b0.card_w / 80)
+        # (partidas gravadas podem ser de qualquer variante)
+        suits = FOUR_SUITS.suits if n_games else variant.suits
+        self.tex = CardTextures(b0.card_w, b0.card_h, b0.card_w, b0.card_h,
+                                CARD_COLOR, CARD_BACK, CARD_BORDER, SUIT_COLOR, font,
+                                cache_dir=texture_cache, suits=suits)
+        self.glyphs = GlyphCache(LABEL_FONT)
+
+        # Uma faixa fixa por mesa no mesmo SpriteList (cartas, depois o rótulo)
+        self.atlas = arcade.DefaultTextureAtlas(ATLAS_SIZE)
+        self.sprites = arcade.SpriteList(atlas=self.atlas, capacity=SLOT * n_boards)
+        back = self.tex.back
+        for _ in range(SLOT * n_boards):
+            sprite = arcade.Sprite(back)
+            sprite.visible = False
+            self.sprites.append(sprite)
+
+        self.outlines = ShapeElementList()
+        for board in self.boards:
+            x, y, w, h = board.viewport
+            self.outlines.append(create_rectangle_outline(x + w / 2, y + h / 2, w, h,
+                                                          arcade.color.BLACK, 1))
+            for ci in range(board.layout.n_cols):
+                cx, cy = board.layout.card_pos(ci, 0)
+                self.outlines.append(create_rectangle_outline(cx, cy, board.card_w, board.card_h,
+                                                              arcade.color.BLACK, 1))
+
+        self._pending: Deque[Board] = deque()
+        self.focus: Optional[Board] = None
+        self.refreshed = 0  # mesas redesenhadas (para medição)
+
+    # ---------- faixas de sprites ----------
+    def _refresh(self, board: Board) -> None:
+        """Reescreve a faixa da mesa: texturas e posições das cartas, rótulo."""
+        game = board.game
+        layout = board.layout
+        layout.update(game)
+        sprites = self.sprites
+        tex = self.tex
+        base = board.index * SLOT
+        keys = board.col_keys
+        k = base
+        for ci, col in enumerate(game.columns):
+            cards = col.cards
+            # coluna com as mesmas cartas, no mesmo trecho e espaçamento: nada a reescrever
+            key = (k, col._hash, len(cards), layout.dy[ci])
+            if keys[ci] == key:
+                k += len(cards)
+                continue
+            keys[ci] = key
+            for idx, card in enumerate(cards):
+                sprite = sprites[k]
+                sprite.texture = tex.for_card(card)
+                sprite.position = layout.card_pos(ci, idx)
+                sprite.visible = True
+                k += 1
+        for i in range(k, base + board.shown_cards):
+            sprites[i].visible = False
+        board.shown_cards = k - base
+
+        label = board.status()
+        if label != board.label:
+            board.label = label
+            x, y, _, h = board.viewport
+            pen = x + 4
+            cy = y + h - board.label_h / 2 - 4 + (self.glyphs.ascent - self.glyphs.descent) / 2
+            k = base + 104
+            for ch in label:
+                glyph, advance = self.glyphs.glyph(ch)
+                if glyph is not None:
+                    sprite = sprites[k]
+                    sprite.texture = glyph
+                    sprite.position = (round(pen) - GlyphCache.PAD + glyph.width / 2, cy)
+                    sprite.visible = True
+                    k += 1
+                pen += advance
+            for i in range(k, base + SLOT):
+                sprites[i].visible = False
+        board.shown_version = game.version
+
+    # ---------- ciclo do arcade ----------
+    def on_update(self, delta_time: float):
+        pending = self._pending
+        for board in self.boards:
+            board.update(delta_time)
+            if board.game.version != board.shown_version and board not in pending:
+                pending.append(board)
+        for _ in range(min(MAX_REFRESH_PER_FRAME, len(pending))):
+            self._refresh(pending.popleft())
+            self.refreshed += 1
+
+    def on_draw(self):
+        self.clear()
+        self.outlines.draw()
+        self.sprites.draw()
+        board = self.focus
+        if board is not None and board.kind == HUMAN:
+            x, y, w, h = board.viewport
+            arcade.draw_rect_outline(arcade.rect.XYWH(x + w / 2, y + h / 2, w, h), HINT_HIGHLIGHT, 2)
+            if board.selected is not None:
+                ci, idx = board.selected
+                cx, cy = board.layout.card_pos(ci, idx)
+                arcade.draw_rect_outline(arcade.rect.XYWH(cx, cy, board.card_w + 4, board.card_h + 4),
+                                         VALID_HIGHLIGHT, 2)
+
+    # ---------- entrada (mesas humanas) ----------
+    def _board_at(self, x: float, y: float) -> Optional[Board]:
+        for board in self.boards:
+            if board.contains(x, y):
+                return board
+        return None
+
+    def on_mouse_motion(self, x: float, y: float, dx: float, dy: float):
+        self.focus = self._board_at(x, y)
+
+    def on_mouse_press(self, x: float, y: float, button: int, modifiers: int):
+        board = self._board_at(x, y)
+        self.focus = board
+        if board is None or board.kind != HUMAN:
+            return
+        game = board.game
+        board.layout.update(game)
+        hit = board.layout.pick(x, y)
+        if board.selected is not None:
+            ci, idx = board.selected
+            board.selected = None
+            if hit is not None and hit[0] != ci:
+                game.move(ci, idx, hit[0])
+                return
+        if hit is None or hit[1] < 0:
+            return
+        ci, idx = hit
+        col = game.columns[ci]
+        seq: Optional[Sequence] = col.movable_subsequence_from(idx) if col.cards[idx].face_up else None
+        if seq is not None:
+            board.selected = (ci, idx)
+
+    def on_key_press(self, symbol: int, modifiers: int):
+        if symbol == arcade.key.ESCAPE:
+            # close_window() não despacha on_close: encerra aqui antes
+            self._shutdown()
+            arcade.close_window()
+            return
+        board = self.focus
+        if board is None or board.kind != HUMAN:
+            return
+        board.selected = None
+        if symbol == arcade.key.SPACE:
+            board.game.deal()
+        elif symbol == arcade.key.U:
+            board.game.undo()
+        elif symbol == arcade.key.Y:
+            board.game.redo()
+        elif symbol == arcade.key.R:
+            board.game.reset()
+
+    def on_close(self):
+        self._shutdown()
+        super().on_close()
+
+    def _shutdown(self):
+        """Fecha o arquivo de replays e grava o cache de texturas; roda uma vez só."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.archive is not None:
+            self.archive.close()
+        try:
+            self.tex.save_cache()
+        except OSError as e:
+            log.warning("cache de texturas não gravado: %s", e)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Várias mesas de Spider em uma janela.")
+    parser.add_argument("--boards", type=int, default=16, help="mesas (1 a 16)")
+    parser.add_argument("--humans", type=int, default=1, help="mesas jogadas com mouse/teclado")
+    parser.add_argument("--policy", default="greedy", choices=("random", "greedy"),
+                        help="política dos bots")
+    parser.add_argument("--interval", type=float, default=0.25, help="s entre jogadas de bot/replay")
+    parser.add_argument("--replay", help="arquivo de sessões: as mesas não humanas refazem as partidas")
+    parser.add_argument("--seed", type=int, default=0, help="seed da primeira mesa")
+    parser.add_argument("--suits", type=int, choices=sorted(VARIANTS), default=2,
+                        help="naipes do baralho das partidas novas")
+    args = parser.parse_args()
+    if not 1 <= args.boards <= 16:
+        parser.error("--boards deve estar entre 1 e 16")
+    if args.replay and not os.path.exists(args.replay):
+        parser.error(f"arquivo não encontrado: {args.replay}")
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+    MultiTableView(args.boards, args.humans, args.policy, args.interval, args.replay, args.seed,
+                   variant=VARIANTS[args.suits])
+    arcade.run()
+
+
+if __name__ == "__main__":
+    main()
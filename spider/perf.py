@@ -0,0 +1,284 @@
+"""
+Instrumentação dos caminhos quentes e resumo de desempenho (sem Arcade no import).
+
+- `Profiler.attach(view)` troca, só na instância, os handlers da janela
+  (`on_draw`, `on_update`, `on_mouse_*`) e as operações do `Game` (`move`,
+  `deal`, `undo`, `redo`) por versões cronometradas. `detach()` devolve os
+  originais: desligado, o custo é zero (nenhum wrapper no caminho).
+- Cada canal guarda início e duração das últimas N chamadas em buffers
+  circulares (`array('q')`, ns), sem alocar por chamada.
+- Por quadro (entre dois `on_draw`): tempo de quadro, chamadas de desenho GL
+  (contadas em `glDraw*` do pyglet/Arcade enquanto ligado) e blocos de memória
+  Python alocados (`sys.getallocatedblocks`, saldo líquido).
+- `summary()` (FPS, p50/p99 por canal) alimenta o overlay; `dump_json` e
+  `dump_chrome_trace` gravam em arquivo (o trace abre em chrome://tracing ou
+  no Perfetto). Com `dump_path`, o dump é repetido a cada `dump_every` s.
+"""
+
+from __future__ import annotations
+import json
+import logging
+import os
+import sys
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+VIEW_HANDLERS = ("on_draw", "on_update", "on_mouse_press", "on_mouse_motion", "on_mouse_release")
+GAME_OPS = ("move", "deal", "undo", "redo")
+GL_DRAW_FUNCS = ("glDrawArrays", "glDrawElements", "glDrawArraysInstanced", "glDrawElementsInstanced")
+
+_now = time.perf_counter_ns
+
+log = logging.getLogger(__name__)
+
+
+class Ring:
+    """Últimos `capacity` pares (início, valor) em arrays de tamanho fixo."""
+
+    __slots__ = ("start", "value", "i", "n")
+
+    def __init__(self, capacity: int) -> None:
+        self.start = array("q", bytes(8 * capacity))
+        self.value = array("q", bytes(8 * capacity))
+        self.i = 0
+        self.n = 0
+
+    def add(self, start: int, value: int) -> None:
+        i = self.i
+        self.start[i] = start
+        self.value[i] = value
+        i += 1
+        if i == len(self.value):
+            i = 0
+        self.i = i
+        if self.n < len(self.value):
+            self.n += 1
+
+    def clear(self) -> None:
+        self.i = self.n = 0
+
+    def items(self) -> List[Tuple[int, int]]:
+        """Pares em ordem cronológica."""
+        cap = len(self.value)
+        first = (self.i - self.n) % cap
+        return [(self.start[(first + k) % cap], self.value[(first + k) % cap]) for k in range(self.n)]
+
+    def values(self) -> List[int]:
+        return [v for _, v in self.items()]
+
+
+def percentile(sorted_values: List[int], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return float(sorted_values[k])
+
+
+class Profiler:
+    def __init__(self, capacity: int = 600, dump_path: Optional[str] = None,
+                 dump_every: float = 10.0) -> None:
+        self.capacity = capacity
+        self.dump_path = dump_path
+        self.dump_every = dump_every
+        self.channels: Dict[str, Ring] = {}
+        self.frame_ns = Ring(capacity)       # intervalo entre on_draw
+        self.draw_calls = Ring(capacity)     # glDraw* por quadro
+        self.alloc_blocks = Ring(capacity)   # saldo de blocos alocados por quadro
+        self._view = None
+        self._game = None
+        self._originals: List[Tuple[object, str]] = []
+        self._gl_patches: List[Tuple[object, str, Callable]] = []
+        self._gl_count = 0
+        self._frame_start = 0
+        self._frame_gl = 0
+        self._frame_blocks = 0
+        self._next_dump = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._view is not None
+
+    # ---------- ligar / desligar ----------
+    def attach(self, view) -> None:
+        """Liga a instrumentação na janela `view` (e no seu `game`)."""
+        if self._view is not None:
+            self.detach()
+        self._view = view
+        for name in VIEW_HANDLERS:
+            if name == "on_draw":
+                self._patch(view, name, self._frame_wrapper(getattr(view, name)))
+            else:
+                self._patch(view, name, self._timed(name, getattr(view, name)))
+        self._attach_game(view.game)
+        self._patch_gl()
+        self._frame_start = 0
+        self._next_dump = _now() + int(self.dump_every * 1e9)
+
+    def detach(self) -> None:
+        if self.dump_path:
+            self.dump(self.dump_path)
+        for obj, name in reversed(self._originals):
+            # remove o atributo da instância: o método da classe volta a valer
+            obj.__dict__.pop(name, None)
+        self._originals.clear()
+        for module, name, fn in self._gl_patches:
+            setattr(module, name, fn)
+        self._gl_patches.clear()
+        self._view = self._game = None
+
+    def clear(self) -> None:
+        for ring in self.channels.values():
+            ring.clear()
+        self.frame_ns.clear()
+        self.draw_calls.clear()
+        self.alloc_blocks.clear()
+        self._frame_start = 0
+
+    def _patch(self, obj, name: str, fn: Callable) -> None:
+        setattr(obj, name, fn)
+        self._originals.append((obj, name))
+
+    def _attach_game(self, game) -> None:
+        self._game = game
+        for name in GAME_OPS:
+            self._patch(game, name, self._timed("game." + name, getattr(game, name)))
+
+    def _ring(self, name: str) -> Ring:
+        ring = self.channels.get(name)
+        if ring is None:
+            ring = self.channels[name] = Ring(self.capacity)
+        return ring
+
+    def _timed(self, name: str, fn: Callable) -> Callable:
+        ring = self._ring(name)
+        add = ring.add
+
+        def timed(*args):
+            t0 = _now()
+            try:
+                return fn(*args)
+            finally:
+                add(t0, _now() - t0)
+        return timed
+
+    def _frame_wrapper(self, fn: Callable) -> Callable:
+        add = self._ring("on_draw").add
+
+        def on_draw():
+            t0 = _now()
+            blocks = sys.getallocatedblocks()
+            if self._frame_start:
+                self.frame_ns.add(self._frame_start, t0 - self._frame_start)
+                self.draw_calls.add(self._frame_start, self._gl_count - self._frame_gl)
+                self.alloc_blocks.add(self._frame_start, blocks - self._frame_blocks)
+            self._frame_start, self._frame_gl, self._frame_blocks = t0, self._gl_count, blocks
+            if self._view is not None and self._view.game is not self._game:
+                self._attach_game(self._view.game)  # partida trocada (ex.: retomada)
+            try:
+                return fn()
+            finally:
+                t1 = _now()
+                add(t0, t1 - t0)
+                if self.dump_path and t1 >= self._next_dump:
+                    self._next_dump = t1 + int(self.dump_every * 1e9)
+                    self.dump(self.dump_path)
+        return on_draw
+
+    def _patch_gl(self) -> None:
+        """Conta chamadas glDraw* (Arcade chama via `pyglet.gl`; o pyglet importa os nomes)."""
+        try:
+            import pyglet.gl
+            import pyglet.graphics.vertexdomain as vertexdomain
+        except ImportError:
+            return
+        for module in (pyglet.gl, vertexdomain):
+            for name in GL_DRAW_FUNCS:
+                fn = getattr(module, name, None)
+                if fn is None:
+                    continue
+                self._gl_patches.append((module, name, fn))
+                setattr(module, name, self._gl_counter(fn))
+
+    def _gl_counter(self, fn: Callable) -> Callable:
+        def counted(*args):
+            self._gl_count += 1
+            return fn(*args)
+        return counted
+
+    # ---------- resumo / exportação ----------
+    def summary(self) -> Dict:
+        frames = sorted(self.frame_ns.values())
+        out: Dict = {"frames": len(frames)}
+        if frames:
+            mean = sum(frames) / len(frames)
+            out["fps"] = 1e9 / mean if mean else 0.0
+            out["frame_ms_p50"] = percentile(frames, 0.50) / 1e6
+            out["frame_ms_p99"] = percentile(frames, 0.99) / 1e6
+            calls = self.draw_calls.values()
+            blocks = self.alloc_blocks.values()
+            out["draw_calls_per_frame"] = sum(calls) / len(calls)
+            out["alloc_blocks_per_frame"] = sum(blocks) / len(blocks)
+        channels = {}
+        for name, ring in self.channels.items():
+            durs = sorted(ring.values())
+            if durs:
+                channels[name] = {
+                    "count": len(durs),
+                    "p50_ms": percentile(durs, 0.50) / 1e6,
+                    "p99_ms": percentile(durs, 0.99) / 1e6,
+                    "max_ms": durs[-1] / 1e6,
+                }
+        out["channels"] = channels
+        return out
+
+    def overlay_text(self) -> str:
+        s = self.summary()
+        if not s["frames"]:
+            return "perf: aguardando quadros"
+        lines = [f"FPS {s['fps']:5.1f}  quadro p50 {s['frame_ms_p50']:5.1f} ms  "
+                 f"p99 {s['frame_ms_p99']:5.1f} ms",
+                 f"draw calls/quadro {s['draw_calls_per_frame']:5.1f}  "
+                 f"alocações/quadro {s['alloc_blocks_per_frame']:+7.1f}"]
+        for name, c in s["channels"].items():
+            lines.append(f"{name:17s} p50 {c['p50_ms']:6.2f}  p99 {c['p99_ms']:6.2f} ms  (n={c['count']})")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict:
+        events = []
+        for name, ring in self.channels.items():
+            cat = "game" if name.startswith("game.") else "view"
+            for start, dur in ring.items():
+                events.append({"name": name, "cat": cat, "ph": "X", "pid": os.getpid(), "tid": 1,
+                               "ts": start / 1e3, "dur": dur / 1e3})
+        for start, calls in self.draw_calls.items():
+            events.append({"name": "draw_calls", "ph": "C", "pid": os.getpid(),
+                           "ts": start / 1e3, "args": {"calls": calls}})
+        events.sort(key=lambda e: e["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_json(self, path: str) -> None:
+        _write_json(path, self.summary())
+
+    def dump_chrome_trace(self, path: str) -> None:
+        _write_json(path, self.chrome_trace())
+
+    def dump(self, path: str) -> None:
+        """Trace do Chrome se o nome terminar em `.trace.json`; senão o resumo."""
+        try:
+            if path.endswith(".trace.json"):
+                self.dump_chrome_trace(path)
+            else:
+                self.dump_json(path)
+        except OSError as e:
+            log.warning("dump desativado: %s", e)
+            self.dump_path = None
+
+
+def _write_json(path: str, data) -> None:
+    d = os.path.dirname(os.path.abspath(path))
+    os.makedirs(d, exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp, path)
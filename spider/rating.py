@@ -0,0 +1,409 @@
+"""
+Índice de dificuldade das distribuições (sem Arcade).
+
+Pipeline em fluxo, com memória limitada, para intervalos grandes de seeds:
+
+    seeds -> lotes -> processos (características + sondagens) -> corridas
+          ordenadas em disco -> intercalação -> índice ordenado por dificuldade
+
+- Características estruturais da distribuição inicial (as mesmas cartas de
+  `Game._start`, via `vecsim.BatchSim`): reis enterrados (virados para baixo
+  e não na base da coluna), pares mesmo naipe já em sequência nas colunas e
+  jogadas disponíveis no início (`Game.legal_move_count`).
+- Sondagens: `rollouts` partidas por seed com a política `greedy` do
+  `spider.vecsim` (até `max_moves` jogadas): vitórias, sequências removidas
+  e cartas ainda viradas para baixo no fim.
+- Pontuação em [0, 1] (1 = mais difícil), quantizada em 16 bits.
+- Os registros (16 bytes) saem dos processos em lotes, viram corridas
+  ordenadas de até `run_size` registros em arquivos temporários e são
+  intercalados (`heapq.merge`) no índice final.
+- `DifficultyIndex` lê o índice via `mmap`: busca por faixa de pontuação
+  (busca binária, O(log n)) ou por percentil (O(1)).
+
+    python -m spider.rating build --seeds 0:10000000 --out dificuldade.spdi --workers 8
+    python -m spider.rating show dificuldade.spdi --band dificil --count 5
+    python -m spider.rating show dificuldade.spdi --score 0.9:1
+"""
+
+from __future__ import annotations
+import argparse
+import heapq
+import mmap
+import os
+import random
+import struct
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .batch import parse_seed_range, shards
+from .compact import SUIT_BIT, VALUE_MASK
+from .deals import SHUFFLE_VERSION, DealCatalog, deal_order
+from .vecsim import BatchSim, rollout, seed_keys
+
+RECORD = np.dtype([
+    ("score", "<u2"),         # dificuldade quantizada (0 = mais fácil)
+    ("seed", "<u8"),
+    ("wins", "u1"),           # sondagens vencidas
+    ("removed10", "u1"),      # média de sequências removidas x 10
+    ("hidden", "u1"),         # média de cartas viradas para baixo no fim
+    ("moves0", "u1"),         # jogadas disponíveis no início
+    ("buried_kings", "u1"),
+    ("adjacency", "u1"),      # pares mesmo naipe em sequência nas colunas
+])
+SCORE_MAX = 0xFFFF
+HIDDEN_START = 44             # cartas viradas para baixo na distribuição inicial
+
+INDEX_MAGIC = b"SPDI"
+INDEX_VERSION = 1
+# magic, versão, versão do embaralhamento, sondagens, máx. jogadas, quantidade
+_INDEX_HEAD = struct.Struct("<4sBBBHQ")
+_HEAD_SIZE = 32
+# limites dos campos: sondagens (u8 no cabeçalho e `wins` u8) e máx. jogadas (u16)
+MAX_ROLLOUTS = 0xFF
+MAX_MOVES = 0xFFFF
+
+# Faixas nomeadas por percentil da pontuação
+BANDS: Dict[str, Tuple[float, float]] = {
+    "facil": (0.0, 0.25),
+    "medio": (0.25, 0.6),
+    "dificil": (0.6, 0.9),
+    "extremo": (0.9, 1.0),
+}
+
+
+class DifficultyIndexError(ValueError):
+    pass
+
+
+# =========================
+# Características e pontuação
+# =========================
+
+def check_params(rollouts: int, max_moves: int) -> None:
+    """ValueError se `rollouts` ou `max_moves` não cabem nos campos do índice."""
+    if not 1 <= rollouts <= MAX_ROLLOUTS:
+        raise ValueError(f"sondagens por seed devem estar entre 1 e {MAX_ROLLOUTS} (recebido {rollouts})")
+    if not 1 <= max_moves <= MAX_MOVES:
+        raise ValueError(f"máx. jogadas deve estar entre 1 e {MAX_MOVES} (recebido {max_moves})")
+
+
+def features(sim: BatchSim) -> Dict[str, np.ndarray]:
+    """Características da posição inicial de cada partida de `sim` (antes de jogar)."""
+    k = np.arange(sim.cards.shape[2])[None, None, :6]
+    codes = sim.cards[:, :, :6] & (VALUE_MASK | SUIT_BIT)
+    valid = k < sim.height[:, :, None]
+    face_down = k < sim.down[:, :, None]
+    kings = (codes & VALUE_MASK) == 13
+    buried_kings = (kings & face_down & (k > 0)).sum(axis=(1, 2))
+    # carta de baixo = carta de cima + 1 no código: mesmo naipe, valor seguinte
+    adjacency = ((codes[:, :, :-1] == codes[:, :, 1:] + 1) & valid[:, :, 1:]).sum(axis=(1, 2))
+    # no início não há colunas vazias e cada sequência do topo tem uma carta:
+    # uma jogada por par (i, j) com topo de j = topo de i + 1
+    tops = (sim.top & VALUE_MASK).astype(np.int8)
+    moves0 = (tops[:, None, :] == tops[:, :, None] + 1).sum(axis=(1, 2))
+    return {"buried_kings": buried_kings, "adjacency": adjacency, "moves0": moves0}
+
+
+def score(wins: np.ndarray, removed: np.ndarray, hidden: np.ndarray, rollouts: int,
+          feats: Dict[str, np.ndarray]) -> np.ndarray:
+    """Dificuldade em [0, 1] a partir das sondagens (peso maior) e das características.
+
+    `removed` e `hidden` são médias por seed. O progresso das sondagens mistura
+    sequências removidas e cartas reveladas; as características só desempatam
+    distribuições com sondagens parecidas.
+    """
+    progress = 0.5 * removed / 8 + 0.5 * (1 - hidden / HIDDEN_START)
+    base = 1 - (0.8 * progress + 0.2 * wins / rollouts)
+    adjust = (0.05 * np.minimum(feats["buried_kings"], 8) / 8
+              - 0.05 * np.minimum(feats["adjacency"], 10) / 10
+              - 0.05 * np.minimum(feats["moves0"], 10) / 10)
+    return np.clip(base + adjust, 0.0, 1.0)
+
+
+def rate_shard(seeds: List[int], rollouts: int = 4, max_moves: int = 300,
+               catalog: Optional[str] = None) -> np.ndarray:
+    """Executado no processo trabalhador: registros (`RECORD`) das seeds do lote.
+
+    As `rollouts` sondagens de todas as seeds rodam juntas num único `BatchSim`
+    (cada seed repetida `rollouts` vezes). Cada sondagem tem o seu gerador,
+    derivado da seed e do número da sondagem: o registro de uma seed não depende
+    do lote em que ela caiu.
+    """
+    check_params(rollouts, max_moves)
+    if catalog is None:
+        deals = [deal_order(s) for s in seeds]
+    else:
+        with DealCatalog(catalog) as cat:
+            deals = [cat.get(s) or deal_order(s) for s in seeds]
+    sim = BatchSim([s for s in seeds for _ in range(rollouts)],
+                   [d for d in deals for _ in range(rollouts)])
+    feats = {name: v[::rollouts] for name, v in features(sim).items()}
+    res = rollout(sim, "greedy", max_moves, keys=seed_keys(seeds, rollouts))
+    shape = (len(seeds), rollouts)
+    wins = res["won"].reshape(shape).sum(axis=1)
+    removed = res["removed"].reshape(shape).mean(axis=1)
+    hidden = sim.down.astype(np.int32).sum(axis=1).reshape(shape).mean(axis=1)
+
+    out = np.zeros(len(seeds), dtype=RECORD)
+    out["seed"] = seeds
+    out["score"] = np.rint(score(wins, removed, hidden, rollouts, feats) * SCORE_MAX)
+    out["wins"] = wins
+    out["removed10"] = np.rint(removed * 10)
+    out["hidden"] = np.rint(hidden)
+    for name, v in feats.items():
+        out[name] = np.minimum(v, 255)
+    return out
+
+
+# =========================
+# Pipeline
+# =========================
+
+def rate_stream(seeds: Iterable[int], workers: int = 1, shard_size: int = 512,
+                rollouts: int = 4, max_moves: int = 300,
+                catalog: Optional[str] = None) -> Iterator[np.ndarray]:
+    """Registros por lote, na ordem em que os lotes terminam.
+
+    No máximo `4 * workers` lotes em voo: a memória não cresce com o intervalo.
+    """
+    if workers <= 1:
+        for shard in shards(seeds, shard_size):
+            yield rate_shard(shard, rollouts, max_moves, catalog)
+        return
+    pending = set()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for shard in shards(seeds, shard_size):
+            pending.add(pool.submit(rate_shard, shard, rollouts, max_moves, catalog))
+            if len(pending) >= workers * 4:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    yield fut.result()
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                yield fut.result()
+
+
+def sorted_runs(chunks: Iterable[np.ndarray], run_size: int, tmpdir: str) -> Iterator[str]:
+    """Junta os lotes em corridas de até `run_size` registros, ordena e grava cada uma."""
+    buf: List[np.ndarray] = []
+    n = k = 0
+    for chunk in chunks:
+        buf.append(chunk)
+        n += len(chunk)
+        if n >= run_size:
+            yield _write_run(buf, tmpdir, k)
+            buf, n, k = [], 0, k + 1
+    if buf:
+        yield _write_run(buf, tmpdir, k)
+
+
+def _write_run(buf: List[np.ndarray], tmpdir: str, k: int) -> str:
+    run = np.sort(np.concatenate(buf), order=("score", "seed"))
+    path = os.path.join(tmpdir, f"run{k:05d}.bin")
+    run.tofile(path)
+    return path
+
+
+def _read_run(path: str, chunk: int = 1 << 16) -> Iterator[tuple]:
+    with open(path, "rb") as f:
+        while True:
+            recs = np.fromfile(f, dtype=RECORD, count=chunk)
+            if not len(recs):
+                return
+            yield from recs.tolist()
+
+
+def merge_runs(paths: List[str], out, chunk: int = 1 << 16) -> int:
+    """Intercala as corridas ordenadas em `out` (arquivo aberto). Retorna a quantidade."""
+    if len(paths) == 1:
+        with open(paths[0], "rb") as f:
+            data = f.read()
+        out.write(data)
+        return len(data) // RECORD.itemsize
+    total = 0
+    buf: List[tuple] = []
+    # tuplas (score, seed, ...) comparam na ordem do índice; seeds não se repetem
+    for rec in heapq.merge(*(_read_run(p) for p in paths)):
+        buf.append(rec)
+        if len(buf) >= chunk:
+            out.write(np.array(buf, dtype=RECORD).tobytes())
+            total += len(buf)
+            buf.clear()
+    if buf:
+        out.write(np.array(buf, dtype=RECORD).tobytes())
+        total += len(buf)
+    return total
+
+
+def build_index(seeds: Iterable[int], out: str, workers: int = 1, shard_size: int = 512,
+                rollouts: int = 4, max_moves: int = 300, run_size: int = 1_000_000,
+                catalog: Optional[str] = None) -> int:
+    """Classifica `seeds` e grava o índice ordenado em `out`. Retorna a quantidade."""
+    check_params(rollouts, max_moves)
+    d = os.path.dirname(os.path.abspath(out))
+    os.makedirs(d, exist_ok=True)
+    tmp_out = out + ".tmp"
+    with tempfile.TemporaryDirectory(dir=d) as tmpdir:
+        chunks = rate_stream(seeds, workers, shard_size, rollouts, max_moves, catalog)
+        runs = list(sorted_runs(chunks, run_size, tmpdir))
+        with open(tmp_out, "wb") as f:
+            f.write(bytes(_HEAD_SIZE))
+            count = merge_runs(runs, f) if runs else 0
+            f.seek(0)
+            f.write(_INDEX_HEAD.pack(INDEX_MAGIC, INDEX_VERSION, SHUFFLE_VERSION,
+                                     rollouts, max_moves, count))
+    os.replace(tmp_out, out)
+    return count
+
+
+# =========================
+# Leitura
+# =========================
+
+class DifficultyIndex:
+    """Índice de dificuldade via `mmap`, ordenado por (pontuação, seed)."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._f = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._f.close()
+            raise DifficultyIndexError(f"{path}: arquivo vazio")
+        magic, version, shuffle, self.rollouts, self.max_moves, self.count = \
+            _INDEX_HEAD.unpack_from(self._mm, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self.close()
+            raise DifficultyIndexError(f"{path}: não é um índice de dificuldade (versão {INDEX_VERSION})")
+        if shuffle != SHUFFLE_VERSION:
+            self.close()
+            raise DifficultyIndexError(f"{path}: embaralhamento versão {shuffle}, esperado {SHUFFLE_VERSION}")
+        if len(self._mm) < _HEAD_SIZE + self.count * RECORD.itemsize:
+            self.close()
+            raise DifficultyIndexError(f"{path}: arquivo truncado")
+        self.records = np.frombuffer(self._mm, dtype=RECORD, count=self.count, offset=_HEAD_SIZE)
+        self._scores = self.records["score"]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def bisect(self, score: float) -> int:
+        """Primeira posição com pontuação >= `score` (busca binária, O(log n))."""
+        q = int(round(score * SCORE_MAX))
+        lo, hi = 0, self.count
+        scores = self._scores
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if scores[mid] < q:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def score_range(self, lo: float, hi: float) -> Tuple[int, int]:
+        """Posições [início, fim) com pontuação em [lo, hi]."""
+        stop = self.count if hi >= 1.0 else self.bisect(hi + 1 / SCORE_MAX)
+        return self.bisect(lo), stop
+
+    def band_range(self, band: str) -> Tuple[int, int]:
+        """Posições [início, fim) de uma faixa de `BANDS` (por percentil, O(1))."""
+        lo, hi = BANDS[band]
+        return int(lo * self.count), int(hi * self.count)
+
+    def record(self, i: int) -> Dict:
+        rec = self.records[i]
+        out = {name: int(rec[name]) for name in RECORD.names}
+        out["score"] = out["score"] / SCORE_MAX
+        return out
+
+    def pick(self, start: int, stop: int, rng: Optional[random.Random] = None) -> Optional[int]:
+        """Seed ao acaso entre as posições [start, stop)."""
+        if stop <= start:
+            return None
+        i = (rng or random).randrange(start, stop)
+        return int(self.records[i]["seed"])
+
+    def close(self) -> None:
+        # as views do numpy precisam sair antes de fechar o mmap; se quem chamou
+        # ainda guarda alguma, o mmap fecha quando ela for coletada
+        self.records = self._scores = None
+        try:
+            self._mm.close()
+        except BufferError:
+            pass
+        self._f.close()
+
+    def __enter__(self) -> "DifficultyIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Índice de dificuldade das distribuições do Spider.")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="classifica um intervalo de seeds")
+    b.add_argument("--seeds", default="0:10000", help='intervalo "A:B" (B exclusivo)')
+    b.add_argument("--out", default="dificuldade.spdi")
+    b.add_argument("--workers", type=int, default=None)
+    b.add_argument("--shard-size", type=int, default=512)
+    b.add_argument("--rollouts", type=int, default=4, help="sondagens greedy por seed")
+    b.add_argument("--max-moves", type=int, default=300)
+    b.add_argument("--run-size", type=int, default=1_000_000,
+                   help="registros por corrida ordenada em memória")
+    b.add_argument("--catalog", default=None,
+                   help="catálogo de distribuições (python -m spider.deals build)")
+    s = sub.add_parser("show", help="consulta o índice")
+    s.add_argument("path")
+    g = s.add_mutually_exclusive_group()
+    g.add_argument("--band", choices=tuple(BANDS))
+    g.add_argument("--score", help='faixa de pontuação "A:B" em [0, 1]')
+    s.add_argument("--count", type=int, default=5, help="seeds sorteadas da faixa")
+    args = parser.parse_args()
+
+    if args.cmd == "build":
+        try:
+            check_params(args.rollouts, args.max_moves)
+        except ValueError as e:
+            parser.error(str(e))
+        t0 = time.perf_counter()
+        n = build_index(parse_seed_range(args.seeds), args.out, args.workers or os.cpu_count() or 1,
+                        args.shard_size, args.rollouts, args.max_moves, args.run_size, args.catalog)
+        elapsed = time.perf_counter() - t0
+        print(f"{n} seeds em {elapsed:.1f}s ({n / elapsed:,.0f}/s) -> {args.out}")
+        return
+
+    with DifficultyIndex(args.path) as index:
+        n = len(index)
+        if not n:
+            print("índice vazio")
+            return
+        if args.band is None and args.score is None:
+            print(f"{n} seeds ({index.rollouts} sondagens de até {index.max_moves} jogadas)")
+            for name in BANDS:
+                start, stop = index.band_range(name)
+                if stop > start:
+                    print(f"  {name:8s} pontuação {index.record(start)['score']:.3f}"
+                          f" - {index.record(stop - 1)['score']:.3f} ({stop - start} seeds)")
+            return
+        if args.band is not None:
+            start, stop = index.band_range(args.band)
+        else:
+            a, _, z = args.score.partition(":")
+            start, stop = index.score_range(float(a), float(z or 1))
+        print(f"{stop - start} seeds na faixa")
+        rng = random.Random()
+        for _ in range(min(args.count, stop - start)):
+            i = rng.randrange(start, stop)
+            print(index.record(i))
+
+
+if __name__ == "__main__":
+    main()
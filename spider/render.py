@@ -0,0 +1,567 @@
+"""
+Renderização em lote da mesa (Arcade).
+
+- Texturas desenhadas com Pillow: uma por face (valor x naipe), verso, monte
+  do estoque e contornos. Cada uma é gerada na primeira vez que aparece na
+  mesa, ou recortada de uma folha PNG em cache no disco (chave: tamanhos,
+  cores, fonte). Todas vão para um único atlas de texturas do renderer.
+- `TableRenderer` mantém `SpriteList`s: a mesa só é remontada quando o modelo
+  muda (`invalidate()`); durante o arraste só as posições das cartas
+  arrastadas são atualizadas.
+- Contornos fixos das colunas em um `ShapeElementList`.
+- Textos (HUD e contador do estoque) montados com sprites de glifos
+  rasterizados uma vez por caractere (`GlyphCache`): trocar a string só
+  reposiciona sprites, sem layout nem shaping de fonte por quadro.
+- Um sprite por carta, reaproveitado entre remontagens; com um `Animator`
+  (spider.anim) as cartas deslizam da posição exibida até a nova.
+- Trocar o tamanho das cartas (`TableRenderer.set_textures`) não gera nada
+  adiantado: só as texturas que aparecem no próximo quadro são desenhadas.
+"""
+
+from __future__ import annotations
+import functools
+import hashlib
+import math
+import os
+from typing import Dict, List, Optional, Tuple
+
+import arcade
+from arcade.shape_list import ShapeElementList, create_rectangle_outline
+from PIL import Image, ImageDraw, ImageFont
+
+from .anim import Animator
+from .core import Card, Game, Suit
+
+FONT_PATH = ":system:fonts/ttf/Liberation/Liberation_Sans_Regular.ttf"
+
+# pontos (arcade/pyglet, 96 dpi) -> pixels (Pillow)
+_PT_TO_PX = 96 / 72
+
+# Muda quando o desenho das texturas muda (invalida as folhas em cache)
+TEXTURE_VERSION = 1
+
+# Atlas único da mesa: cartas, verso, estoque e glifos (cresce sozinho se preciso)
+ATLAS_SIZE = (1024, 1024)
+
+# Glifos rasterizados e enviados ao atlas na criação do renderer
+GLYPH_PRELOAD = "0123456789:"
+
+# Mudanças com mais cartas fora do lugar que isto são aplicadas sem animação
+MAX_ANIMATED = 40
+# Intervalo entre as cartas de uma distribuição (s)
+DEAL_STAGGER = 0.03
+
+
+def _rgba(color) -> Tuple[int, int, int, int]:
+    c = tuple(color)
+    return c if len(c) == 4 else (*c, 255)
+
+
+@functools.lru_cache(maxsize=None)
+def _font(size_pt: float) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(str(arcade.resources.resolve(FONT_PATH)),
+                              round(size_pt * _PT_TO_PX))
+
+
+def _outlined(w: int, h: int, fill, border, border_w: int) -> Image.Image:
+    img = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    d = ImageDraw.Draw(img)
+    d.rectangle([0, 0, w - 1, h - 1], fill=_rgba(fill) if fill else None,
+                outline=_rgba(border), width=border_w)
+    return img
+
+
+def draw_face(card_w: int, card_h: int, label: str, text_color,
+              card_color, border_color, font_size: float) -> Image.Image:
+    """Face da carta: fundo, borda e rótulo nos cantos inferior esquerdo e superior direito.
+
+    Margens proporcionais ao tamanho (6 px e linha de base a 22 px em 80x110).
+    """
+    img = _outlined(card_w, card_h, card_color, border_color, 2 if card_w >= 40 else 1)
+    d = ImageDraw.Draw(img)
+    font = _font(font_size)
+    pad = max(2, round(card_w * 0.075))
+    # canto inferior esquerdo e superior direito (linha de base como no draw_text)
+    d.text((pad, card_h - pad), label, font=font, fill=_rgba(text_color), anchor="ls")
+    d.text((card_w - pad, round(card_h * 0.2)), label, font=font, fill=_rgba(text_color), anchor="rs")
+    return img
+
+
+def draw_back(card_w: int, card_h: int, back_color, border_color) -> Image.Image:
+    """Verso: molduras, X central e uma aranha desenhada (sem glifo de emoji).
+
+    Medidas de referência em 80x110, escaladas para outros tamanhos.
+    """
+    sx, sy = card_w / 80, card_h / 110
+
+    def px(v: float) -> int:
+        return round(v * sx)
+
+    def py(v: float) -> int:
+        return round(v * sy)
+
+    gray = _rgba(arcade.color.LIGHT_GRAY)
+    img = _outlined(card_w, card_h, back_color, border_color, 2 if card_w >= 40 else 1)
+    d = ImageDraw.Draw(img)
+    d.rectangle([px(5), py(5), card_w - 1 - px(5), card_h - 1 - py(5)], outline=gray, width=1)
+
+    cl, ct = px(13), py(20)
+    cr, cb = card_w - px(14), card_h - py(21)
+    d.rectangle([cl, ct, cr, cb], fill=_rgba(arcade.color.DARK_BLUE_GRAY), outline=gray, width=1)
+    d.line([cl + px(6), cb - py(6), cr - px(6), ct + py(6)], fill=gray, width=1)
+    d.line([cl + px(6), ct + py(6), cr - px(6), cb - py(6)], fill=gray, width=1)
+
+    cx, cy = card_w / 2, card_h / 2 + 8 * sy
+    for side in (-1, 1):
+        for k, (dx, dy) in enumerate(((9, -9), (11, -2), (11, 4), (9, 10))):
+            knee = (cx + side * dx * 0.6 * sx, cy + (k - 1.5) * 2 * sy)
+            d.line([(cx, cy), knee, (cx + side * dx * sx, cy + dy * sy)], fill=gray, width=1)
+    d.ellipse([cx - 4 * sx, cy - 2 * sy, cx + 4 * sx, cy + 8 * sy], fill=gray)
+    d.ellipse([cx - 3 * sx, cy - 7 * sy, cx + 3 * sx, cy - 1 * sy], fill=gray)
+    return img
+
+
+def draw_stock(stock_w: int, stock_h: int, back_color, border_color) -> Image.Image:
+    img = _outlined(stock_w, stock_h, back_color, border_color, 2 if stock_w >= 40 else 1)
+    d = ImageDraw.Draw(img)
+    mx, my = round(stock_w / 15), round(stock_h / 15)
+    d.rectangle([mx, my, stock_w - 1 - mx, stock_h - 1 - my], outline=_rgba(arcade.color.LIGHT_GRAY),
+                width=1)
+    return img
+
+
+def _texture_names(suits: Tuple[str, ...]) -> List[str]:
+    names = [f"{suit}{value}" for suit in suits for value in range(1, 14)]
+    return names + ["back", "stock", "stock-empty"]
+
+
+class CardTextures:
+    """Texturas das faces (13 valores x naipes da variante), do verso e do estoque.
+
+    Nada é desenhado no construtor: cada textura nasce no primeiro
+    `for_card`/`back`/`stock`. Com `cache_dir`, uma folha PNG com todas as
+    texturas (arquivo por chave de tamanhos, cores, fonte e naipes) é lida se
+    existir; `save_cache()` a grava depois de desenhar as que faltarem.
+    """
+
+    SHEET_COLS = 8
+
+    def __init__(self, card_w: int, card_h: int, stock_w: int, stock_h: int,
+                 card_color, back_color, border_color,
+                 suit_colors: Dict[str, tuple], font_size: float,
+                 cache_dir: Optional[str] = None,
+                 suits: Tuple[str, ...] = (Suit.S, Suit.H)) -> None:
+        self.card_w, self.card_h = card_w, card_h
+        self.stock_w, self.stock_h = stock_w, stock_h
+        self.card_color = card_color
+        self.back_color = back_color
+        self.border_color = border_color
+        self.suit_colors = suit_colors
+        self.font_size = font_size
+        self.names = _texture_names(suits)
+        params = (TEXTURE_VERSION, FONT_PATH, card_w, card_h, stock_w, stock_h,
+                  _rgba(card_color), _rgba(back_color), _rgba(border_color),
+                  sorted((k, _rgba(v)) for k, v in suit_colors.items()), font_size, suits)
+        self.key = hashlib.sha1(repr(params).encode()).hexdigest()[:16]
+        self.cache_path = os.path.join(cache_dir, f"cards-{self.key}.png") if cache_dir else None
+
+        self._textures: Dict[str, arcade.Texture] = {}
+        self._images: Dict[str, Image.Image] = {}
+        self._sheet: Optional[Image.Image] = None
+        self.drawn = 0  # texturas desenhadas com Pillow (as da folha não contam)
+        if self.cache_path and os.path.exists(self.cache_path):
+            try:
+                with Image.open(self.cache_path) as img:
+                    sheet = img.convert("RGBA")
+                if sheet.size == self._sheet_size():
+                    self._sheet = sheet
+            except OSError:
+                pass  # folha corrompida: desenha de novo e regrava em save_cache
+
+    # ---------- folha em cache ----------
+    def _cell(self) -> Tuple[int, int]:
+        return max(self.card_w, self.stock_w), max(self.card_h, self.stock_h)
+
+    def _sheet_size(self) -> Tuple[int, int]:
+        cw, ch = self._cell()
+        rows = math.ceil(len(self.names) / self.SHEET_COLS)
+        return cw * self.SHEET_COLS, ch * rows
+
+    def _origin(self, name: str) -> Tuple[int, int]:
+        k = self.names.index(name)
+        cw, ch = self._cell()
+        return (k % self.SHEET_COLS) * cw, (k // self.SHEET_COLS) * ch
+
+    def _size(self, name: str) -> Tuple[int, int]:
+        if name.startswith("stock"):
+            return self.stock_w, self.stock_h
+        return self.card_w, self.card_h
+
+    def _draw(self, name: str) -> Image.Image:
+        if name == "back":
+            return draw_back(self.card_w, self.card_h, self.back_color, self.border_color)
+        if name == "stock":
+            return draw_stock(self.stock_w, self.stock_h, self.back_color, self.border_color)
+        if name == "stock-empty":
+            return _outlined(self.stock_w, self.stock_h, None, arcade.color.LIGHT_GRAY, 2)
+        suit, value = name[0], int(name[1:])
+        return draw_face(self.card_w, self.card_h, Card(value, suit).label(),
+                         self.suit_colors.get(suit, arcade.color.BLACK),
+                         self.card_color, self.border_color, self.font_size)
+
+    def _image(self, name: str) -> Image.Image:
+        img = self._images.get(name)
+        if img is None:
+            if self._sheet is not None:
+                x, y = self._origin(name)
+                w, h = self._size(name)
+                img = self._sheet.crop((x, y, x + w, y + h))
+            else:
+                img = self._draw(name)
+                self.drawn += 1
+            self._images[name] = img
+        return img
+
+    def texture(self, name: str) -> arcade.Texture:
+        tex = self._textures.get(name)
+        if tex is None:
+            tex = arcade.Texture(self._image(name), hit_box_algorithm=arcade.hitbox.algo_bounding_box,
+                                 hash=f"spider-{self.key}-{name}")
+            self._textures[name] = tex
+        return tex
+
+    def save_cache(self) -> bool:
+        """Grava a folha com todas as texturas (desenha as que faltam). False se não há o que gravar."""
+        if not self.cache_path or self._sheet is not None:
+            return False
+        sheet = Image.new("RGBA", self._sheet_size(), (0, 0, 0, 0))
+        for name in self.names:
+            sheet.paste(self._image(name), self._origin(name))
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp = f"{self.cache_path}.{os.getpid()}.tmp"
+        sheet.save(tmp, format="PNG")
+        os.replace(tmp, self.cache_path)
+        self._sheet = sheet
+        return True
+
+    # ---------- acesso ----------
+    @property
+    def back(self) -> arcade.Texture:
+        return self.texture("back")
+
+    @property
+    def stock(self) -> arcade.Texture:
+        return self.texture("stock")
+
+    @property
+    def stock_empty(self) -> arcade.Texture:
+        return self.texture("stock-empty")
+
+    def for_card(self, card: Card) -> arcade.Texture:
+        return self.texture(f"{card.suit}{card.value}" if card.face_up else "back")
+
+
+class GlyphCache:
+    """Glifos de uma fonte rasterizados com Pillow, um por caractere, na primeira vez que aparecem.
+
+    Brancos sobre fundo transparente: a cor vem do `color` do sprite.
+    """
+
+    PAD = 1
+
+    def __init__(self, font_size: float) -> None:
+        self.font_size = font_size
+        self.font = _font(font_size)
+        self.ascent, self.descent = self.font.getmetrics()
+        self._glyphs: Dict[str, Tuple[Optional[arcade.Texture], float]] = {}
+
+    def glyph(self, ch: str) -> Tuple[Optional[arcade.Texture], float]:
+        """(textura ou None para espaço em branco, avanço em pixels)."""
+        g = self._glyphs.get(ch)
+        if g is None:
+            advance = self.font.getlength(ch)
+            tex = None
+            if not ch.isspace():
+                w = max(1, math.ceil(advance)) + 2 * self.PAD
+                img = Image.new("RGBA", (w, self.ascent + self.descent), (0, 0, 0, 0))
+                ImageDraw.Draw(img).text((self.PAD, self.ascent), ch, font=self.font,
+                                         fill=(255, 255, 255, 255), anchor="ls")
+                tex = arcade.Texture(img, hit_box_algorithm=arcade.hitbox.algo_bounding_box,
+                                     hash=f"spider-glyph-{self.font_size}-{ord(ch)}")
+            g = self._glyphs[ch] = (tex, advance)
+        return g
+
+    def width(self, text: str) -> float:
+        return sum(self.glyph(ch)[1] for ch in text)
+
+
+class SpriteText:
+    """Linha de texto feita de sprites de glifos (`GlyphCache`).
+
+    `y` é a linha de base, como no `arcade.Text`. Trocar o texto reaproveita os
+    sprites existentes (só textura e posição mudam).
+    """
+
+    def __init__(self, glyphs: GlyphCache, x: float, y: float, color=arcade.color.WHITE,
+                 anchor_x: str = "left", atlas=None) -> None:
+        self.glyphs = glyphs
+        self.x, self.y = x, y
+        self.anchor_x = anchor_x
+        self.sprites = arcade.SpriteList(atlas=atlas)
+        self.text = ""
+        self.color = color
+
+    def set(self, text: str, color=None) -> None:
+        if color is not None and color != self.color:
+            self.color = color
+            for sprite in self.sprites:
+                sprite.color = color
+        if text == self.text:
+            return
+        self.text = text
+        glyphs = self.glyphs
+        x = self.x
+        if self.anchor_x == "center":
+            x -= glyphs.width(text) / 2
+        elif self.anchor_x == "right":
+            x -= glyphs.width(text)
+        # centro vertical dos glifos: a imagem vai de y - descent a y + ascent
+        cy = self.y + (glyphs.ascent - glyphs.descent) / 2
+        sprites = self.sprites
+        k = 0
+        for ch in text:
+            tex, advance = glyphs.glyph(ch)
+            if tex is not None:
+                cx = round(x) - glyphs.PAD + tex.width / 2
+                if k < len(sprites):
+                    sprite = sprites[k]
+                    sprite.texture = tex
+                    sprite.position = (cx, cy)
+                else:
+                    sprite = arcade.Sprite(tex, center_x=cx, center_y=cy)
+                    sprite.color = self.color
+                    sprites.append(sprite)
+                k += 1
+            x += advance
+        while len(sprites) > k:
+            sprites.pop()
+
+    def draw(self) -> None:
+        self.sprites.draw()
+
+
+class TableRenderer:
+    """Desenha a mesa com poucas chamadas por quadro.
+
+    `card_pos(ci, idx) -> (x, y)` e `slot_pos(ci) -> (x, y)` são as mesmas
+    funções de layout usadas no hit-test.
+
+    Cada carta tem um sprite persistente. Com um `Animator`, remontar a mesa
+    compara a posição de cada sprite com a nova e anima a diferença: cartas
+    distribuídas saem do estoque, sequências removidas vão para a pilha em
+    `removed_pos`, cartas que voltam ao estoque (undo) voam até ele. Mudanças
+    grandes (reinício, mais de `MAX_ANIMATED` cartas) são aplicadas direto.
+    """
+
+    def __init__(self, textures: CardTextures, card_pos, slot_pos,
+                 card_w: int, card_h: int, stock_pos: Tuple[float, float],
+                 stock_h: int, font_size: float,
+                 removed_pos: Optional[Tuple[float, float]] = None, removed_dy: float = 0.0,
+                 animator: Optional[Animator] = None) -> None:
+        self.tex = textures
+        self.card_pos = card_pos
+        self.slot_pos = slot_pos
+        self.card_w = card_w
+        self.card_h = card_h
+        self.stock_pos = stock_pos
+        self.removed_pos = removed_pos
+        self.removed_dy = removed_dy
+        self.anim = animator
+
+        self.atlas = arcade.DefaultTextureAtlas(ATLAS_SIZE)
+        self.table = arcade.SpriteList(atlas=self.atlas)
+        self.leaving = arcade.SpriteList(atlas=self.atlas)
+        self.dragged = arcade.SpriteList(atlas=self.atlas)
+        self.slots = ShapeElementList()
+        self._slots_built = False
+        self._built = False
+        self._dirty = True
+        self._drag_key: Optional[Tuple[int, int]] = None
+        self._drag_cards: Optional[List[Card]] = None
+        # id(carta) -> (carta, sprite); a carta fica referenciada para o id não ser reutilizado
+        self._sprites: Dict[int, Tuple[Card, arcade.Sprite]] = {}
+        # id(sprite) -> id(carta) dos sprites voltando ao estoque
+        self._leaving: Dict[int, int] = {}
+
+        glyphs = GlyphCache(font_size)
+        self.stock_text = SpriteText(glyphs, stock_pos[0], stock_pos[1] - stock_h / 2 - 24,
+                                     anchor_x="center", atlas=self.atlas)
+        self.hud_text = SpriteText(glyphs, 20, 20, atlas=self.atlas)
+        # Dígitos já no atlas: o timer e os contadores mudam com a mesa sendo
+        # desenhada, e escrever no atlas nesse momento espera a GPU
+        for ch in GLYPH_PRELOAD:
+            tex = glyphs.glyph(ch)[0]
+            if tex is not None:
+                self.atlas.add(tex)
+
+    @property
+    def animating(self) -> bool:
+        return self.anim is not None and self.anim.busy
+
+    def invalidate(self) -> None:
+        """O modelo mudou: remonta a mesa no próximo quadro."""
+        self._dirty = True
+
+    def set_textures(self, textures: CardTextures) -> None:
+        """Troca o jogo de texturas (ex.: outro tamanho de carta).
+
+        As novas texturas são geradas (ou lidas do cache) à medida que o
+        próximo quadro as usa e entram no mesmo atlas.
+        """
+        self.tex = textures
+        self.card_w, self.card_h = textures.card_w, textures.card_h
+        self.slots.clear()
+        self._slots_built = False
+        drag_col, drag_idx = self._drag_key or (-1, -1)
+        self.set_drag(self._drag_cards, drag_col, drag_idx)
+
+    def _build_slots(self, n_cols: int) -> None:
+        for ci in range(n_cols):
+            x, y = self.slot_pos(ci)
+            self.slots.append(create_rectangle_outline(x, y, self.card_w, self.card_h,
+                                                       arcade.color.BLACK, 1))
+        self._slots_built = True
+
+    def _sprite(self, card: Card) -> arcade.Sprite:
+        entry = self._sprites.get(id(card))
+        if entry is None:
+            sprite = arcade.Sprite(self.tex.for_card(card))
+            self._sprites[id(card)] = (card, sprite)
+        else:
+            sprite = entry[1]
+            sprite.texture = self.tex.for_card(card)
+        return sprite
+
+    def _left(self, sprite: arcade.Sprite) -> None:
+        """Fim da animação de uma carta que voltou ao estoque."""
+        key = self._leaving.pop(id(sprite), None)
+        if key is not None:
+            self.leaving.remove(sprite)
+            self._sprites.pop(key, None)
+
+    def _rebuild(self, game: Game, drag_col: int, drag_idx: int) -> None:
+        table = self.table
+        table.clear()
+        stock_n = len(game.stock.cards)
+        sx, sy = self.stock_pos
+        if stock_n > 0:
+            for i in range(min(3, stock_n)):
+                table.append(arcade.Sprite(self.tex.stock, center_x=sx + i * 3, center_y=sy + i * 3))
+            self.stock_text.set(f"{stock_n}", arcade.color.WHITE)
+        else:
+            table.append(arcade.Sprite(self.tex.stock_empty, center_x=sx, center_y=sy))
+            self.stock_text.set("Vazio", arcade.color.LIGHT_GRAY)
+
+        old = self._sprites
+        new: Dict[int, Tuple[Card, arcade.Sprite]] = {}
+        moving: List[Tuple[arcade.Sprite, float, float, bool]] = []
+
+        def place(card: Card, x: float, y: float) -> None:
+            entry = old.get(id(card))
+            sprite = self._sprite(card)
+            new[id(card)] = (card, sprite)
+            table.append(sprite)
+            if self._leaving.pop(id(sprite), None) is not None:
+                self.leaving.remove(sprite)
+            if entry is None or (sprite.position != (x, y) and not (
+                    self.anim is not None and self.anim.target(sprite) == (x, y))):
+                moving.append((sprite, x, y, entry is None))
+
+        for ci, col in enumerate(game.columns):
+            stop = drag_idx if ci == drag_col else len(col.cards)
+            for idx in range(stop):
+                x, y = self.card_pos(ci, idx)
+                place(col.cards[idx], x, y)
+        if self.removed_pos is not None:
+            rx, ry = self.removed_pos
+            for r, run in enumerate(game.removed_runs):
+                # Ás por baixo, rei por cima
+                for card in reversed(run):
+                    place(card, rx, ry + r * self.removed_dy)
+        for card in self._drag_cards or ():
+            new[id(card)] = old.get(id(card)) or (card, self._sprite(card))
+
+        gone = [(key, entry) for key, entry in old.items() if key not in new]
+        anim = self.anim
+        if anim is not None and self._built and len(moving) + len(gone) <= MAX_ANIMATED:
+            fresh = 0
+            for sprite, x, y, from_stock in moving:
+                if from_stock:
+                    anim.move(sprite, self.stock_pos, (x, y), delay=fresh * DEAL_STAGGER)
+                    fresh += 1
+                else:
+                    anim.move(sprite, sprite.position, (x, y))
+            for key, (card, sprite) in gone:
+                new[key] = (card, sprite)
+                if id(sprite) not in self._leaving:
+                    self._leaving[id(sprite)] = key
+                    self.leaving.append(sprite)
+                    anim.move(sprite, sprite.position, self.stock_pos, on_done=self._left)
+        else:
+            if anim is not None:
+                anim.finish()
+            self.leaving.clear()
+            self._leaving.clear()
+            for sprite, x, y, _ in moving:
+                sprite.position = (x, y)
+        self._sprites = new
+        self._built = True
+        self._dirty = False
+
+    def set_drag(self, cards: Optional[List[Card]], drag_col: int = -1, drag_idx: int = -1) -> None:
+        """Inicia/encerra o arraste: as cartas arrastadas saem da mesa.
+
+        Ao soltar, a próxima remontagem anima as cartas de onde foram soltas
+        até o destino (ou de volta à origem).
+        """
+        self.dragged.clear()
+        self._drag_cards = cards
+        if cards:
+            for card in cards:
+                sprite = self._sprite(card)
+                if self.anim is not None:
+                    self.anim.cancel(sprite)
+                self.dragged.append(sprite)
+            self._drag_key = (drag_col, drag_idx)
+        else:
+            self._drag_key = None
+        self._dirty = True
+
+    def move_drag(self, ci: int, idx: int, dx: float, dy: float) -> None:
+        for k, sprite in enumerate(self.dragged):
+            x, y = self.card_pos(ci, idx + k)
+            sprite.center_x = x + dx
+            sprite.center_y = y + dy
+
+    def update(self, game: Game, dt: float) -> None:
+        """Remonta a mesa se o modelo mudou e avança as animações (uma vez por `on_update`)."""
+        if self._dirty:
+            drag_col, drag_idx = self._drag_key or (-1, -1)
+            self._rebuild(game, drag_col, drag_idx)
+        if self.anim is not None:
+            self.anim.update(dt)
+
+    def draw(self, game: Game, hud: str) -> None:
+        if not self._slots_built:
+            self._build_slots(len(game.columns))
+        if self._dirty:
+            drag_col, drag_idx = self._drag_key or (-1, -1)
+            self._rebuild(game, drag_col, drag_idx)
+        self.hud_text.set(hud)
+
+        self.slots.draw()
+        self.table.draw()
+        self.leaving.draw()
+        self.stock_text.draw()
+        self.dragged.draw()
+        self.hud_text.draw()
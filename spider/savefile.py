@@ -0,0 +1,486 @@
+"""
+Gravação de sessões e replays em formato binário (sem Arcade).
+
+Arquivo = cabeçalho + registros, só acrescentados ao fim:
+
+    cabeçalho  b"SPDR" + versão (1 byte)
+    V          b"V" + número de naipes (u16)   só antes de G de variantes que não a de 2 naipes
+    G          b"G" + seed (u64) + tamanho (u16) + instantâneo da posição inicial
+    M          b"M" + código da jogada (u16, o mesmo do histórico; DEAL_CODE = distribuição)
+    U          b"U" + 0 (u16)   undo
+    R          b"R" + 0 (u16)   redo
+    T          b"T" + segundos de jogo (u16)   tempo da partida até aqui (não é ação)
+
+O instantâneo é `Game.snapshot()` (colunas, estoque, faces, `removed_sequences`).
+Cada ação custa 3 bytes e um `write` + `flush`; um registro incompleto no fim
+(queda no meio da escrita) é ignorado na leitura. O tempo vai junto das ações
+no máximo a cada `TIME_EVERY` s (e ao fechar), então retomar uma partida
+recupera o timer e o número de ações.
+
+A leitura usa `mmap`: um arquivo com muitas partidas é percorrido registro a
+registro sem ser carregado na memória. Uma posição é refeita pela seed (ou
+pelo instantâneo inicial) mais um prefixo das ações.
+
+Ao lado do arquivo, `<arquivo>.last` guarda o offset e o índice do último
+registro G (e o tamanho do arquivo logo depois dele): abrir o arquivo para
+continuar gravando e achar a partida a retomar só percorrem a última partida,
+não o arquivo inteiro. Sem ele (ou se não confere), o arquivo é percorrido
+desde o início.
+
+    python -m spider.savefile sessoes.spdr [--game K] [--prefix N]
+"""
+
+from __future__ import annotations
+import argparse
+import mmap
+import os
+import struct
+from array import array
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+from .core import TWO_SUITS, VARIANTS, Game, Variant
+
+MAGIC = b"SPDR"
+FORMAT_VERSION = 1
+HEADER = MAGIC + bytes([FORMAT_VERSION])
+
+TAG_VARIANT = ord("V")
+TAG_GAME = ord("G")
+TAG_MOVE = ord("M")
+TAG_UNDO = ord("U")
+TAG_REDO = ord("R")
+TAG_TIME = ord("T")
+
+_GAME_HEAD = struct.Struct("<BQH")   # tag, seed, tamanho do instantâneo
+_ACTION = struct.Struct("<BH")       # tag, código
+_LAST = struct.Struct("<QQQ")        # .last: offset do último V/G, índice da partida, tamanho do arquivo
+_MAX_TIME = 0xFFFF                   # segundos (u16), ~18 h
+
+# Intervalo mínimo (s de jogo) entre registros T gravados por `sync`
+TIME_EVERY = 5
+
+
+class SaveFormatError(ValueError):
+    pass
+
+
+# =========================
+# Escrita
+# =========================
+
+class SessionWriter:
+    """Acrescenta partidas e ações a um arquivo de sessão.
+
+    `sync(game)` escreve só o que mudou desde a última gravação (normalmente uma
+    ação): undo/redo pelo cursor e as jogadas novas além do que já foi gravado,
+    sem percorrer o histórico. Só depois de um corte (`History.cuts`: jogada
+    após undo) o prefixo comum é achado por comparação. Um novo objeto de
+    histórico (ex.: `Game.reset`) inicia um novo registro G.
+
+    `sync(game, elapsed)` também grava o tempo de jogo (registro T) quando ele
+    avançou `TIME_EVERY` s desde o último; `write_time` grava na hora.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        d = os.path.dirname(os.path.abspath(path))
+        os.makedirs(d, exist_ok=True)
+        last = _drop_partial_tail(path)
+        self._next_index = last.index + 1 if last is not None else 0
+        self._f = open(path, "ab")
+        if self._f.tell() == 0:
+            self._f.write(HEADER)
+            self._f.flush()
+        self._hist = None
+        self._codes = array("H")   # códigos já gravados (até onde o cursor chegou)
+        self._pos = 0
+        self._cuts = 0
+        self._time = 0   # último tempo gravado (s)
+
+    def start(self, game: Game) -> None:
+        """Registra o início de uma partida na posição atual de `game`.
+
+        Jogadas já existentes no histórico são gravadas em seguida.
+        """
+        snap = game.snapshot() if not game.historico.pos else _initial_snapshot(game)
+        offset = self._f.tell()
+        self._f.write(_game_record(game, snap))
+        self._f.flush()
+        _write_last(self.path, offset, self._next_index, self._f.tell())
+        self._next_index += 1
+        self._hist = game.historico
+        self._codes = array("H")
+        self._pos = 0
+        self._cuts = game.historico.cuts
+        self._time = 0
+        self._write_diff(game)
+
+    def resume(self, game: Game, elapsed: float = 0.0) -> None:
+        """Continua gravando a partida que já é a última do arquivo (ex.: vinda de `load_latest`)."""
+        self._hist = game.historico
+        self._codes = array("H", game.historico.codes)
+        self._pos = game.historico.pos
+        self._cuts = game.historico.cuts
+        self._time = min(int(elapsed), _MAX_TIME)
+
+    def sync(self, game: Game, elapsed: Optional[float] = None) -> None:
+        if game.historico is not self._hist:
+            self.start(game)
+        else:
+            self._write_diff(game)
+        if elapsed is not None and int(elapsed) - self._time >= TIME_EVERY:
+            self.write_time(elapsed)
+
+    def write_time(self, elapsed: float) -> None:
+        """Grava o tempo de jogo da partida atual (se mudou)."""
+        seconds = min(int(elapsed), _MAX_TIME)
+        if self._hist is None or seconds == self._time:
+            return
+        self._time = seconds
+        self._f.write(_ACTION.pack(TAG_TIME, seconds))
+        self._f.flush()
+
+    def _write_diff(self, game: Game) -> None:
+        hist = game.historico
+        codes, mirror = hist.codes, self._codes
+        old, new = self._pos, hist.pos
+        # k = tamanho do prefixo gravado que continua valendo; sem corte desde a
+        # última gravação, tudo o que foi gravado continua igual
+        k = len(mirror)
+        if hist.cuts != self._cuts or len(codes) < k:
+            self._cuts = hist.cuts
+            if not codes:
+                self.start(game)  # histórico esvaziado: o arquivo não tem como cortar tudo
+                return
+            # Jogadas depois do corte podem ter o mesmo código do redo descartado:
+            # a comparação não vê o corte. Tudo a partir do cursor (e ao menos a
+            # última jogada) é regravado como M, o que corta o redo ao refazer.
+            k = min(k, old, new, len(codes) - 1)
+            if codes[:k] != mirror[:k]:
+                k = next(i for i in range(k) if codes[i] != mirror[i])
+            del mirror[k:]
+        # Jogadas novas além do gravado (mesmo as já desfeitas, que ficam no redo)
+        # são gravadas como M até o fim e desfeitas com U até o cursor
+        top = len(codes) if len(codes) > k else new
+        t = min(old, new, k)
+        out = bytearray()
+        for _ in range(old - t):
+            out += _ACTION.pack(TAG_UNDO, 0)
+        for i in range(t, top):
+            out += _ACTION.pack(TAG_REDO, 0) if i < k else _ACTION.pack(TAG_MOVE, codes[i])
+        for _ in range(top - new):
+            out += _ACTION.pack(TAG_UNDO, 0)
+        mirror.extend(codes[k:])
+        self._pos = new
+        if out:
+            self._f.write(out)
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "SessionWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _drop_partial_tail(path: str) -> Optional[GameRecord]:
+    """Corta um registro incompleto no fim do arquivo (queda durante a escrita).
+
+    Retorna a última partida do arquivo (percorre só ela se o `.last` confere).
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    with ReplayArchive(path) as archive:
+        rec = archive.last_game()
+        end = archive.valid_end
+    if end < os.path.getsize(path):
+        os.truncate(path, end)
+    return rec
+
+
+def _read_last(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        with open(path + ".last", "rb") as f:
+            data = f.read(_LAST.size + 1)
+    except OSError:
+        return None
+    return _LAST.unpack(data) if len(data) == _LAST.size else None
+
+
+def _write_last(path: str, offset: int, index: int, size: int) -> None:
+    with open(path + ".last", "wb") as f:
+        f.write(_LAST.pack(offset, index, size))
+
+
+def _game_record(game: Game, snap: bytes) -> bytes:
+    """Registro G com o instantâneo, precedido de V se a variante não for a padrão."""
+    out = _GAME_HEAD.pack(TAG_GAME, game.seed, len(snap)) + snap
+    if game.variant != TWO_SUITS:
+        out = _ACTION.pack(TAG_VARIANT, len(game.variant.suits)) + out
+    return out
+
+
+def _variant(n_suits: int) -> Variant:
+    try:
+        return VARIANTS[n_suits]
+    except KeyError:
+        raise SaveFormatError(f"variante de {n_suits} naipes desconhecida") from None
+
+
+def _initial_snapshot(game: Game) -> bytes:
+    """Instantâneo do início do histórico (sem alterar a posição de `game`)."""
+    hist = game.historico
+    pos = hist.pos
+    game.goto(0)
+    snap = game.snapshot()
+    game.goto(pos)
+    return snap
+
+
+# =========================
+# Leitura
+# =========================
+
+@dataclass
+class GameRecord:
+    index: int
+    offset: int          # início do registro G
+    seed: int
+    initial: bytes       # instantâneo da posição inicial
+    actions_offset: int  # primeiro registro de ação
+    n_actions: int       # M/U/R (registros T não contam)
+    variant: Variant = TWO_SUITS
+    elapsed: float = 0.0  # último registro T (s de jogo)
+
+
+class ReplayArchive:
+    """Leitura de um arquivo de sessões via `mmap` (não carrega o arquivo inteiro)."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._f = open(path, "rb")
+        size = os.fstat(self._f.fileno()).st_size
+        self._mm: Optional[mmap.mmap] = None
+        # Fim do último registro completo visto pela última varredura de games()
+        self.valid_end = len(HEADER) if size else 0
+        if size:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._mm[:len(MAGIC)] != MAGIC:
+                self.close()
+                raise SaveFormatError(f"{path}: não é um arquivo de sessão do Spider")
+            if self._mm[len(MAGIC)] != FORMAT_VERSION:
+                self.close()
+                raise SaveFormatError(f"{path}: versão de formato {self._mm[len(MAGIC)]} não suportada")
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._f.close()
+
+    def __enter__(self) -> "ReplayArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def games(self, start: Optional[Tuple[int, int]] = None) -> Iterator[GameRecord]:
+        """Percorre as partidas do arquivo (só lê tags e cabeçalhos).
+
+        `start` = (offset de um registro V/G, índice dessa partida) começa dali.
+        """
+        mm = self._mm
+        if mm is None:
+            return
+        size = len(mm)
+        off, index = start if start is not None else (len(HEADER), 0)
+        self.valid_end = off
+        current: Optional[GameRecord] = None
+        variant = TWO_SUITS  # vale para o próximo G
+        while off < size:
+            tag = mm[off]
+            if tag == TAG_VARIANT:
+                if off + _ACTION.size > size:
+                    break
+                variant = _variant(_ACTION.unpack_from(mm, off)[1])
+                off += _ACTION.size
+                # valid_end só avança com o G: um V sem G é cortado como cauda incompleta
+                continue
+            if tag == TAG_GAME:
+                if off + _GAME_HEAD.size > size:
+                    break
+                _, seed, n = _GAME_HEAD.unpack_from(mm, off)
+                start = off + _GAME_HEAD.size
+                if start + n > size:
+                    break
+                if current is not None:
+                    yield current
+                current = GameRecord(index, off, seed, mm[start:start + n], start + n, 0, variant)
+                variant = TWO_SUITS
+                index += 1
+                off = start + n
+            elif tag in (TAG_MOVE, TAG_UNDO, TAG_REDO, TAG_TIME):
+                if off + _ACTION.size > size:
+                    break
+                if current is None:
+                    raise SaveFormatError(f"ação sem partida no offset {off}")
+                if tag == TAG_TIME:
+                    current.elapsed = float(_ACTION.unpack_from(mm, off)[1])
+                else:
+                    current.n_actions += 1
+                off += _ACTION.size
+            else:
+                raise SaveFormatError(f"registro desconhecido {tag!r} no offset {off}")
+            self.valid_end = off
+        if current is not None:
+            yield current
+
+    def game(self, index: int) -> GameRecord:
+        for rec in self.games():
+            if rec.index == index:
+                return rec
+        raise IndexError(index)
+
+    def last_game(self) -> Optional[GameRecord]:
+        """Última partida; pelo `.last`, percorre só ela (senão, o arquivo todo)."""
+        last = _read_last(self.path)
+        if last is not None and self._mm is not None:
+            offset, index, size = last
+            if len(HEADER) <= offset < size <= len(self._mm) and self._mm[offset] in (TAG_VARIANT, TAG_GAME):
+                rec = None
+                try:
+                    for rec in self.games((offset, index)):
+                        pass
+                except SaveFormatError:
+                    rec = None
+                if rec is not None:
+                    return rec
+        rec = None
+        for rec in self.games():
+            pass
+        return rec
+
+    def actions(self, rec: GameRecord, limit: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+        """(tag, código) das ações da partida, até `limit` (sem os registros T)."""
+        mm = self._mm
+        n = rec.n_actions if limit is None else min(limit, rec.n_actions)
+        off = rec.actions_offset
+        while n > 0:
+            action = _ACTION.unpack_from(mm, off)
+            off += _ACTION.size
+            if action[0] != TAG_TIME:
+                n -= 1
+                yield action
+
+    def position(self, rec: GameRecord, prefix: Optional[int] = None) -> Game:
+        """Partida refeita pela seed (ou instantâneo inicial) mais `prefix` ações.
+
+        O histórico da partida devolvida tem as jogadas refeitas (undo/redo valem).
+        """
+        return replay(rec.seed, self.actions(rec, prefix), rec.initial, rec.variant)
+
+
+def replay(seed: int, actions, initial: Optional[bytes] = None,
+           variant: Variant = TWO_SUITS) -> Game:
+    """Refaz uma partida pela seed e pela sequência de ações (tag, código).
+
+    Se `initial` for dado e a seed não produzir essa posição inicial (ex.:
+    outro embaralhamento), a partida parte do instantâneo.
+    """
+    game = Game(seed=seed, variant=variant)
+    if initial is not None and game.snapshot() != initial:
+        game = Game.from_snapshot(initial, seed=seed, variant=variant)
+    for k, (tag, code) in enumerate(actions):
+        if tag == TAG_MOVE:
+            ok = game.play_code(code)
+        elif tag == TAG_UNDO:
+            ok = game.undo()
+        elif tag == TAG_REDO:
+            ok = game.redo()
+        elif tag == TAG_TIME:
+            continue
+        else:
+            raise SaveFormatError(f"ação desconhecida {tag!r}")
+        if not ok:
+            raise SaveFormatError(f"ação {k} ({chr(tag)} {code:#06x}) inválida na posição")
+    return game
+
+
+def encode_game(game: Game) -> bytes:
+    """Partida inteira (registro G + ações) em bytes, no formato do arquivo.
+
+    Todas as jogadas do histórico viram `M`, seguidas de um `U` para cada
+    jogada desfeita: `decode_game` devolve a mesma posição com o mesmo redo.
+    """
+    hist = game.historico
+    snap = _initial_snapshot(game) if hist.pos else game.snapshot()
+    out = bytearray(_game_record(game, snap))
+    for code in hist.codes:
+        out += _ACTION.pack(TAG_MOVE, code)
+    out += _ACTION.pack(TAG_UNDO, 0) * (len(hist.codes) - hist.pos)
+    return bytes(out)
+
+
+def decode_game(data: bytes) -> Game:
+    """Inverso de `encode_game` (um único registro G e suas ações, com o V opcional)."""
+    variant = TWO_SUITS
+    if data[:1] == bytes([TAG_VARIANT]) and len(data) >= _ACTION.size:
+        variant = _variant(_ACTION.unpack_from(data, 0)[1])
+        data = data[_ACTION.size:]
+    if len(data) < _GAME_HEAD.size or data[0] != TAG_GAME:
+        raise SaveFormatError("registro de partida inválido")
+    _, seed, n = _GAME_HEAD.unpack_from(data, 0)
+    start = _GAME_HEAD.size + n
+    if (len(data) - start) % _ACTION.size:
+        raise SaveFormatError("registro de partida truncado")
+    actions = (_ACTION.unpack_from(data, off) for off in range(start, len(data), _ACTION.size))
+    return replay(seed, actions, data[_GAME_HEAD.size:start], variant)
+
+
+def load_latest(path: str) -> Optional[Game]:
+    """Última partida do arquivo, na posição em que parou (recuperação)."""
+    latest = load_latest_record(path)
+    return latest[0] if latest is not None else None
+
+
+def load_latest_record(path: str) -> Optional[Tuple[Game, GameRecord]]:
+    """Como `load_latest`, com o registro da partida (ações e tempo já jogados)."""
+    if not os.path.exists(path):
+        return None
+    with ReplayArchive(path) as archive:
+        rec = archive.last_game()
+        if rec is None:
+            return None
+        return archive.position(rec), rec
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Inspeciona um arquivo de sessões do Spider.")
+    parser.add_argument("path")
+    parser.add_argument("--game", type=int, help="índice da partida a refazer")
+    parser.add_argument("--prefix", type=int, help="quantas ações aplicar (padrão: todas)")
+    args = parser.parse_args(argv)
+
+    with ReplayArchive(args.path) as archive:
+        if args.game is None:
+            n_games = n_actions = 0
+            for rec in archive.games():
+                n_games += 1
+                n_actions += rec.n_actions
+            print(f"{n_games} partidas, {n_actions} ações, {os.path.getsize(args.path)} bytes")
+            return
+        rec = archive.game(args.game)
+        game = archive.position(rec, args.prefix)
+        print(f"partida {rec.index} seed={rec.seed} {rec.variant.name} ações={rec.n_actions} "
+              f"tempo={int(rec.elapsed)}s "
+              f"posição após {args.prefix if args.prefix is not None else rec.n_actions}: "
+              f"removidas={game.removed_sequences} estoque={len(game.stock.cards)} "
+              f"jogadas no histórico={len(game.historico)}")
+
+
+if __name__ == "__main__":
+    main()
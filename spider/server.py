@@ -0,0 +1,667 @@
+"""
+Servidor de partidas assíncrono (asyncio, TCP com uma mensagem JSON por linha; sem Arcade).
+
+Muitas sessões (`Game`) em um processo; uma conexão pode abrir várias:
+
+    -> {"id": 1, "cmd": "open", "seed": 42}
+    <- {"id": 1, "ok": true, "s": 7, "cols": [[0, 0, 0, 0, 0, 45], ...], "stock": 50, ...}
+    -> {"id": 2, "cmd": "move", "s": 7, "from": 3, "n": 1, "to": 8}
+    <- {"id": 2, "ok": true, "d": [[3, 4, [41]], [8, 5, [40]]], "stock": 50, ...}
+    <- {"id": 3, "ok": false, "err": "jogada inválida"}
+
+- Comandos: `open` (seed opcional), `resume`, `move` (origem, quantidade de
+  cartas do topo, destino), `deal`, `undo`, `redo`, `reset` (seed opcional),
+  `close` e `stats`.
+- Cartas como em `spider.compact` (valor | naipe | face_up); virada para baixo = 0.
+- Jogadas respondem só com as colunas alteradas, `[coluna, cartas mantidas,
+  cartas novas]` em relação ao que o cliente já recebeu. As colunas mudadas
+  são achadas pelo hash Zobrist de cada coluna (sem percorrer as cartas).
+- As respostas de uma leitura são juntadas e escritas com um único `write` por
+  volta do loop; a leitura da conexão pausa se o buffer de saída encher.
+- Sessões paradas há mais de `idle_timeout` s saem da memória no formato de
+  `spider.savefile` (registro G + ações, ~3 bytes por jogada) e voltam com
+  `resume` ou no próximo comando.
+
+    python -m spider.server serve --port 8765 [--idle 300] [--evict-file evicted.spdr]
+    python -m spider.server load --spawn --sessions 10000 --connections 50 --commands 5 --think 10
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .compact import FACE_UP, VALUE_MASK, encode_card
+from .core import MAX_SEED, N_COLS, Column, Game, GamePool
+from .savefile import HEADER, decode_game, encode_game
+
+DEFAULT_PORT = 8765
+IDLE_TIMEOUT = 300.0
+SWEEP_EVERY = 5.0
+MAX_LINE = 4096
+WRITE_HIGH_WATER = 1 << 20
+COMPACT_MIN = 1 << 20   # bytes mortos no arquivo de despejo antes de compactar
+
+PLAYING = "playing"
+WON = "won"
+LOST = "lost"
+
+
+class CommandError(ValueError):
+    pass
+
+
+def _col_codes(col: Column) -> bytes:
+    return bytes(encode_card(c) if c.face_up else 0 for c in col.cards)
+
+
+# =========================
+# Sessões
+# =========================
+
+class Session:
+    """Uma partida e a cópia do que o cliente já recebeu (para mandar diferenças)."""
+
+    __slots__ = ("sid", "game", "shown", "hashes", "last_used")
+
+    def __init__(self, sid: int, game: Game) -> None:
+        self.sid = sid
+        self.game = game
+        self.shown: List[bytes] = [b""] * N_COLS
+        self.hashes: List[Optional[int]] = [None] * N_COLS
+        self.last_used = time.monotonic()
+
+    def mark_shown(self) -> None:
+        """Considera a posição atual já conhecida pelo cliente."""
+        for ci, col in enumerate(self.game.columns):
+            self.shown[ci] = _col_codes(col)
+            self.hashes[ci] = col._hash
+
+    def full(self) -> Dict:
+        self.mark_shown()
+        out = {"s": self.sid, "cols": [list(b) for b in self.shown]}
+        out.update(self.status())
+        return out
+
+    def diff(self) -> Dict:
+        d = []
+        shown, hashes = self.shown, self.hashes
+        for ci, col in enumerate(self.game.columns):
+            if col._hash == hashes[ci]:
+                continue
+            hashes[ci] = col._hash
+            new, old = _col_codes(col), shown[ci]
+            shown[ci] = new
+            k, m = 0, min(len(old), len(new))
+            while k < m and old[k] == new[k]:
+                k += 1
+            if k < len(new) or k < len(old):
+                d.append([ci, k, list(new[k:])])
+        out = {"d": d}
+        out.update(self.status())
+        return out
+
+    def status(self) -> Dict:
+        game = self.game
+        hist = game.historico
+        if game.is_won():
+            st = WON
+        elif game.is_lost():
+            st = LOST
+        else:
+            st = PLAYING
+        return {"stock": len(game.stock.cards), "removed": game.removed_sequences,
+                "pos": hist.pos, "hist": len(hist.codes), "st": st}
+
+
+class EvictionStore:
+    """Sessões fora da memória, como bytes de `savefile.encode_game`.
+
+    Sem `path`, os bytes ficam num dicionário (~3 bytes por jogada contra
+    ~16 KB de um `Game`). Com `path`, os registros são acrescentados a um
+    arquivo de sessão (legível por `python -m spider.savefile`), recriado a
+    cada execução; na memória fica só o offset. Registros restaurados ou
+    descartados viram bytes mortos; quando passam dos vivos (e de
+    `compact_min`), os vivos são copiados para um arquivo novo.
+    """
+
+    def __init__(self, path: Optional[str] = None, compact_min: int = COMPACT_MIN) -> None:
+        self.path = path
+        self.compact_min = compact_min
+        self._mem: Dict[int, bytes] = {}
+        self._index: Dict[int, Tuple[int, int]] = {}
+        self._live = self._dead = 0
+        self.compactions = 0
+        self._f = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._f = open(path, "w+b")
+            self._f.write(HEADER)
+
+    def __contains__(self, sid: int) -> bool:
+        return sid in self._mem or sid in self._index
+
+    def __len__(self) -> int:
+        return len(self._mem) + len(self._index)
+
+    def put(self, sid: int, data: bytes) -> None:
+        if self._f is None:
+            self._mem[sid] = data
+            return
+        self._forget(sid)
+        off = self._f.seek(0, os.SEEK_END)
+        self._f.write(data)
+        self._index[sid] = (off, len(data))
+        self._live += len(data)
+
+    def take(self, sid: int) -> bytes:
+        if self._f is None:
+            return self._mem.pop(sid)
+        off, n = self._index[sid]
+        self._f.flush()
+        data = os.pread(self._f.fileno(), n, off)
+        self._forget(sid)
+        return data
+
+    def discard(self, sid: int) -> None:
+        self._mem.pop(sid, None)
+        if self._f is not None:
+            self._forget(sid)
+
+    def _forget(self, sid: int) -> None:
+        rec = self._index.pop(sid, None)
+        if rec is None:
+            return
+        self._live -= rec[1]
+        self._dead += rec[1]
+        if self._dead > max(self._live, self.compact_min):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Copia os registros vivos para um arquivo novo e troca pelo atual."""
+        self._f.flush()
+        old = self._f.fileno()
+        tmp = self.path + ".tmp"
+        f = open(tmp, "w+b")
+        f.write(HEADER)
+        index: Dict[int, Tuple[int, int]] = {}
+        for sid, (off, n) in sorted(self._index.items(), key=lambda kv: kv[1][0]):
+            index[sid] = (f.tell(), n)
+            f.write(os.pread(old, n, off))
+        f.flush()
+        os.replace(tmp, self.path)
+        self._f.close()
+        self._f, self._index = f, index
+        self._dead = 0
+        self.compactions += 1
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+
+# =========================
+# Servidor
+# =========================
+
+class GameServer:
+    """Sessões e comandos; `handle` é síncrono (as jogadas não esperam I/O)."""
+
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT,
+                 store: Optional[EvictionStore] = None) -> None:
+        self.idle_timeout = idle_timeout
+        self.store = store if store is not None else EvictionStore()
+        self.sessions: Dict[int, Session] = {}
+        # partidas de sessões fechadas/despejadas, reaproveitadas por `open`
+        self.pool = GamePool()
+        self._next_sid = 1
+        self.stats = {"commands": 0, "errors": 0, "evicted": 0, "restored": 0}
+        self._commands: Dict[str, Callable[[Dict], Dict]] = {
+            name[len("_cmd_"):]: getattr(self, name)
+            for name in dir(self) if name.startswith("_cmd_")
+        }
+
+    # ---------- comandos ----------
+    def handle(self, req: Dict) -> Dict:
+        self.stats["commands"] += 1
+        rid = req.get("id")
+        cmd = req.get("cmd")
+        fn = self._commands.get(cmd) if isinstance(cmd, str) else None
+        try:
+            if fn is None:
+                raise CommandError(f"comando desconhecido: {cmd!r}")
+            out = fn(req)
+        except CommandError as e:
+            self.stats["errors"] += 1
+            return {"id": rid, "ok": False, "err": str(e)}
+        except (TypeError, ValueError, OverflowError) as e:
+            # campo com tipo inesperado que escapou da validação: responde com
+            # erro em vez de derrubar a conexão (e as respostas atrás desta linha)
+            self.stats["errors"] += 1
+            return {"id": rid, "ok": False, "err": f"requisição inválida: {e}"}
+        out["id"] = rid
+        out["ok"] = True
+        return out
+
+    def handle_line(self, line: bytes) -> bytes:
+        try:
+            req = json.loads(line, parse_constant=_reject_constant)
+            if not isinstance(req, dict):
+                raise ValueError
+        except ValueError:
+            self.stats["errors"] += 1
+            resp = {"id": None, "ok": False, "err": "JSON inválido"}
+        else:
+            resp = self.handle(req)
+        return json.dumps(resp, separators=(",", ":")).encode() + b"\n"
+
+    def _session(self, req: Dict) -> Session:
+        sid = _sid(req)
+        session = self.sessions.get(sid)
+        if session is None:
+            if sid not in self.store:
+                raise CommandError(f"sessão desconhecida: {sid!r}")
+            session = self._restore(sid)
+        session.last_used = time.monotonic()
+        return session
+
+    def _cmd_open(self, req: Dict) -> Dict:
+        sid = self._next_sid
+        self._next_sid += 1
+        session = self.sessions[sid] = Session(sid, self.pool.acquire(_seed(req)))
+        return session.full()
+
+    def _cmd_resume(self, req: Dict) -> Dict:
+        return self._session(req).full()
+
+    def _cmd_move(self, req: Dict) -> Dict:
+        session = self._session(req)
+        try:
+            i, n, j = int(req["from"]), int(req["n"]), int(req["to"])
+        except (KeyError, TypeError, ValueError, OverflowError):
+            raise CommandError("move exige from, n e to")
+        cols = session.game.columns
+        if not (0 <= i < N_COLS and 0 <= j < N_COLS and 0 < n <= len(cols[i].cards)):
+            raise CommandError("jogada inválida")
+        if not session.game.move(i, len(cols[i].cards) - n, j):
+            raise CommandError("jogada inválida")
+        return session.diff()
+
+    def _cmd_deal(self, req: Dict) -> Dict:
+        session = self._session(req)
+        if not session.game.deal():
+            raise CommandError("distribuição indisponível")
+        return session.diff()
+
+    def _cmd_undo(self, req: Dict) -> Dict:
+        session = self._session(req)
+        if not session.game.undo():
+            raise CommandError("nada a desfazer")
+        return session.diff()
+
+    def _cmd_redo(self, req: Dict) -> Dict:
+        session = self._session(req)
+        if not session.game.redo():
+            raise CommandError("nada a refazer")
+        return session.diff()
+
+    def _cmd_reset(self, req: Dict) -> Dict:
+        session = self._session(req)
+        session.game.reset(seed=_seed(req))
+        return session.full()
+
+    def _cmd_close(self, req: Dict) -> Dict:
+        sid = _sid(req)
+        session = self.sessions.pop(sid, None)
+        if session is not None:
+            self.pool.release(session.game)
+        elif sid in self.store:
+            self.store.discard(sid)
+        else:
+            raise CommandError(f"sessão desconhecida: {sid!r}")
+        return {"s": sid}
+
+    def _cmd_stats(self, req: Dict) -> Dict:
+        out = dict(self.stats)
+        out["sessions"] = len(self.sessions)
+        out["stored"] = len(self.store)
+        return out
+
+    # ---------- despejo ----------
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Tira da memória as sessões paradas há mais de `idle_timeout` s."""
+        limit = (time.monotonic() if now is None else now) - self.idle_timeout
+        idle = [s for s in self.sessions.values() if s.last_used < limit]
+        for session in idle:
+            self.store.put(session.sid, encode_game(session.game))
+            del self.sessions[session.sid]
+            self.pool.release(session.game)
+        self.stats["evicted"] += len(idle)
+        return len(idle)
+
+    def _restore(self, sid: int) -> Session:
+        session = Session(sid, decode_game(self.store.take(sid)))
+        # o cliente já tem essa posição: as próximas respostas seguem como diferença
+        session.mark_shown()
+        self.sessions[sid] = session
+        self.stats["restored"] += 1
+        return session
+
+    # ---------- rede ----------
+    async def serve(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                    sweep_every: float = SWEEP_EVERY) -> None:
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(lambda: _Connection(self), host, port,
+                                          reuse_address=True)
+        print(f"servidor em {host}:{port} (despejo após {self.idle_timeout:g} s parado)", flush=True)
+        async with server:
+            sweeper = asyncio.create_task(self._sweep(sweep_every))
+            try:
+                await server.serve_forever()
+            finally:
+                sweeper.cancel()
+                self.store.close()
+
+    async def _sweep(self, every: float) -> None:
+        while True:
+            await asyncio.sleep(every)
+            self.evict_idle()
+
+
+def _reject_constant(name: str):
+    """NaN/Infinity não são JSON padrão (json.loads os aceita por padrão)."""
+    raise ValueError(f"constante não suportada: {name}")
+
+
+def _sid(req: Dict) -> int:
+    sid = req.get("s")
+    if not isinstance(sid, int) or isinstance(sid, bool):
+        raise CommandError(f"sessão desconhecida: {sid!r}")
+    return sid
+
+
+def _seed(req: Dict) -> Optional[int]:
+    seed = req.get("seed")
+    if seed is None:
+        return None
+    if not isinstance(seed, int) or isinstance(seed, bool) or not 0 <= seed < MAX_SEED:
+        raise CommandError("seed inválida")
+    return seed
+
+
+class _Connection(asyncio.Protocol):
+    """Uma conexão: lê linhas, responde na ordem e escreve em lote."""
+
+    def __init__(self, server: GameServer) -> None:
+        self.server = server
+        self.transport: Optional[asyncio.Transport] = None
+        self._pending = b""
+        self._out: List[bytes] = []
+        self._flush_scheduled = False
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+        transport.set_write_buffer_limits(high=WRITE_HIGH_WATER)
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def data_received(self, data: bytes) -> None:
+        lines = (self._pending + data).split(b"\n")
+        self._pending = lines.pop()
+        if len(self._pending) > MAX_LINE:
+            self.transport.close()
+            return
+        handle = self.server.handle_line
+        out = self._out
+        for line in lines:
+            if line.strip():
+                out.append(handle(line))
+        if out and not self._flush_scheduled:
+            # junta as respostas de todas as leituras desta volta do loop
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        if self._out and not self.transport.is_closing():
+            self.transport.write(b"".join(self._out))
+        self._out.clear()
+
+    # o transporte chama estes dois quando o buffer de saída passa/volta do limite
+    def pause_writing(self) -> None:
+        self.transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        self.transport.resume_reading()
+
+
+# =========================
+# Gerador de carga
+# =========================
+
+class _Client:
+    """Conexão de teste: várias requisições em andamento, casadas pelo `id`."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.pending: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._reader_task = asyncio.create_task(self._read())
+
+    async def request(self, msg: Dict) -> Dict:
+        self._next_id += 1
+        msg["id"] = self._next_id
+        fut = asyncio.get_running_loop().create_future()
+        self.pending[self._next_id] = fut
+        self.writer.write(json.dumps(msg, separators=(",", ":")).encode() + b"\n")
+        return await fut
+
+    async def _read(self) -> None:
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            resp = json.loads(line)
+            fut = self.pending.pop(resp["id"], None)
+            if fut is not None:
+                fut.set_result(resp)
+        for fut in self.pending.values():
+            fut.set_exception(ConnectionError("conexão encerrada"))
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+        self._reader_task.cancel()
+
+
+def _apply(cols: List[List[int]], resp: Dict) -> None:
+    """Atualiza a cópia do cliente com a resposta (completa ou diferença)."""
+    if "cols" in resp:
+        cols[:] = resp["cols"]
+        return
+    for ci, keep, new in resp["d"]:
+        del cols[ci][keep:]
+        cols[ci].extend(new)
+
+
+def _client_moves(cols: List[List[int]]) -> List[Tuple[int, int, int]]:
+    """Jogadas (origem, quantidade, destino) que a cópia do cliente permite."""
+    moves = []
+    first_empty = next((j for j, c in enumerate(cols) if not c), -1)
+    # destinos por valor do topo
+    dests: Dict[int, List[int]] = {}
+    for j, dest in enumerate(cols):
+        if dest and dest[-1] & FACE_UP:
+            dests.setdefault(dest[-1] & VALUE_MASK, []).append(j)
+    for i, col in enumerate(cols):
+        n = len(col)
+        if not n:
+            continue
+        k = n - 1
+        while k > 0 and col[k - 1] == col[k] + 1:  # mesmo naipe, face up, valor +1
+            k -= 1
+        for idx in range(k, n):
+            for j in dests.get((col[idx] & VALUE_MASK) + 1, ()):
+                if j != i:
+                    moves.append((i, n - idx, j))
+            if first_empty != -1 and idx > 0:
+                moves.append((i, n - idx, first_empty))
+    return moves
+
+
+async def _open(client: _Client, seed: int, latencies: List[float]) -> Tuple[int, Dict]:
+    t0 = time.perf_counter()
+    resp = await client.request({"cmd": "open", "seed": seed})
+    latencies.append(time.perf_counter() - t0)
+    return resp["s"], resp
+
+
+async def _player(client: _Client, sid: int, resp: Dict, commands: int, think: float,
+                  rng: random.Random, latencies: List[float]) -> None:
+    """Um jogador: manda `commands` comandos com pausas aleatórias."""
+    cols: List[List[int]] = []
+    _apply(cols, resp)
+    for _ in range(commands):
+        if think:
+            await asyncio.sleep(rng.expovariate(1 / think))
+        moves = _client_moves(cols)
+        if resp.get("st", PLAYING) != PLAYING:
+            msg = {"cmd": "reset", "s": sid}
+        elif moves and rng.random() < 0.9:
+            i, n, j = rng.choice(moves)
+            msg = {"cmd": "move", "s": sid, "from": i, "n": n, "to": j}
+        elif resp.get("pos") and rng.random() < 0.5:
+            msg = {"cmd": "undo", "s": sid}
+        else:
+            msg = {"cmd": "deal", "s": sid}
+        t0 = time.perf_counter()
+        out = await client.request(msg)
+        latencies.append(time.perf_counter() - t0)
+        if out["ok"]:
+            resp = out
+            _apply(cols, resp)
+
+
+def _percentiles(latencies: List[float]) -> Dict:
+    latencies.sort()
+    n = len(latencies)
+    if not n:
+        return {"n": 0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    return {"n": n, "p50_ms": latencies[n // 2] * 1e3,
+            "p99_ms": latencies[min(n - 1, int(n * 0.99))] * 1e3, "max_ms": latencies[-1] * 1e3}
+
+
+async def _wait_port(host: str, port: int, timeout: float) -> None:
+    end = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            if time.monotonic() > end:
+                raise
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return
+
+
+async def load(host: str, port: int, sessions: int, connections: int, commands: int,
+               think: float, seed: int = 0) -> Dict:
+    """Abre `sessions` partidas em `connections` conexões e mede a latência dos comandos."""
+    clients = []
+    for _ in range(connections):
+        reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+        writer.transport.get_extra_info("socket").setsockopt(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        clients.append(_Client(reader, writer))
+    # primeiro abre todas as sessões; depois mede os comandos com todas abertas
+    open_lat: List[float] = []
+    opened = await asyncio.gather(*(_open(clients[k % connections], seed + k, open_lat)
+                                    for k in range(sessions)))
+    latencies: List[float] = []
+    rng = random.Random(seed)
+    t0 = time.perf_counter()
+    await asyncio.gather(*(
+        _player(clients[k % connections], sid, resp, commands, think,
+                random.Random(rng.getrandbits(64)), latencies)
+        for k, (sid, resp) in enumerate(opened)
+    ))
+    wall = time.perf_counter() - t0
+    stats = await clients[0].request({"cmd": "stats"})
+    for client in clients:
+        await client.close()
+    res = _percentiles(latencies)
+    res.update(wall=wall, throughput=res["n"] / wall if wall else 0.0,
+               open=_percentiles(open_lat), server=stats)
+    return res
+
+
+async def _load_main(args) -> None:
+    proc = None
+    if args.spawn:
+        cmd = [sys.executable, "-m", "spider.server", "serve", "--host", args.host,
+               "--port", str(args.port), "--idle", str(args.idle)]
+        proc = await asyncio.create_subprocess_exec(*cmd)
+        await _wait_port(args.host, args.port, 10.0)
+    try:
+        res = await load(args.host, args.port, args.sessions, args.connections,
+                         args.commands, args.think, args.seed)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            await proc.wait()
+    srv = res["server"]
+    op = res["open"]
+    print(f"{args.sessions} sessões em {args.connections} conexões "
+          f"(abertura p50 {op['p50_ms']:.2f} ms, p99 {op['p99_ms']:.2f} ms)")
+    print(f"{res['n']} comandos em {res['wall']:.1f} s ({res['throughput']:,.0f}/s): "
+          f"latência p50 {res['p50_ms']:.2f} ms  p99 {res['p99_ms']:.2f} ms  "
+          f"máx {res['max_ms']:.2f} ms")
+    print(f"servidor: {srv['sessions']} sessões na memória, {srv['stored']} despejadas, "
+          f"{srv['restored']} restauradas, {srv['errors']} erros")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Servidor de partidas do Spider (JSON por linha).")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    s = sub.add_parser("serve", help="inicia o servidor")
+    s.add_argument("--host", default="127.0.0.1")
+    s.add_argument("--port", type=int, default=DEFAULT_PORT)
+    s.add_argument("--idle", type=float, default=IDLE_TIMEOUT,
+                   help="segundos sem comandos até a sessão sair da memória")
+    s.add_argument("--evict-file", help="grava as sessões despejadas neste arquivo (padrão: memória)")
+    g = sub.add_parser("load", help="gerador de carga (latência dos comandos)")
+    g.add_argument("--host", default="127.0.0.1")
+    g.add_argument("--port", type=int, default=DEFAULT_PORT)
+    g.add_argument("--spawn", action="store_true", help="inicia o servidor em outro processo")
+    g.add_argument("--idle", type=float, default=IDLE_TIMEOUT, help="--idle do servidor (com --spawn)")
+    g.add_argument("--sessions", type=int, default=10000)
+    g.add_argument("--connections", type=int, default=50)
+    g.add_argument("--commands", type=int, default=20, help="comandos por sessão")
+    g.add_argument("--think", type=float, default=0.5,
+                   help="pausa média entre comandos de uma sessão (s)")
+    g.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.cmd == "serve":
+        store = EvictionStore(args.evict_file)
+        try:
+            asyncio.run(GameServer(args.idle, store).serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+    else:
+        asyncio.run(_load_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+"""
+Solver headless para o Spider (qualquer variante de `spider.core.VARIANTS`).
+
+- Gerador de movimentos legais sobre `Game` (mesmas regras de `can_receive`).
+- Tabela de transposição indexada por uma chave canônica do estado
+  (cartas duplicadas como S5-0 / S5-x0 são equivalentes).
+- Ordenação de movimentos (remoção K→A, revelar cartas, juntar naipes...).
+- Busca em profundidade com aprofundamento iterativo (sobre movimentos sem
+  progresso) e orçamento de nós/tempo.
+- `dead_end`: detecta posições que só andam em círculos (derrota antecipada).
+
+Uso:
+    python -m spider.solver --seed 42 --max-nodes 200000 --max-time 10 [--suits 4]
+"""
+
+from __future__ import annotations
+import argparse
+import copy
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from .core import VARIANTS, Column, Game, decode_move
+
+SOLVED = "solved"
+UNSOLVED = "unsolved"
+BUDGET_EXHAUSTED = "budget_exhausted"
+CANCELLED = "cancelled"
+
+# Movimento: (coluna origem, índice na origem, coluna destino).
+# A distribuição do estoque é representada por DEAL.
+SolverMove = Tuple[int, int, int]
+DEAL: SolverMove = (-1, -1, -1)
+
+
+@dataclass
+class SolveResult:
+    status: str                      # SOLVED | UNSOLVED | BUDGET_EXHAUSTED | CANCELLED
+    line: List[SolverMove] = field(default_factory=list)
+    nodes: int = 0
+    elapsed: float = 0.0
+    idle_limit: int = 0              # folga sem progresso da última iteração
+
+    def nodes_per_ms(self) -> float:
+        if self.elapsed <= 0:
+            return float(self.nodes)
+        return self.nodes / (self.elapsed * 1000.0)
+
+
+# =========================
+# Estado canônico
+# =========================
+
+def card_code(card) -> int:
+    """`Card.key` (valor nos bits 0-3, naipe nos bits 4-5) | face_up (bit 6). Ignora o id."""
+    return card.key | (64 if card.face_up else 0)
+
+
+def state_key(game: Game) -> Hashable:
+    """Chave canônica da posição.
+
+    O estoque só é consumido pelo fim, então seu tamanho identifica o conteúdo.
+    Com estoque, a chave é o hash de Zobrist (`Game.zobrist`). Com o estoque
+    vazio a ordem das colunas não importa mais (não haverá nova distribuição),
+    então a chave é a tupla ordenada dos hashes das colunas (`shape_hash`).
+    """
+    if game.stock.cards:
+        return game.zobrist
+    return tuple(sorted([col.shape_hash() for col in game.columns]))
+
+
+# =========================
+# Geração de movimentos
+# =========================
+
+def run_start(col: Column) -> int:
+    """Índice da base da maior sequência movível no topo (len se vazia)."""
+    return len(col.cards) - col.run_length()
+
+
+def legal_moves(game: Game) -> List[SolverMove]:
+    """Todos os movimentos aceitos por `Game.move`, mais DEAL se permitido.
+
+    Movimentos equivalentes são omitidos: coluna inteira para coluna vazia e
+    movimentos para uma segunda coluna vazia.
+    """
+    moves: List[SolverMove] = []
+    cols = game.columns
+    tops = [col.top() for col in cols]
+    first_empty = next((j for j, t in enumerate(tops) if t is None), -1)
+
+    for i, col in enumerate(cols):
+        n = len(col.cards)
+        start = run_start(col)
+        for idx in range(start, n):
+            base = col.cards[idx]
+            for j, top in enumerate(tops):
+                if j == i:
+                    continue
+                if top is None:
+                    if j == first_empty and idx > 0:
+                        moves.append((i, idx, j))
+                elif top.value == base.value + 1:
+                    moves.append((i, idx, j))
+
+    if first_empty == -1 and game.stock.available():
+        moves.append(DEAL)
+    return moves
+
+
+def useful_moves(game: Game, moves: Optional[List[SolverMove]] = None) -> List[SolverMove]:
+    """`legal_moves` (ou `moves`) sem quebrar sequências do mesmo naipe para outro naipe.
+
+    Descartado: mover só parte de uma sequência do mesmo naipe para um destino
+    de outro naipe. A poda não é exata: com cartas repetidas, a carta que fica
+    no topo da origem pode receber a outra cópia da carta movida. Por isso o
+    `Solver` não conclui UNSOLVED quando ela descartou algum movimento.
+    Mover uma sequência inteira de cima de um pai de outro naipe é mantido:
+    é o único jeito de liberar esse pai.
+    """
+    cols = game.columns
+    out: List[SolverMove] = []
+    for mv in legal_moves(game) if moves is None else moves:
+        if mv == DEAL:
+            out.append(mv)
+            continue
+        i, idx, j = mv
+        src = cols[i].cards
+        dest = cols[j].cards
+        if not dest:
+            out.append(mv)
+            continue
+        base = src[idx]
+        if dest[-1].suit == base.suit:
+            out.append(mv)
+            continue
+        if idx > 0:
+            below = src[idx - 1]
+            if below.face_up and below.value == base.value + 1 and below.suit == base.suit:
+                continue  # parte de uma sequência do mesmo naipe para outro naipe
+        out.append(mv)
+    return out
+
+
+def _score(game: Game, mv: SolverMove) -> int:
+    """Heurística de ordenação: maior primeiro."""
+    if mv == DEAL:
+        return -100
+    i, idx, j = mv
+    src = game.columns[i].cards
+    dest_col = game.columns[j]
+    dest = dest_col.cards
+    base = src[idx]
+    moved = len(src) - idx
+    score = 0
+    if idx > 0:
+        below = src[idx - 1]
+        if not below.face_up:
+            score += 50            # revela carta
+        elif below.value == base.value + 1:
+            score -= 20            # movimento lateral: já estava encaixada
+            if below.suit == base.suit:
+                score -= 20        # quebra sequência do mesmo naipe
+    else:
+        score += 30                # esvazia coluna
+    if not dest:
+        score -= 10
+    else:
+        top = dest[-1]
+        if top.suit == base.suit:
+            score += 20 + moved
+            # completa K→A no destino?
+            if src[-1].value == 1 and moved + dest_col.run_length() >= 13:
+                score += 100
+    return score
+
+
+def ordered_moves(game: Game) -> List[SolverMove]:
+    moves = useful_moves(game)
+    moves.sort(key=lambda mv: _score(game, mv), reverse=True)
+    return moves
+
+
+def apply_move(game: Game, mv: SolverMove) -> bool:
+    if mv == DEAL:
+        return game.deal()
+    return game.move(*mv)
+
+
+# =========================
+# Beco sem saída
+# =========================
+
+def dead_end(game: Game, max_states: int = 2000) -> Optional[bool]:
+    """A partida só pode andar em círculos?
+
+    Explora (sobre uma cópia) todas as posições alcançáveis por movimentos.
+    Progresso = revelar carta, remover K→A ou chegar a uma posição em que se
+    pode distribuir. True: nenhuma posição alcançável progride (derrota);
+    False: há progresso; None: mais de `max_states` posições sem decidir.
+    """
+    if game.is_won():
+        return False
+    if game.can_deal():
+        return False
+    if game.legal_move_count() == 0:
+        return True
+    work = Game.from_snapshot(game.snapshot(), seed=game.seed, variant=game.variant)
+    hist = work.historico
+    seen = {state_key(work)}
+    stack = [iter(legal_moves(work))]
+    while stack:
+        mv = next(stack[-1], None)
+        if mv is None:
+            stack.pop()
+            if stack:
+                work.undo()
+            continue
+        if not apply_move(work, mv):
+            continue
+        m = decode_move(hist.codes[hist.pos - 1])
+        if m.revelou_origem or m.removeu_sequencia or work.can_deal():
+            return False
+        key = state_key(work)
+        if key in seen:
+            work.undo()
+            continue
+        seen.add(key)
+        if len(seen) > max_states:
+            return None
+        stack.append(iter(legal_moves(work)))
+    return True
+
+
+# =========================
+# Busca
+# =========================
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+class Solver:
+    """Busca em profundidade com aprofundamento iterativo e tabela de transposição.
+
+    O aprofundamento é feito sobre o número de movimentos consecutivos "sem
+    progresso" permitidos (progresso = revelar carta, esvaziar coluna, juntar
+    cartas do mesmo naipe, remover K→A ou distribuir). O comprimento total da
+    linha é limitado por `max_depth`.
+
+    UNSOLVED só quando a busca esgotou as posições sem corte de folga ou
+    profundidade e sem que `useful_moves` tenha descartado movimentos; senão, o
+    resultado sem vitória é BUDGET_EXHAUSTED.
+
+    A partida original não é alterada: o solver trabalha sobre uma cópia.
+    `stop()`, se dado, é consultado junto com o orçamento; quando retorna True
+    a busca termina com CANCELLED (ex.: a posição mudou enquanto buscava).
+    """
+
+    def __init__(self, game: Game,
+                 max_nodes: int = 1_000_000,
+                 max_time: float = 30.0,
+                 initial_idle: int = 1,
+                 max_idle: int = 16,
+                 max_depth: int = 1000,
+                 stop: Optional[Callable[[], bool]] = None) -> None:
+        self.game = copy.deepcopy(game)
+        self.game.historico.clear()
+        self.max_nodes = max_nodes
+        self.max_time = max_time
+        self.initial_idle = initial_idle
+        self.max_idle = max_idle
+        self.max_depth = max_depth
+        self.stop = stop
+        self._cancelled = False
+        self.nodes = 0
+        self._deadline = 0.0
+        self._cutoff = False
+        self._pruned = False
+        self._tt: Dict[Hashable, int] = {}
+
+    def solve(self) -> SolveResult:
+        t0 = time.perf_counter()
+        self._deadline = t0 + self.max_time
+        self.nodes = 0
+        self._pruned = False
+        idle = self.initial_idle
+        status = BUDGET_EXHAUSTED
+        line: List[SolverMove] = []
+
+        if self.game.is_won():
+            return SolveResult(SOLVED, [], 0, 0.0, 0)
+
+        try:
+            while True:
+                found = self._dfs(idle)
+                if found is not None:
+                    status, line = SOLVED, found
+                    break
+                if not self._cutoff:
+                    # esgotou a busca; com poda, não prova que não há vitória
+                    status = BUDGET_EXHAUSTED if self._pruned else UNSOLVED
+                    break
+                if idle >= self.max_idle:
+                    break
+                idle = min(idle * 2, self.max_idle)
+        except _BudgetExceeded:
+            status = CANCELLED if self._cancelled else BUDGET_EXHAUSTED
+
+        return SolveResult(status, line, self.nodes,
+                           time.perf_counter() - t0, idle)
+
+    def _children(self) -> Iterator[Tuple[SolverMove, bool]]:
+        game = self.game
+        legal = legal_moves(game)
+        moves = useful_moves(game, legal)
+        if len(moves) < len(legal):
+            self._pruned = True
+        scored = [(_score(game, mv), mv) for mv in moves]
+        scored.sort(key=lambda sm: sm[0], reverse=True)
+        return iter([(mv, mv == DEAL or sc > 0) for sc, mv in scored])
+
+    def _dfs(self, max_idle: int) -> Optional[List[SolverMove]]:
+        """Uma iteração com até `max_idle` movimentos seguidos sem progresso.
+
+        Pilha explícita (sem recursão). A tabela guarda, por posição, a maior
+        folga de movimentos sem progresso com que ela já foi explorada.
+        """
+        game = self.game
+        tt = self._tt
+        tt.clear()
+        self._cutoff = False
+
+        path: List[SolverMove] = []
+        tt[state_key(game)] = max_idle
+        frames = [(self._children(), 0)]
+
+        while frames:
+            it, idle = frames[-1]
+            nxt = next(it, None)
+            if nxt is None:
+                frames.pop()
+                if path:
+                    path.pop()
+                    game.undo()
+                continue
+
+            mv, progress = nxt
+            idle_after = 0 if progress else idle + 1
+            if idle_after > max_idle:
+                self._cutoff = True
+                continue
+
+            if not apply_move(game, mv):
+                continue
+
+            self.nodes += 1
+            if self.nodes & 0xFF == 0:
+                if self.stop is not None and self.stop():
+                    self._cancelled = True
+                if (self._cancelled or self.nodes >= self.max_nodes
+                        or time.perf_counter() > self._deadline):
+                    self._rewind(len(path) + 1)
+                    raise _BudgetExceeded
+
+            if game.is_won():
+                path.append(mv)
+                found = list(path)
+                self._rewind(len(path))
+                return found
+
+            if len(path) + 1 >= self.max_depth:
+                self._cutoff = True
+                game.undo()
+                continue
+
+            slack = max_idle - idle_after
+            key = state_key(game)
+            seen = tt.get(key)
+            if seen is not None and seen >= slack:
+                game.undo()
+                continue
+            tt[key] = slack
+
+            path.append(mv)
+            frames.append((self._children(), idle_after))
+
+        return None
+
+    def _rewind(self, n: int) -> None:
+        for _ in range(n):
+            self.game.undo()
+
+
+def solve(game: Game, **kwargs) -> SolveResult:
+    """Atalho: `Solver(game, **kwargs).solve()`."""
+    return Solver(game, **kwargs).solve()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Solver headless do Spider.")
+    parser.add_argument("--seed", type=int, required=True)
+    parser.add_argument("--suits", type=int, choices=sorted(VARIANTS), default=2)
+    parser.add_argument("--max-nodes", type=int, default=1_000_000)
+    parser.add_argument("--max-time", type=float, default=30.0)
+    parser.add_argument("--show-line", action="store_true",
+                        help="imprime a sequência de movimentos vencedora")
+    args = parser.parse_args()
+
+    result = solve(Game(seed=args.seed, variant=VARIANTS[args.suits]),
+                   max_nodes=args.max_nodes, max_time=args.max_time)
+    print(f"seed={args.seed} status={result.status} nodes={result.nodes} "
+          f"tempo={result.elapsed:.2f}s ({result.nodes_per_ms():.1f} nós/ms) "
+          f"movimentos={len(result.line)}")
+    if args.show_line:
+        for mv in result.line:
+            print("deal" if mv == DEAL else f"{mv[0]}[{mv[1]}] -> {mv[2]}")
+
+
+if __name__ == "__main__":
+    main()
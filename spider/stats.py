@@ -0,0 +1,395 @@
+"""
+Estatísticas das partidas (sem Arcade): banco SQLite local.
+
+- `StatsStore.record_game(game, outcome, moves, elapsed)` registra uma partida
+  terminada ou abandonada (seed, variante, movimentos, tempo, resultado). Só
+  enfileira: uma thread grava em lotes (uma transação por lote, a cada
+  `flush_every` s ou `batch_size` partidas), então o quadro nunca espera o disco.
+- Índices para as consultas do ranking, em milissegundos com milhões de partidas:
+  - menor tempo e resumo de uma seed: índice (naipes, seed, resultado, tempo),
+    que cobre a consulta;
+  - recordes pessoais (menor tempo, menos movimentos): índices parciais só das
+    vitórias, lidos em ordem até `limit`;
+  - taxa de vitória por variante: tabela `totals`, atualizada na mesma
+    transação do lote (não conta linhas).
+- `iter_dataframes()` / `to_dataframe()` / `export()`: as partidas para pandas
+  (importado só aí) em blocos, CSV ou Parquet.
+
+    python -m spider.stats show [--db ~/.spider-arcade/stats.sqlite] [--suits 2] [--best 10]
+    python -m spider.stats seed 42 [--suits 2]
+    python -m spider.stats export partidas.csv [--suits 2]
+"""
+
+from __future__ import annotations
+import argparse
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+from .core import VARIANTS, Game
+
+STATS_VERSION = 1
+
+WON = "won"
+LOST = "lost"
+ABANDONED = "abandoned"   # reiniciada (R) ou fechada sem gravação automática
+OUTCOMES = (WON, LOST, ABANDONED)
+
+COLUMNS = ["seed", "suits", "outcome", "moves", "elapsed", "removed", "finished_at"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    seed INTEGER NOT NULL,
+    suits INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    moves INTEGER NOT NULL,
+    elapsed REAL NOT NULL,
+    removed INTEGER NOT NULL,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_seed ON games (suits, seed, outcome, elapsed);
+CREATE INDEX IF NOT EXISTS games_best_time ON games (suits, elapsed) WHERE outcome = 'won';
+CREATE INDEX IF NOT EXISTS games_best_moves ON games (suits, moves) WHERE outcome = 'won';
+CREATE TABLE IF NOT EXISTS totals (
+    suits INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    games INTEGER NOT NULL,
+    moves INTEGER NOT NULL,
+    elapsed REAL NOT NULL,
+    PRIMARY KEY (suits, outcome)
+) WITHOUT ROWID;
+"""
+
+_INSERT = f"INSERT INTO games ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+_ADD_TOTALS = """
+INSERT INTO totals (suits, outcome, games, moves, elapsed) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (suits, outcome) DO UPDATE SET games = games + excluded.games,
+    moves = moves + excluded.moves, elapsed = elapsed + excluded.elapsed
+"""
+_SELECT = f"SELECT {', '.join(COLUMNS)} FROM games"
+
+# Uma partida na fila de gravação (na ordem de `COLUMNS`)
+Row = Tuple[int, int, str, int, float, int, float]
+
+
+class StatsFormatError(ValueError):
+    pass
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version not in (0, STATS_VERSION):
+        conn.close()
+        raise StatsFormatError(f"{path}: versão de estatísticas {version} não suportada")
+    # WAL: as consultas (thread do jogo) não esperam a gravação dos lotes
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    if version == 0:
+        with conn:
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {STATS_VERSION}")
+    return conn
+
+
+@dataclass
+class GameResult:
+    seed: int
+    suits: int
+    outcome: str
+    moves: int
+    elapsed: float      # s
+    removed: int        # sequências K→A removidas
+    finished_at: float  # time.time()
+
+
+@dataclass
+class Totals:
+    games: int = 0
+    won: int = 0
+    lost: int = 0
+    abandoned: int = 0
+    moves: int = 0
+    elapsed: float = 0.0
+    best_time: Optional[float] = None
+
+    @property
+    def win_rate(self) -> float:
+        return self.won / self.games if self.games else 0.0
+
+    def add(self, outcome: str, games: int, moves: int, elapsed: float) -> None:
+        setattr(self, outcome, getattr(self, outcome) + games)
+        self.games += games
+        self.moves += moves
+        self.elapsed += elapsed
+
+
+class StatsStore:
+    """Partidas terminadas/abandonadas em SQLite, gravadas em lotes por uma thread.
+
+    `record*` pode ser chamado da thread do jogo (só enfileira); as consultas
+    usam uma conexão própria da thread que as chama. `close()` grava o que
+    falta; se ninguém chamar, ele roda na saída do interpretador (atexit).
+    """
+
+    def __init__(self, path: str, batch_size: int = 512, flush_every: float = 1.0) -> None:
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # cria/confere o esquema aqui: erros de abertura aparecem para quem cria a loja
+        _connect(path).close()
+        self.batch_size = batch_size
+        self.flush_every = flush_every
+        self._inbox: "queue.Queue[object]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._reader: Optional[sqlite3.Connection] = None
+        self.written = 0       # partidas gravadas
+        self.batches = 0       # transações
+        self.dropped = 0       # partidas perdidas por erro de gravação
+        self.error: Optional[str] = None
+
+    # ---------- gravação (qualquer thread) ----------
+    def record(self, seed: int, suits: int, outcome: str, moves: int, elapsed: float,
+               removed: int = 0, finished_at: Optional[float] = None) -> None:
+        if outcome not in OUTCOMES:
+            raise ValueError(f"resultado desconhecido: {outcome}")
+        self._inbox.put((seed, suits, outcome, moves, float(elapsed), removed,
+                         time.time() if finished_at is None else finished_at))
+        self._ensure_thread()
+
+    def record_game(self, game: Game, outcome: str, moves: int, elapsed: float) -> None:
+        self.record(game.seed, len(game.variant.suits), outcome, moves, elapsed,
+                    game.removed_sequences)
+
+    def flush(self) -> None:
+        """Espera tudo o que já foi registrado estar gravado."""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._inbox.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            atexit.unregister(self.close)
+            self._inbox.put(None)
+            self._thread.join()
+            self._thread = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def __enter__(self) -> "StatsStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="spider-stats", daemon=True)
+            self._thread.start()
+            # a thread é daemon (não segura a saída); o que estiver na fila é gravado na saída
+            atexit.register(self.close)
+
+    # ---------- thread de gravação ----------
+    def _worker(self) -> None:
+        try:
+            conn: Optional[sqlite3.Connection] = _connect(self.path)
+        except (sqlite3.Error, StatsFormatError) as e:
+            # continua esvaziando a fila (flush/close não ficam esperando)
+            self.error = str(e)
+            conn = None
+        try:
+            stop = False
+            while not stop:
+                batch: List[Row] = []
+                waiting: List[threading.Event] = []
+                item = self._inbox.get()
+                deadline = time.monotonic() + self.flush_every
+                while True:
+                    if item is None:
+                        stop = True
+                        break
+                    if isinstance(item, threading.Event):
+                        waiting.append(item)
+                        break
+                    batch.append(item)
+                    timeout = deadline - time.monotonic()
+                    if len(batch) >= self.batch_size or timeout <= 0:
+                        break
+                    try:
+                        item = self._inbox.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                if batch:
+                    self._write(conn, batch)
+                for ev in waiting:
+                    ev.set()
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _write(self, conn: Optional[sqlite3.Connection], batch: List[Row]) -> None:
+        if conn is None:
+            self.dropped += len(batch)
+            return
+        totals = {}
+        for _, suits, outcome, moves, elapsed, _, _ in batch:
+            t = totals.setdefault((suits, outcome), [0, 0, 0.0])
+            t[0] += 1
+            t[1] += moves
+            t[2] += elapsed
+        try:
+            with conn:
+                conn.executemany(_INSERT, batch)
+                conn.executemany(_ADD_TOTALS, [(s, o, *t) for (s, o), t in totals.items()])
+        except sqlite3.Error as e:
+            self.error = str(e)
+            self.dropped += len(batch)
+            return
+        self.written += len(batch)
+        self.batches += 1
+
+    # ---------- consultas (thread de quem chama) ----------
+    def _db(self) -> sqlite3.Connection:
+        if self._reader is None:
+            self._reader = _connect(self.path)
+        return self._reader
+
+    def fastest(self, seed: int, suits: int = 2) -> Optional[GameResult]:
+        """Vitória mais rápida na seed (índice games_seed)."""
+        row = self._db().execute(
+            f"{_SELECT} WHERE suits = ? AND seed = ? AND outcome = 'won' ORDER BY elapsed LIMIT 1",
+            (suits, seed)).fetchone()
+        return GameResult(*row) if row else None
+
+    def seed_totals(self, seed: int, suits: int = 2) -> Totals:
+        """Partidas, resultados e melhor tempo de uma seed (só o índice games_seed)."""
+        t = Totals()
+        for outcome, n, best in self._db().execute(
+                "SELECT outcome, COUNT(*), MIN(elapsed) FROM games"
+                " WHERE suits = ? AND seed = ? GROUP BY outcome", (suits, seed)):
+            t.add(outcome, n, 0, 0.0)
+            if outcome == WON:
+                t.best_time = best
+        return t
+
+    def personal_bests(self, suits: int = 2, limit: int = 10, by: str = "elapsed") -> List[GameResult]:
+        """Vitórias com menor tempo (`by="elapsed"`) ou menos movimentos (`by="moves"`)."""
+        if by not in ("elapsed", "moves"):
+            raise ValueError(f"ordenação desconhecida: {by}")
+        rows = self._db().execute(
+            f"{_SELECT} WHERE suits = ? AND outcome = 'won' ORDER BY {by} LIMIT ?", (suits, limit))
+        return [GameResult(*row) for row in rows]
+
+    def totals(self, suits: Optional[int] = None) -> Totals:
+        """Partidas e taxa de vitória (tabela `totals`; todas as variantes se `suits` for None)."""
+        t = Totals()
+        sql = "SELECT outcome, games, moves, elapsed FROM totals"
+        rows = self._db().execute(sql, ()) if suits is None else \
+            self._db().execute(f"{sql} WHERE suits = ?", (suits,))
+        for outcome, games, moves, elapsed in rows:
+            t.add(outcome, games, moves, elapsed)
+        if suits is not None:
+            best = self.personal_bests(suits, 1)
+            t.best_time = best[0].elapsed if best else None
+        return t
+
+    def __len__(self) -> int:
+        return self.totals().games
+
+    # ---------- exportação (pandas) ----------
+    def iter_dataframes(self, suits: Optional[int] = None,
+                        chunksize: int = 200_000) -> Iterator["pandas.DataFrame"]:
+        """Blocos de até `chunksize` partidas como `pandas.DataFrame` (ordem de gravação)."""
+        import pandas as pd
+        sql, params = (_SELECT, ()) if suits is None else (f"{_SELECT} WHERE suits = ?", (suits,))
+        cur = self._db().execute(f"{sql} ORDER BY id", params)
+        while True:
+            rows = cur.fetchmany(chunksize)
+            if not rows:
+                return
+            df = pd.DataFrame.from_records(rows, columns=COLUMNS)
+            df["outcome"] = pd.Categorical(df["outcome"], categories=OUTCOMES)
+            df["finished_at"] = pd.to_datetime(df["finished_at"], unit="s")
+            yield df
+
+    def to_dataframe(self, suits: Optional[int] = None):
+        """Todas as partidas em um `pandas.DataFrame` (colunas `COLUMNS`)."""
+        import pandas as pd
+        frames = list(self.iter_dataframes(suits))
+        if not frames:
+            return pd.DataFrame({c: [] for c in COLUMNS})
+        return pd.concat(frames, ignore_index=True)
+
+    def export(self, path: str, suits: Optional[int] = None) -> int:
+        """Grava as partidas em CSV (em blocos) ou Parquet (`.parquet`, exige pyarrow). Retorna quantas."""
+        if path.endswith(".parquet"):
+            df = self.to_dataframe(suits)
+            df.to_parquet(path, index=False)
+            return len(df)
+        n = 0
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            for df in self.iter_dataframes(suits):
+                df.to_csv(f, header=n == 0, index=False)
+                n += len(df)
+            if n == 0:
+                f.write(",".join(COLUMNS) + "\n")
+        return n
+
+
+def _fmt_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    s = int(seconds)
+    return f"{s // 60:02d}:{s % 60:02d}"
+
+
+def main() -> None:
+    default_db = os.path.join(os.path.expanduser("~"), ".spider-arcade", "stats.sqlite")
+    parser = argparse.ArgumentParser(description="Estatísticas das partidas do Spider.")
+    parser.add_argument("--db", default=default_db)
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    s = sub.add_parser("show", help="totais, taxa de vitória e recordes")
+    s.add_argument("--suits", type=int, choices=sorted(VARIANTS), default=None)
+    s.add_argument("--best", type=int, default=5, help="recordes listados por variante")
+    q = sub.add_parser("seed", help="resumo e vitória mais rápida de uma seed")
+    q.add_argument("seed", type=int)
+    q.add_argument("--suits", type=int, choices=sorted(VARIANTS), default=2)
+    e = sub.add_parser("export", help="exporta as partidas (.csv ou .parquet)")
+    e.add_argument("out")
+    e.add_argument("--suits", type=int, choices=sorted(VARIANTS), default=None)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        parser.error(f"arquivo não encontrado: {args.db}")
+    with StatsStore(args.db) as store:
+        if args.cmd == "show":
+            for n in ([args.suits] if args.suits else sorted(VARIANTS)):
+                t = store.totals(n)
+                if not t.games:
+                    continue
+                print(f"{VARIANTS[n].name}: {t.games} partidas, {t.won} vitórias ({t.win_rate:.1%}), "
+                      f"{t.lost} derrotas, {t.abandoned} abandonadas, melhor tempo {_fmt_time(t.best_time)}")
+                for r in store.personal_bests(n, args.best):
+                    print(f"  {_fmt_time(r.elapsed)}  {r.moves:4d} movimentos  seed {r.seed}")
+        elif args.cmd == "seed":
+            t = store.seed_totals(args.seed, args.suits)
+            best = store.fastest(args.seed, args.suits)
+            print(f"seed {args.seed} ({VARIANTS[args.suits].name}): {t.games} partidas, "
+                  f"{t.won} vitórias ({t.win_rate:.1%}), melhor tempo {_fmt_time(t.best_time)}"
+                  + (f" em {best.moves} movimentos" if best else ""))
+        else:
+            t0 = time.perf_counter()
+            n = store.export(args.out, args.suits)
+            print(f"{n} partidas em {time.perf_counter() - t0:.1f}s -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,448 @@
+"""
+Simulador em lote com NumPy: N partidas avançando juntas, uma jogada por passo.
+
+Estado de todas as partidas em arrays (B = número de partidas):
+
+    cards    uint8 [B, 10, COL_CAP]  cartas das colunas (codificação de spider.compact:
+                                     valor | naipe | face_up)
+    height   int8  [B, 10]           altura de cada coluna
+    down     int8  [B, 10]           cartas viradas para baixo (fronteira das faces)
+    run      int8  [B, 10]           sequência mononaipe movível no topo
+    top      uint8 [B, 10]           código da carta do topo (0 = coluna vazia)
+    stock    uint8 [B, 50]           estoque (o topo é stock[stock_n - 1])
+    stock_n  int8  [B]
+    removed  int8  [B]               sequências K→A removidas
+
+Ações: `i * 10 + j` move de i para j, `DEAL_ACTION` (100) distribui e
+`EMPTY_ACTION + i * 13 + (q - 1)` move as q cartas do topo de i para a primeira
+coluna vazia. Para um destino com cartas só uma quantidade é válida (a carta da
+sequência do topo com valor = topo do destino - 1); para coluna vazia vale
+qualquer parte da sequência do topo, menos a coluna inteira (como
+`solver.legal_moves`). Regras iguais às de `Game.move` / `Game.can_receive` /
+`Game.deal`, inclusive a remoção K→A só após um movimento (não após distribuir).
+
+Só a variante de 2 naipes (`core.TWO_SUITS`): os códigos de carta são os de
+`spider.compact`, com um bit de naipe.
+
+`legal()` dá a máscara [B, N_ACTIONS] para políticas genéricas. As políticas
+embutidas (`random`, `greedy`) escolhem a jogada com operações [B, 10]
+(contagem de destinos por valor do topo), sem montar a máscara inteira.
+
+    python -m spider.vecsim --seeds 0:10000 --policy greedy --max-moves 1000
+"""
+
+from __future__ import annotations
+import argparse
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from .compact import COL_CAP, FACE_UP, OFF_COLS, OFF_HEIGHTS, OFF_REMOVED, OFF_STOCK, \
+    OFF_STOCK_N, STOCK_CAP, SUIT_BIT, VALUE_MASK, CompactGame
+from .core import TWO_SUITS, Game, Suit, Variant, _two_suits_double_deck_spec
+from .deals import deal_order
+
+N_COLS = 10
+DEAL_ACTION = N_COLS * N_COLS
+EMPTY_ACTION = DEAL_ACTION + 1
+RUN_MAX = 13
+N_ACTIONS = EMPTY_ACTION + N_COLS * RUN_MAX
+N_CODES = 64  # códigos de carta cabem em 6 bits
+N_SEQUENCES = TWO_SUITS.sequences  # sequências K→A para vencer
+
+# Índice do baralho (ordem de `Deck.create_two_suits_double_deck`) -> código da carta
+_DECK_CODES = np.array([v | (SUIT_BIT if s == Suit.H else 0)
+                        for v, s, _ in _two_suits_double_deck_spec()], dtype=np.uint8)
+_DEAL_COUNTS = TWO_SUITS.deal_counts
+_K = np.arange(RUN_MAX)
+_COLS = np.arange(N_COLS)
+_COLS8 = _COLS.astype(np.int8)
+
+
+class BatchSim:
+    def __init__(self, seeds: Iterable[int], deals: Optional[Iterable[bytes]] = None,
+                 variant: Variant = TWO_SUITS) -> None:
+        """`deals`: permutações já calculadas (ex.: `DealCatalog.deal`), uma por seed."""
+        if variant != TWO_SUITS:
+            raise ValueError(f"simulação em lote só representa 2 naipes (variante {variant.name})")
+        self.seeds = np.array(list(seeds), dtype=np.uint64)
+        b = len(self.seeds)
+        if deals is None:
+            deals = (deal_order(int(s)) for s in self.seeds)
+        order = np.frombuffer(b"".join(deals), dtype=np.uint8).reshape(b, -1)
+        dealt = _DECK_CODES[order]
+
+        self.cards = np.zeros((b, N_COLS, COL_CAP), dtype=np.uint8)
+        self.height = np.zeros((b, N_COLS), dtype=np.int8)
+        self.down = np.zeros((b, N_COLS), dtype=np.int8)
+        idx = 0
+        for c, count in enumerate(_DEAL_COUNTS):
+            self.cards[:, c, :count] = dealt[:, idx:idx + count]
+            self.cards[:, c, count - 1] |= FACE_UP
+            self.height[:, c] = count
+            self.down[:, c] = count - 1
+            idx += count
+        self.stock = np.ascontiguousarray(dealt[:, idx:])
+        self.stock_n = np.full(b, STOCK_CAP, dtype=np.int8)
+        self.removed = np.zeros(b, dtype=np.int8)
+        self.run = np.ones((b, N_COLS), dtype=np.int8)
+        self.top = self.cards[np.arange(b)[:, None], _COLS, self.height - 1]
+        self._rows = np.arange(b)
+        # Visões planas: (partida, coluna) -> b * 10 + c; carta -> (b * 10 + c) * COL_CAP + pos
+        self._cards = self.cards.reshape(-1)
+        self._height = self.height.reshape(-1)
+        self._down = self.down.reshape(-1)
+        self._run = self.run.reshape(-1)
+        self._top = self.top.reshape(-1)
+
+    def __len__(self) -> int:
+        return len(self.seeds)
+
+    # ---------- consultas ----------
+    def won(self) -> np.ndarray:
+        return self.removed >= N_SEQUENCES
+
+    def first_empty(self) -> np.ndarray:
+        """Primeira coluna vazia de cada partida (-1 se nenhuma)."""
+        empty = self.height == 0
+        return np.where(empty.any(axis=1), empty.argmax(axis=1), -1)
+
+    def can_deal(self) -> np.ndarray:
+        return (self.height > 0).all(axis=1) & (self.stock_n >= N_COLS)
+
+    def legal(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(máscara [B, N_ACTIONS] das ações válidas, quantidade [B, 100] de cada
+        movimento `i * 10 + j`)."""
+        b = len(self)
+        tops = (self.top & VALUE_MASK).astype(np.int8)
+        run, h = self.run, self.height
+        # a carta de valor tops[j] - 1 está a (tops[j] - tops[i]) cartas do topo de i;
+        # destino vazio dá quantidade <= 0 e a diagonal dá 0
+        qty = tops[:, None, :] - tops[:, :, None]                     # [B, i, j]
+        ok = (qty >= 1) & (qty <= run[:, :, None])
+        # coluna vazia: só a primeira, q = 1..run cartas, sem levar a coluna inteira
+        q = _K + 1
+        to_empty = ((self.first_empty() >= 0)[:, None, None]
+                    & (q <= run[:, :, None]) & (q < h[:, :, None]))  # [B, i, q - 1]
+
+        mask = np.empty((b, N_ACTIONS), dtype=bool)
+        mask[:, :DEAL_ACTION] = ok.reshape(b, -1)
+        mask[:, DEAL_ACTION] = self.can_deal()
+        mask[:, EMPTY_ACTION:] = to_empty.reshape(b, -1)
+        return mask, qty.reshape(b, -1)
+
+    # ---------- jogadas ----------
+    def _rescan(self, cols: np.ndarray) -> None:
+        """Recalcula `run` e `top` das colunas `cols` (índices planos b * 10 + c)."""
+        h = self._height[cols].astype(np.intp)
+        pos = h[:, None] - 1 - _K
+        c = self._cards[cols[:, None] * COL_CAP + np.maximum(pos, 0)]
+        # regra de spider.compact: carta de baixo = carta de cima + 1 (com face_up)
+        brk = np.ones((len(cols), RUN_MAX), dtype=bool)
+        brk[:, :-1] = (c[:, 1:] != c[:, :-1] + 1) | (pos[:, 1:] < 0)
+        run = 1 + brk.argmax(axis=1)
+        live = (h > 0) & ((c[:, 0] & FACE_UP) != 0)
+        self._run[cols] = np.where(live, run, 0)
+        self._top[cols] = np.where(h > 0, c[:, 0], 0)
+
+    def _reveal(self, cols: np.ndarray) -> np.ndarray:
+        """Vira o topo das colunas `cols` que estão com o topo virado para baixo."""
+        h = self._height[cols]
+        cols = cols[(h > 0) & (h == self._down[cols])]
+        self._cards[cols * COL_CAP + self._height[cols] - 1] |= FACE_UP
+        self._down[cols] -= 1
+        return cols
+
+    def step(self, actions: np.ndarray, counts: np.ndarray) -> None:
+        """Aplica uma ação por partida (-1 = nenhuma); `counts[k]` = quantidade de cartas
+        do movimento `i * 10 + j` da partida k (ignorada nas outras ações).
+
+        As ações devem ser válidas (`legal()`); não há verificação. Um movimento
+        `i * 10 + j` para coluna vazia aceita qualquer quantidade válida em `counts`.
+        """
+        rows = np.nonzero((actions >= 0) & (actions < DEAL_ACTION))[0]
+        if len(rows):
+            act = actions[rows]
+            self._step_moves(rows, act // N_COLS, act % N_COLS, counts[rows])
+        rows = np.nonzero(actions >= EMPTY_ACTION)[0]
+        if len(rows):
+            e = actions[rows] - EMPTY_ACTION
+            self._step_moves(rows, e // RUN_MAX, self.first_empty()[rows], e % RUN_MAX + 1)
+        rows = np.nonzero(actions == DEAL_ACTION)[0]
+        if len(rows):
+            self._step_deals(rows)
+
+    def _step_moves(self, rows: np.ndarray, src: np.ndarray, dst: np.ndarray,
+                    q: np.ndarray) -> None:
+        fs = rows * N_COLS + src
+        fd = rows * N_COLS + dst
+        q = q.astype(np.intp)
+        hs = self._height[fs].astype(np.intp)
+        hd = self._height[fd].astype(np.intp)
+        # copia as q cartas do topo da origem para o topo do destino
+        sel = _K < q[:, None]
+        from_pos = (fs * COL_CAP + hs - q)[:, None] + _K
+        to_pos = (fd * COL_CAP + hd)[:, None] + _K
+        self._cards[to_pos[sel]] = self._cards[from_pos[sel]]
+        hs -= q
+        self._height[fs] = hs
+        self._height[fd] = hd + q
+
+        # destino: a sequência movida continua a do topo se o naipe for o mesmo
+        # (o valor já encaixa: a jogada é válida)
+        moved_top = self._top[fs]
+        old_top = self._top[fd]
+        run_s = self._run[fs]
+        joins = (hd > 0) & ((old_top & SUIT_BIT) == (moved_top & SUIT_BIT))
+        self._run[fd] = np.where(joins, self._run[fd] + q, q)
+        self._top[fd] = moved_top
+
+        # origem: sobra parte da sequência, vira a carta de baixo ou reexamina
+        partial = q < run_s
+        self._run[fs] = np.where(partial, run_s - q, 0)
+        self._top[fs] = np.where(hs > 0, self._cards[fs * COL_CAP + np.maximum(hs - 1, 0)], 0)
+        whole = ~partial & (hs > 0)
+        face_up = whole & ((self._top[fs] & FACE_UP) != 0)
+        revealed = self._reveal(fs[whole & ~face_up])
+        self._run[revealed] = 1
+        self._top[revealed] |= FACE_UP
+        self._rescan(fs[face_up])
+
+        # K→A no destino: o topo é um Ás e a sequência do topo tem 13 cartas
+        done = fd[(self._run[fd] >= RUN_MAX) & ((moved_top & VALUE_MASK) == 1)]
+        if len(done):
+            self._height[done] -= RUN_MAX
+            self.removed[done // N_COLS] += 1
+            self._reveal(done)
+            self._rescan(done)
+
+    def _step_deals(self, rows: np.ndarray) -> None:
+        n = self.stock_n[rows].astype(np.intp)
+        # a coluna c recebe stock[n - 1 - c] (o estoque é desempilhado do fim)
+        dealt = (self.stock[rows[:, None], n[:, None] - 1 - _COLS] | FACE_UP).reshape(-1)
+        cols = (rows[:, None] * N_COLS + _COLS).reshape(-1)
+        h = self._height[cols].astype(np.intp)
+        self._cards[cols * COL_CAP + h] = dealt
+        self._height[cols] += 1
+        self.stock_n[rows] -= N_COLS
+        # a carta nova continua a sequência se o topo for a carta seguinte do mesmo naipe
+        joins = self._top[cols] == dealt + 1
+        self._run[cols] = np.where(joins, self._run[cols] + 1, 1)
+        self._top[cols] = dealt
+
+    # ---------- conversão ----------
+    def to_game(self, k: int) -> Game:
+        """Partida `k` como `Game` (histórico vazio), via `CompactGame`."""
+        st = CompactGame()
+        buf = st.buf
+        for c in range(N_COLS):
+            h = int(self.height[k, c])
+            base = OFF_COLS + c * COL_CAP
+            buf[base:base + h] = self.cards[k, c, :h].tobytes()
+            buf[OFF_HEIGHTS + c] = h
+        n = int(self.stock_n[k])
+        buf[OFF_STOCK:OFF_STOCK + n] = self.stock[k, :n].tobytes()
+        buf[OFF_STOCK_N] = n
+        buf[OFF_REMOVED] = int(self.removed[k])
+        return st.to_game(seed=int(self.seeds[k]))
+
+
+# =========================
+# Políticas / rollouts
+# =========================
+# Uma política recebe (sim, rng) e devolve (ações [B], quantidades [B]); -1 = sem jogada.
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(z: np.ndarray) -> np.ndarray:
+    """Finalizador do splitmix64 (aritmética uint64 com estouro)."""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def seed_keys(seeds: Iterable[int], repeat: int = 1) -> np.ndarray:
+    """Chaves de `RowRandom` para cada seed repetida `repeat` vezes (cópias com chaves distintas)."""
+    base = _mix64(np.array([s & _MASK64 for s in seeds], dtype=np.uint64))
+    return np.repeat(base, repeat) ^ np.tile(np.arange(repeat, dtype=np.uint64), len(base))
+
+
+class RowRandom:
+    """Um gerador splitmix64 por partida: a sequência de cada linha só depende da
+    sua chave, e não do lote em que ela roda nem das outras linhas."""
+
+    def __init__(self, keys: np.ndarray) -> None:
+        self.state = _mix64(np.asarray(keys, dtype=np.uint64))
+
+    def _next(self, rows: np.ndarray) -> np.ndarray:
+        s = self.state[rows] + _GOLDEN
+        self.state[rows] = s
+        return _mix64(s)
+
+    def random(self, rows: np.ndarray) -> np.ndarray:
+        """Um float uniforme em [0, 1) por linha de `rows`."""
+        return (self._next(rows) >> np.uint64(11)) * (1.0 / (1 << 53))
+
+    def bytes(self, rows: np.ndarray, n: int) -> np.ndarray:
+        """`n` bytes aleatórios por linha de `rows`: uint8 [len(rows), n]."""
+        words = np.stack([self._next(rows) for _ in range((n + 7) // 8)], axis=1)
+        return words.view(np.uint8)[:, :n]
+
+def _dest_range(sim: BatchSim) -> Tuple[np.ndarray, np.ndarray]:
+    """Para cada origem, valores de topo que aceitam parte da sua sequência: [lo, hi]."""
+    tops = (sim.top & VALUE_MASK).astype(np.int8)
+    return tops + 1, tops + sim.run
+
+
+def choose_random(sim: BatchSim, rng: RowRandom,
+                  rows: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Ação uniforme entre as de `legal()` (opcionalmente só nas partidas `rows`)."""
+    if rows is None:
+        rows = sim._rows
+    b = len(rows)
+    tops = (sim.top[rows] & VALUE_MASK).astype(np.intp)
+    run = sim.run[rows].astype(np.intp)
+    h = sim.height[rows]
+    # quantas colunas têm topo de cada valor -> contagem acumulada por valor
+    hist = np.bincount((np.arange(b)[:, None] * 16 + tops).reshape(-1), minlength=b * 16)
+    cum = np.zeros((b, 17), dtype=np.int16)
+    np.cumsum(hist.reshape(b, 16), axis=1, out=cum[:, 1:])
+    lo, hi = tops + 1, tops + run
+    r2 = np.arange(b)[:, None]
+    n_dest = np.where(run > 0, cum[r2, np.minimum(hi + 1, 16)] - cum[r2, np.minimum(lo, 16)], 0)
+    first = sim.first_empty()[rows]
+    # para a primeira coluna vazia: q = 1..run cartas, sem levar a coluna inteira
+    n_empty = np.where((first >= 0)[:, None], np.clip(np.minimum(run, h - 1), 0, None), 0)
+    per_src = np.empty((b, N_COLS + 1), dtype=np.int16)
+    per_src[:, :N_COLS] = n_dest + n_empty
+    per_src[:, N_COLS] = sim.can_deal()[rows]
+    acc = np.cumsum(per_src, axis=1)
+    total = acc[:, -1]
+    pick = (rng.random(rows) * total).astype(np.int16)
+    src = (acc > pick[:, None]).argmax(axis=1)
+    k = pick - np.where(src > 0, acc[np.arange(b), np.maximum(src - 1, 0)], 0)
+
+    # k-ésimo destino da origem escolhida (em ordem de coluna; depois a coluna vazia,
+    # de 1 carta até a sequência do topo)
+    s = np.minimum(src, N_COLS - 1)
+    s_lo, s_hi = lo[np.arange(b), s][:, None], hi[np.arange(b), s][:, None]
+    fits = (tops >= s_lo) & (tops <= s_hi)
+    acc_fit = np.cumsum(fits, axis=1)
+    nth = acc_fit > k[:, None]
+    any_fit = nth.any(axis=1)
+    dst = np.where(any_fit, nth.argmax(axis=1), first)
+    count = np.where(any_fit, tops[np.arange(b), dst] - tops[np.arange(b), s], k - acc_fit[:, -1] + 1)
+
+    act = np.where(src == N_COLS, DEAL_ACTION, s * N_COLS + dst)
+    act = np.where(total > 0, act, -1)
+    out_a = np.full(len(sim), -1, dtype=np.intp)
+    out_c = np.zeros(len(sim), dtype=np.intp)
+    out_a[rows], out_c[rows] = act, count
+    return out_a, out_c
+
+
+def choose_greedy(sim: BatchSim, rng: RowRandom) -> Tuple[np.ndarray, np.ndarray]:
+    """Movimento que progride (revela carta, junta mesmo naipe, esvazia coluna);
+    senão distribui; senão uma jogada válida ao acaso. Empates ao acaso.
+
+    Os movimentos que progridem levam sempre a sequência inteira do topo, então
+    o destino é a coluna com topo de valor `topo + run` (de preferência do mesmo naipe).
+    """
+    b = len(sim)
+    rows = sim._rows
+    top, run, h, down = sim.top, sim.run, sim.height, sim.down
+    # coluna por código do topo (com repetição, qualquer uma serve); os valores
+    # 0 (origem vazia) e 15 (alvo acima do Rei) nunca aparecem e dão -1
+    by_code = np.full(b * N_CODES, -1, dtype=np.int8)
+    base = (rows * N_CODES)[:, None]
+    by_code[base + top] = _COLS8
+    target = np.minimum((top & VALUE_MASK) + run.astype(np.uint8), VALUE_MASK)
+    same_code = target | (top & SUIT_BIT) | FACE_UP
+    j_same = by_code[base + same_code]
+    j_other = by_code[base + (same_code ^ SUIT_BIT)]
+    dst = np.where(j_same >= 0, j_same, j_other)
+
+    reveal = (run == h - down) & (down > 0)
+    # coluna vazia só compensa se revelar carta
+    empty_dst = np.where(reveal & (dst < 0), sim.first_empty()[:, None], -1)
+    has_dst = (dst >= 0) | (empty_dst >= 0)
+    # prioridade: revela > junta mesmo naipe > esvazia a coluna; 5 bits de desempate
+    flags = ((reveal << 2) | ((j_same >= 0) << 1) | ((run == h) & (dst >= 0))).astype(np.uint8)
+    flags *= has_dst
+    noise = rng.bytes(rows, N_COLS) & 31
+    src = ((flags << 5) | noise).argmax(axis=1)
+    best = flags.any(axis=1)
+    dst = np.where(dst >= 0, dst, empty_dst)[rows, src]
+
+    act = np.where(best, src * N_COLS + dst, -1)
+    count = np.where(best, run[rows, src], 0).astype(np.intp)
+    deal = ~best & sim.can_deal()
+    act[deal] = DEAL_ACTION
+    rest = np.nonzero(act < 0)[0]
+    if len(rest):
+        ra, rc = choose_random(sim, rng, rest)
+        act[rest], count[rest] = ra[rest], rc[rest]
+    return act, count
+
+
+POLICIES = {"random": choose_random, "greedy": choose_greedy}
+
+
+def rollout(sim: BatchSim, policy: str = "random", max_moves: int = 1000,
+            seed: int = 0, keys: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """Joga todas as partidas até vencer, travar ou `max_moves` jogadas.
+
+    `keys`: chave do gerador de cada partida (`seed_keys`); sem elas, a chave
+    vem de `seed` e da posição da partida no lote.
+    Retorna arrays por partida: `won`, `stuck`, `moves`, `deals`, `removed`.
+    """
+    choose = POLICIES[policy]
+    b = len(sim)
+    if keys is None:
+        keys = np.arange(b, dtype=np.uint64) ^ _mix64(np.array([seed & _MASK64], dtype=np.uint64))
+    rng = RowRandom(keys)
+    moves = np.zeros(b, dtype=np.int32)
+    deals = np.zeros(b, dtype=np.int32)
+    active = np.ones(b, dtype=bool)
+    stuck = np.zeros(b, dtype=bool)
+    for _ in range(max_moves):
+        act, count = choose(sim, rng)
+        stuck |= active & (act < 0)
+        active &= (act >= 0) & ~sim.won()
+        if not active.any():
+            break
+        act[~active] = -1
+        sim.step(act, count)
+        moves += active
+        deals += act == DEAL_ACTION
+    won = sim.won()
+    return {"won": won, "stuck": stuck & ~won, "moves": moves, "deals": deals,
+            "removed": sim.removed.astype(np.int32)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulação em lote (NumPy) de partidas de Spider.")
+    parser.add_argument("--seeds", default="0:10000", help='intervalo "A:B" (B exclusivo)')
+    parser.add_argument("--policy", choices=tuple(POLICIES), default="random")
+    parser.add_argument("--max-moves", type=int, default=1000)
+    parser.add_argument("--rng-seed", type=int, default=0)
+    args = parser.parse_args()
+
+    a, _, z = args.seeds.partition(":")
+    t0 = time.perf_counter()
+    sim = BatchSim(range(int(a), int(z)))
+    t1 = time.perf_counter()
+    res = rollout(sim, args.policy, args.max_moves, args.rng_seed)
+    t2 = time.perf_counter()
+    total = int(res["moves"].sum())
+    print(f"{len(sim)} partidas ({args.policy}): vitórias {res['won'].mean():.2%}, "
+          f"travadas {res['stuck'].mean():.2%}, seq. removidas (média) {res['removed'].mean():.2f}")
+    print(f"{total:,} jogadas em {t2 - t1:.2f} s ({total / (t2 - t1):,.0f} jogadas/s; "
+          f"distribuição inicial {t1 - t0:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,579 @@
+"""
+Spider (1, 2 ou 4 naipes) — Protótipo simples com Arcade 3.3.3 (compatível Python 3.13)
+- Variante escolhida na linha de comando: python -m spider [--suits 1|2|4] (padrão 2).
+- Sem assets: texturas das cartas geradas no primeiro uso e guardadas em cache no disco (spider.render).
+- Drag & drop de sequência válida (mesmo naipe, descendente).
+- Distribuição do estoque (barra de espaço).
+- Remoção automática K→A mononaipe.
+- Animações de distribuição, movimento, undo e remoção (spider.anim); o modelo
+  não espera por elas.
+- Contador de movimentos (inclui move, undo, redo, deal).
+- Dica (H) e jogada automática (A) com busca em segundo plano (spider.hints).
+- Sessão gravada a cada ação (spider.savefile); ao abrir, retoma a última partida não terminada.
+- Estatísticas (spider.stats): cada partida vencida, perdida ou abandonada (R ou fechar
+  sem gravação automática) vai para um banco SQLite, gravado em lotes fora do quadro.
+- Instrumentação opcional (spider.perf): F3 liga o overlay de desempenho, F4 grava um trace.
+- Timer iniciado no primeiro movimento e parado ao fim do jogo.
+"""
+
+from __future__ import annotations
+import argparse
+import logging
+import os
+import sqlite3
+from typing import Optional, Set, Tuple
+import arcade
+
+from .anim import Animator
+from .core import TWO_SUITS, VARIANTS, Game, Sequence, Suit, Variant
+from .hints import Hint, HintEngine
+from .layout import TableLayout
+from .perf import Profiler
+from .render import CardTextures, TableRenderer
+from .savefile import SaveFormatError, SessionWriter, load_latest_record
+from .solver import DEAL, apply_move
+from .stats import ABANDONED, LOST, WON, StatsFormatError, StatsStore
+
+log = logging.getLogger(__name__)
+
+# =========================
+# Configs visuais / layout
+# =========================
+SCREEN_W = 1200
+SCREEN_H = 800
+SCREEN_TITLE = "Spider ({}) — Protótipo Arcade 3.3.3"  # nome da variante
+
+CARD_W = 80
+CARD_H = 110
+COL_SPACING_X = 100
+COL_LEFT = 90
+COL_TOP_Y = SCREEN_H - 140
+STACK_DY = 28  # deslocamento vertical entre cartas da coluna
+COL_MIN_Y = 100  # centro mais baixo de uma carta (colunas altas são comprimidas)
+
+STOCK_POS = (SCREEN_W - 80, SCREEN_H - 130)
+STOCK_W, STOCK_H = 90, 120
+
+# Pilha das sequências removidas (uma por sequência, subindo REMOVED_DY)
+REMOVED_POS = (STOCK_POS[0], 130)
+REMOVED_DY = 28
+
+BG_COLOR = arcade.color.DARK_SPRING_GREEN
+CARD_COLOR = arcade.color.ANTI_FLASH_WHITE
+CARD_BACK = arcade.color.DARK_BLUE_GRAY
+CARD_BORDER = arcade.color.BLACK
+VALID_HIGHLIGHT = arcade.color.APPLE_GREEN
+INVALID_HIGHLIGHT = arcade.color.RED_DEVIL
+HINT_HIGHLIGHT = arcade.color.GOLD
+
+FONT_SIZE = 14
+
+# Taxa de quadros: ativa e ociosa (sem mudança no modelo nem input por IDLE_AFTER s)
+ACTIVE_RATE = 1 / 60
+IDLE_RATE = 1 / 4
+IDLE_AFTER = 1.0
+
+# Animações: duração de um deslocamento e quadro mais longo (s) antes de
+# terminar as animações em andamento de uma vez
+ANIM_DURATION = 0.18
+ANIM_MAX_DT = 0.1
+
+# Intervalo entre jogadas no modo automático (s)
+AUTO_DELAY = 0.3
+
+# Posições exploradas (na thread das dicas, uma vez por posição com o estoque
+# vazio) para reconhecer uma partida que só anda em círculos (derrota)
+DEAD_END_STATES = 300
+
+# Arquivo de sessões (gravação automática e recuperação após queda)
+AUTOSAVE_PATH = os.path.join(os.path.expanduser("~"), ".spider-arcade", "sessoes.spdr")
+
+# Folhas de texturas das cartas já desenhadas (uma por tamanho/cores)
+TEXTURE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".spider-arcade", "cache")
+
+# Banco de estatísticas das partidas (python -m spider.stats show)
+STATS_PATH = os.path.join(os.path.expanduser("~"), ".spider-arcade", "stats.sqlite")
+
+# Instrumentação: SPIDER_PERF=1 liga ao abrir; SPIDER_PERF_DUMP=arquivo grava o resumo
+# (ou o trace, se terminar em .trace.json) a cada 10 s
+PERF_TRACE_PATH = os.path.join(os.path.expanduser("~"), ".spider-arcade", "perf.trace.json")
+PERF_REFRESH = 0.5  # s entre atualizações do texto do overlay
+
+SUIT_COLOR = {
+    Suit.S: arcade.color.BLACK,
+    Suit.H: arcade.color.DARK_RED,
+    Suit.D: arcade.color.DARK_RED,
+    Suit.C: arcade.color.BLACK,
+}
+
+# =========================
+# Camada de visual (Arcade)
+# =========================
+
+def col_x(col_idx: int) -> float:
+    return COL_LEFT + col_idx * COL_SPACING_X
+
+class DragState:
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.active = False
+        self.from_col = -1
+        self.from_idx = -1
+        self.seq: Optional[Sequence] = None
+        self.mouse_dx = 0.0
+        self.mouse_dy = 0.0
+        self.valid_target_col = -1
+
+class SpiderView(arcade.Window):
+    def __init__(self, autosave_path: Optional[str] = AUTOSAVE_PATH,
+                 texture_cache: Optional[str] = TEXTURE_CACHE_DIR,
+                 variant: Variant = TWO_SUITS,
+                 stats_path: Optional[str] = STATS_PATH):
+        super().__init__(SCREEN_W, SCREEN_H, SCREEN_TITLE.format(variant.name.title()))
+        arcade.set_background_color(BG_COLOR)
+        self.game = Game(variant=variant)
+        self.drag = DragState()
+        self.layout = TableLayout(len(self.game.columns), COL_LEFT, COL_SPACING_X, COL_TOP_Y,
+                                  CARD_W, CARD_H, STACK_DY, COL_MIN_Y)
+        self.renderer = TableRenderer(
+            CardTextures(CARD_W, CARD_H, STOCK_W, STOCK_H,
+                         CARD_COLOR, CARD_BACK, CARD_BORDER, SUIT_COLOR, FONT_SIZE,
+                         cache_dir=texture_cache, suits=variant.suits),
+            card_pos=self.layout.card_pos,
+            slot_pos=lambda ci: (col_x(ci), COL_TOP_Y),
+            card_w=CARD_W, card_h=CARD_H,
+            stock_pos=STOCK_POS, stock_h=STOCK_H, font_size=FONT_SIZE,
+            removed_pos=REMOVED_POS, removed_dy=REMOVED_DY,
+            animator=Animator(ANIM_DURATION, ANIM_MAX_DT),
+        )
+        self._mouse_x = 0.0
+        self._mouse_y = 0.0
+        self._closed = False
+
+        # Dicas: a busca roda em outra thread; o resultado é lido no on_update
+        self.hints = HintEngine()
+        self.hint: Optional[Hint] = None
+        self.hint_wanted = False
+        self.auto_play = False
+        self._auto_wait = 0.0
+        # Posições (zobrist) já vistas no modo automático: dicas heurísticas podem
+        # andar em círculos (A→B, B→A); repetir uma posição encerra o modo
+        self._auto_seen: Set[int] = set()
+
+        # Estatísticas de jogo
+        self.moves_count = 0
+        self.timer_running = False
+        self.elapsed_time = 0.0
+        self.game_finished = False
+        self.game_lost = False
+        self.stats: Optional[StatsStore] = None
+        self._recorded = False  # partida atual já registrada nas estatísticas
+        if stats_path:
+            try:
+                self.stats = StatsStore(stats_path)
+            except (OSError, sqlite3.Error, StatsFormatError) as e:
+                log.warning("estatísticas desativadas: %s", e)
+
+        # Sessão: pode trocar a partida (e o contador/timer) pela última não terminada
+        self.autosave: Optional[SessionWriter] = None
+        if autosave_path:
+            self._open_autosave(autosave_path)
+
+        # Última versão do modelo já refletida na mesa / HUD em cache
+        self._seen_version = -1
+        self._hud_key = None
+        self._hud = ""
+        self._idle_time = 0.0
+        self._idle = False
+
+        # Desempenho: desligado não há nenhum wrapper nos handlers
+        self.perf = Profiler(dump_path=os.environ.get("SPIDER_PERF_DUMP"))
+        self.perf_text: Optional[arcade.Text] = None  # criado quando o overlay liga
+        self._perf_wait = 0.0
+        if os.environ.get("SPIDER_PERF") or self.perf.dump_path:
+            self.perf.attach(self)
+
+    # ---------- gravação da sessão ----------
+    def _open_autosave(self, path: str):
+        """Retoma a última partida não terminada (da mesma variante) do arquivo e passa a gravar nele.
+
+        O contador volta ao número de ações gravadas e o timer ao último tempo gravado."""
+        try:
+            latest = load_latest_record(path)
+            self.autosave = SessionWriter(path)
+        except (OSError, SaveFormatError) as e:
+            log.warning("gravação automática desativada: %s", e)
+            self.autosave = None
+            return
+        if latest is not None:
+            resumed, rec = latest
+            if resumed.variant == self.game.variant and not resumed.is_won():
+                self.game = resumed
+                self.moves_count = rec.n_actions
+                self.elapsed_time = rec.elapsed
+                self.autosave.resume(self.game, rec.elapsed)
+                return
+        self.autosave.start(self.game)
+
+    def _save(self):
+        if self.autosave is None:
+            return
+        try:
+            self.autosave.sync(self.game, self.elapsed_time)
+        except OSError as e:
+            log.warning("gravação automática desativada: %s", e)
+            self.autosave = None
+
+    # ---------- helpers de estado ----------
+    def _reset_stats(self):
+        self.moves_count = 0
+        self.timer_running = False
+        self.elapsed_time = 0.0
+        self.game_finished = False
+        self.game_lost = False
+        self._recorded = False
+
+    def _record_stats(self, outcome: str):
+        """Registra a partida atual uma vez (só enfileira; a gravação é em outra thread)."""
+        if self.stats is None or self._recorded:
+            return
+        self._recorded = True
+        self.stats.record_game(self.game, outcome, self.moves_count, self.elapsed_time)
+
+    def _record_unfinished(self):
+        """Ao sair de uma partida com jogadas: derrota se ela estava perdida, senão abandono."""
+        if self.moves_count or self.game_lost:
+            self._record_stats(LOST if self.game_lost else ABANDONED)
+
+    def _register_action(self):
+        """Registra uma ação do jogador (move, undo, redo, deal) bem-sucedida."""
+        if not self.timer_running and not self.game_finished:
+            self.timer_running = True
+        self.moves_count += 1
+        self._save()
+
+    def _check_game_finished(self):
+        """Marca fim de jogo: vitória (todas as sequências removidas) ou derrota
+        (sem jogadas, ou estoque vazio e só jogadas que andam em círculos).
+        Um undo depois da derrota retoma a partida.
+
+        `is_lost()` é O(1); a busca de `dead_end` roda na thread das dicas e,
+        enquanto não chega, a partida segue em andamento (ver `_update_hint`)."""
+        game = self.game
+        if game.is_won():
+            self.game_finished = True
+            self.game_lost = False
+            self.timer_running = False
+            self._record_stats(WON)
+            return
+        lost = game.is_lost()
+        if not lost and not game.stock.cards:
+            lost = self.hints.dead_end(game, DEAD_END_STATES)[1] is True
+        if lost:
+            self.timer_running = False
+        self.game_finished = self.game_lost = lost
+
+    def _sync_model(self) -> bool:
+        """Reage a mudanças no modelo (pela versão). Retorna True se mudou."""
+        if self.game.version == self._seen_version:
+            return False
+        self._seen_version = self.game.version
+        self.layout.update(self.game)
+        self.renderer.invalidate()
+        self._check_game_finished()
+        # Dica da posição anterior não vale mais; busca em andamento é cancelada
+        self.hint = None
+        self.hints.invalidate()
+        self._wake()
+        return True
+
+    def _update_hint(self, delta_time: float):
+        """Recolhe resultados da busca, mostra a dica e joga no modo automático."""
+        if self.hints.poll() and not self.game_finished and not self.game.stock.cards:
+            self._check_game_finished()  # veredito de dead_end pode ter chegado (cache: O(1))
+        if not self.hint_wanted:
+            return
+        if self.hint is None:
+            self.hint = self.hints.request(self.game)
+            if self.hint is None:
+                return
+            self._auto_wait = AUTO_DELAY
+            self._wake()
+        if not self.auto_play:
+            self.hint_wanted = False
+            return
+        if self.drag.active:
+            return
+        self._auto_wait -= delta_time
+        if self._auto_wait > 0:
+            return
+        if self.hint.move is not None and not self.game_finished and apply_move(self.game, self.hint.move):
+            self._register_action()
+            key = self.game.zobrist
+            if key in self._auto_seen:
+                self.auto_play = False
+                self.hint_wanted = False
+            self._auto_seen.add(key)
+        else:
+            self.auto_play = False
+            self.hint_wanted = False
+
+    def _wake(self):
+        """Volta à taxa de quadros normal (input ou mudança no modelo)."""
+        self._idle_time = 0.0
+        if self._idle:
+            self._idle = False
+            self.set_update_rate(ACTIVE_RATE)
+            self.set_draw_rate(ACTIVE_RATE)
+
+    def _hud_text(self) -> str:
+        """Texto do HUD; só é remontado quando algum valor exibido muda (timer: 1x/s)."""
+        total_seconds = int(self.elapsed_time)
+        key = (self._seen_version, self.moves_count, total_seconds, self.game_finished,
+               self.game_lost, self.auto_play)
+        if key != self._hud_key:
+            self._hud_key = key
+            minutes = total_seconds // 60
+            seconds = total_seconds % 60
+            time_str = f"{minutes:02d}:{seconds:02d}"
+            status = " | FIM DE JOGO" if self.game_finished else ""
+            if self.game_lost:
+                status = " | SEM JOGADAS (U desfaz, R reinicia)"
+            if self.auto_play:
+                status += " | AUTO"
+            self._hud = (
+                f"Seq. removidas: {self.game.removed_sequences}"
+                f"  | Movimentos: {self.moves_count}"
+                f"  | Tempo: {time_str}{status}"
+                f"  | U desfazer"
+                f"  | Y refazer"
+                f"  | Espaço distribuir"
+                f"  | R reiniciar"
+                f"  | H dica"
+                f"  | A auto"
+            )
+        return self._hud
+
+    # ---------- ciclo do arcade ----------
+    def on_update(self, delta_time: float):
+        if self.timer_running and not self.game_finished:
+            self.elapsed_time += delta_time
+        changed = self._sync_model()
+        # Posições de todas as cartas em movimento, uma vez por atualização
+        self.renderer.update(self.game, delta_time)
+        self._update_hint(delta_time)
+        if self.perf.enabled:
+            self._perf_wait -= delta_time
+            if self._perf_wait <= 0:
+                self._perf_wait = PERF_REFRESH
+                if self.perf_text is None:
+                    self.perf_text = arcade.Text("", 10, SCREEN_H - 10, arcade.color.WHITE, 10,
+                                                 width=SCREEN_W // 2, multiline=True,
+                                                 anchor_y="top", font_name="Liberation Mono")
+                self.perf_text.text = self.perf.overlay_text()
+        if (changed or self.drag.active or self.hints.busy or self.auto_play
+                or self.renderer.animating):
+            return
+        self._idle_time += delta_time
+        if not self._idle and self._idle_time >= IDLE_AFTER:
+            # Mesa parada: poucos quadros por segundo bastam para o timer
+            self._idle = True
+            self.set_draw_rate(IDLE_RATE)
+            self.set_update_rate(IDLE_RATE)
+
+    # ------------- util de hit-test -------------
+    def pick_column_card(self, x: float, y: float) -> Optional[Tuple[int, int]]:
+        # Índice aritmético (spider.layout): O(1), sem criar retângulos por carta
+        self.layout.update(self.game)
+        return self.layout.pick(x, y)
+
+    def target_column_from_point(self, x: float, y: float) -> Optional[int]:
+        hit = self.pick_column_card(x, y)
+        if hit is None:
+            return None
+        col_idx, _ = hit
+        return col_idx
+
+    # ------------- eventos -------------
+    def on_draw(self):
+        self.clear()
+        self._sync_model()
+
+        # Mesa, cartas em drag e HUD (sprites/textos reaproveitados; a mesa só
+        # é remontada quando a versão do modelo muda)
+        self.renderer.draw(self.game, self._hud_text())
+
+        if self.drag.active and self.drag.seq is not None:
+            tgt = self.target_column_from_point(self._mouse_x, self._mouse_y)
+            if tgt is not None:
+                color = VALID_HIGHLIGHT if self.drag.valid_target_col == tgt else INVALID_HIGHLIGHT
+                arcade.draw_rect_outline(
+                    arcade.rect.XYWH(col_x(tgt), COL_TOP_Y,
+                                     CARD_W + 6, CARD_H + 6),
+                    color,
+                    3,
+                )
+
+        if self.hint is not None and self.hint.move is not None and not self.drag.active:
+            self._draw_hint(self.hint.move)
+
+        if self.perf.enabled and self.perf_text is not None:
+            self.perf_text.draw()
+
+    def _draw_hint(self, move):
+        """Contorno na carta de origem e no topo da coluna de destino (ou no estoque)."""
+        if move == DEAL:
+            arcade.draw_rect_outline(arcade.rect.XYWH(STOCK_POS[0], STOCK_POS[1],
+                                                      STOCK_W + 10, STOCK_H + 10),
+                                     HINT_HIGHLIGHT, 3)
+            return
+        col_i, idx, col_j = move
+        x, y = self.layout.card_pos(col_i, idx)
+        arcade.draw_rect_outline(arcade.rect.XYWH(x, y, CARD_W + 6, CARD_H + 6), HINT_HIGHLIGHT, 3)
+        x, y = self.layout.card_pos(col_j, max(len(self.game.columns[col_j].cards) - 1, 0))
+        arcade.draw_rect_outline(arcade.rect.XYWH(x, y, CARD_W + 6, CARD_H + 6), HINT_HIGHLIGHT, 2)
+
+    def on_mouse_press(self, x: float, y: float, button: int, modifiers: int):
+        self._wake()
+        self._mouse_x, self._mouse_y = x, y
+        hit = self.pick_column_card(x, y)
+        if hit is None:
+            return
+        col_idx, card_idx = hit
+        if card_idx == -1:
+            return
+
+        col = self.game.columns[col_idx]
+        if not col.cards[card_idx].face_up:
+            return
+
+        seq = col.movable_subsequence_from(card_idx)
+        if seq is None:
+            return
+
+        self.drag.active = True
+        self.drag.from_col = col_idx
+        self.drag.from_idx = card_idx
+        self.drag.seq = seq
+
+        rx, ry = self.layout.card_pos(col_idx, card_idx)
+        self.drag.mouse_dx = x - rx
+        self.drag.mouse_dy = y - ry
+        self.renderer.set_drag(seq.cards, col_idx, card_idx)
+        self.renderer.move_drag(col_idx, card_idx, self.drag.mouse_dx, self.drag.mouse_dy)
+
+        tgt = self.target_column_from_point(x, y)
+        self.drag.valid_target_col = -1
+        if tgt is not None and self.game.can_receive(self.game.columns[tgt], seq):
+            self.drag.valid_target_col = tgt
+
+    def on_mouse_motion(self, x: float, y: float, dx: float, dy: float):
+        self._wake()
+        self._mouse_x, self._mouse_y = x, y
+        if not self.drag.active or self.drag.seq is None:
+            return
+        tgt = self.target_column_from_point(x, y)
+        self.drag.valid_target_col = -1
+        if tgt is not None and self.game.can_receive(self.game.columns[tgt], self.drag.seq):
+            self.drag.valid_target_col = tgt
+
+    def on_mouse_release(self, x: float, y: float, button: int, modifiers: int):
+        self._wake()
+        self._mouse_x, self._mouse_y = x, y
+        if not self.drag.active or self.drag.seq is None:
+            self.drag.reset()
+            return
+
+        tgt = self.target_column_from_point(x, y)
+        action_done = False
+        if tgt is not None and self.drag.valid_target_col == tgt:
+            if self.game.move(self.drag.from_col, self.drag.from_idx, tgt):
+                action_done = True
+
+        self.drag.reset()
+        self.renderer.set_drag(None)
+
+        if action_done:
+            self._register_action()
+
+    def on_key_press(self, symbol: int, modifiers: int):
+        self._wake()
+        if symbol == arcade.key.SPACE:
+            if self.game.deal():
+                self._register_action()
+        elif symbol == arcade.key.U:
+            if self.game.undo():
+                self._register_action()
+        elif symbol == arcade.key.Y:
+            if self.game.redo():
+                self._register_action()
+        elif symbol == arcade.key.R:
+            self.auto_play = False
+            self.hint_wanted = False
+            self._record_unfinished()
+            self.game.reset()
+            self._reset_stats()
+            self._save()
+        elif symbol == arcade.key.H:
+            self.hint_wanted = True
+        elif symbol == arcade.key.A:
+            self.auto_play = not self.auto_play
+            self.hint_wanted = self.auto_play
+            self._auto_seen = {self.game.zobrist}
+        elif symbol == arcade.key.F3:
+            if self.perf.enabled:
+                self.perf.detach()
+            else:
+                self.perf.clear()
+                self.perf.attach(self)
+                self._perf_wait = 0.0
+        elif symbol == arcade.key.F4:
+            if self.perf.enabled:
+                self.perf.dump_chrome_trace(PERF_TRACE_PATH)
+                log.info("trace gravado em %s", PERF_TRACE_PATH)
+        elif symbol == arcade.key.ESCAPE:
+            # close_window() não despacha on_close: encerra aqui antes
+            self._shutdown()
+            arcade.close_window()
+
+    def on_close(self):
+        self._shutdown()
+        super().on_close()
+
+    def _shutdown(self):
+        """Grava o que falta (sessão, estatísticas, cache de texturas); roda uma vez só."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.perf.enabled:
+            self.perf.detach()
+        self.hints.close()
+        if self.autosave is not None:
+            try:
+                self.autosave.write_time(self.elapsed_time)
+            except OSError as e:
+                log.warning("gravação automática desativada: %s", e)
+            self.autosave.close()
+        else:
+            # sem gravação automática a partida não será retomada: conta como encerrada
+            self._record_unfinished()
+        if self.stats is not None:
+            self.stats.close()
+        try:
+            self.renderer.tex.save_cache()
+        except OSError as e:
+            log.warning("cache de texturas não gravado: %s", e)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Paciência Spider (Arcade).")
+    parser.add_argument("--suits", type=int, choices=sorted(VARIANTS), default=2,
+                        help="naipes do baralho (padrão 2)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+    SpiderView(variant=VARIANTS[args.suits])
+    arcade.run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Saída do lote (spider.batch): retomada com linha cortada e arquivo existente.
+
+    python -m pytest tests/test_batch.py
+"""
+
+from __future__ import annotations
+import csv
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.batch import FIELDS, ResultWriter, completed_seeds, run_batch  # noqa: E402
+
+
+def row(seed: int) -> dict:
+    return {"seed": seed, "policy": "random", "suits": 2, "outcome": "lost", "moves": 10,
+            "deals": 1, "removed_sequences": 0, "wall_time": 0.01}
+
+
+@pytest.mark.parametrize("ext", ["csv", "jsonl"])
+def test_resume_drops_partial_line(tmp_path, ext: str) -> None:
+    path = str(tmp_path / f"out.{ext}")
+    w = ResultWriter(path)
+    w.write([row(0), row(1)])
+    w.close()
+    with open(path, "rb") as f:
+        full = f.read()
+    with open(path, "ab") as f:       # interrompido no meio da linha da seed 2
+        f.write(full.splitlines(keepends=True)[-1][:12].replace(b"1", b"2"))
+
+    assert run_batch([0, 1, 2], path, "random", workers=1, max_moves=50, resume=True)
+    with open(path, newline="", encoding="utf-8") as f:
+        if ext == "csv":
+            rows = list(csv.DictReader(f))
+            assert list(rows[0]) == FIELDS
+        else:
+            rows = [json.loads(line) for line in f]
+    assert [int(r["seed"]) for r in rows] == [0, 1, 2]
+
+
+def test_refuses_to_overwrite(tmp_path) -> None:
+    path = str(tmp_path / "out.jsonl")
+    run_batch([0], path, "random", workers=1, max_moves=50)
+    with pytest.raises(FileExistsError):
+        run_batch([1], path, "random", workers=1, max_moves=50)
+    run_batch([1], path, "random", workers=1, max_moves=50, overwrite=True)
+    assert completed_seeds(path, "random") == {1}
@@ -0,0 +1,106 @@
+"""
+Estado compacto (spider.compact) contra `Game`: sequências aleatórias de
+make/deal/unmake com as mesmas alturas e cartas em cada coluna.
+
+    python -m pytest tests/test_compact.py
+"""
+
+from __future__ import annotations
+import os
+import random
+import sys
+from typing import List, Tuple
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.compact import N_COLS, CompactGame, encode_card, pack_move  # noqa: E402
+from spider.core import VARIANTS, Game  # noqa: E402
+from spider.solver import DEAL, SOLVED, apply_move, legal_moves, solve  # noqa: E402
+
+
+def game_state(game: Game) -> Tuple:
+    cols = [[encode_card(c) for c in col.cards] for col in game.columns]
+    return [len(c) for c in cols], cols, len(game.stock.cards), game.removed_sequences
+
+
+def compact_state(st: CompactGame) -> Tuple:
+    heights = [st.height(ci) for ci in range(N_COLS)]
+    cols = [[st.card(ci, k) for k in range(h)] for ci, h in enumerate(heights)]
+    return heights, cols, st.stock_count(), st.removed_sequences
+
+
+def packed(moves: List) -> List[int]:
+    return sorted(-1 if mv == DEAL else pack_move(*mv) for mv in moves)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_random_make_unmake(seed: int) -> None:
+    game = Game(seed=seed)
+    st = CompactGame.from_game(game)
+    rng = random.Random(seed)
+    out: List[int] = []
+    depth = 0
+    for _ in range(400):
+        moves = legal_moves(game)
+        assert packed(moves) == sorted(st.legal_moves(out))
+        if depth and (not moves or rng.random() < 0.3):
+            assert game.undo() and st.unmake()
+            depth -= 1
+        elif moves:
+            mv = rng.choice(moves)
+            apply_move(game, mv)
+            assert st.apply(-1 if mv == DEAL else pack_move(*mv))
+            depth += 1
+        else:
+            break
+        assert compact_state(st) == game_state(game)
+    while depth:
+        assert game.undo() and st.unmake()
+        depth -= 1
+        assert compact_state(st) == game_state(game)
+    assert compact_state(st) == game_state(Game(seed=seed))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_to_game_snapshot_round_trip(seed: int) -> None:
+    game = Game(seed=seed)
+    rng = random.Random(seed)
+    for _ in range(80):
+        moves = legal_moves(game)
+        if not moves:
+            break
+        apply_move(game, rng.choice(moves))
+    copy = CompactGame.from_game(game).to_game(seed=seed)
+    assert game_state(copy) == game_state(game)
+    assert copy.zobrist == game.zobrist
+    # o baralho continua o de `Deck.create`: o instantâneo vale em outro `Game`
+    again = Game.from_snapshot(copy.snapshot(), seed=seed)
+    assert game_state(again) == game_state(game)
+
+
+def test_solved_line() -> None:
+    # linha vencedora: passa pelas remoções K→A (e pelo unmake delas)
+    for seed in range(10):
+        result = solve(Game(seed=seed), max_nodes=20_000)
+        if result.status == SOLVED:
+            break
+    else:
+        pytest.fail("nenhuma seed resolvida")
+    game = Game(seed=seed)
+    st = CompactGame.from_game(game)
+    for mv in result.line:
+        apply_move(game, mv)
+        assert st.apply(-1 if mv == DEAL else pack_move(*mv))
+        assert compact_state(st) == game_state(game)
+    assert st.removed_sequences == 8
+    for _ in result.line:
+        assert game.undo() and st.unmake()
+        assert compact_state(st) == game_state(game)
+
+
+@pytest.mark.parametrize("suits", [1, 4])
+def test_rejects_other_variants(suits: int) -> None:
+    with pytest.raises(ValueError):
+        CompactGame.from_game(Game(seed=0, variant=VARIANTS[suits]))
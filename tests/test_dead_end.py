@@ -0,0 +1,92 @@
+"""
+Derrota (Game.is_lost e solver.dead_end) em posições montadas à mão.
+
+    python -m pytest tests/test_dead_end.py
+"""
+
+from __future__ import annotations
+import os
+import sys
+from typing import List, Sequence, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.compact import (COL_CAP, FACE_UP, OFF_COLS, OFF_HEIGHTS, OFF_REMOVED, OFF_RUNS,  # noqa: E402
+                            OFF_STOCK, OFF_STOCK_N, SUIT_BIT, CompactGame)
+from spider.core import Game  # noqa: E402
+from spider.solver import dead_end, legal_moves  # noqa: E402
+
+# carta: (valor, "S" ou "H", virada para cima)
+C = Tuple[int, str, bool]
+
+
+def up(value: int, suit: str = "S") -> C:
+    return value, suit, True
+
+
+def down(value: int, suit: str = "S") -> C:
+    return value, suit, False
+
+
+def position(columns: Sequence[List[C]], stock: Sequence[C] = (), removed: int = 0) -> Game:
+    st = CompactGame()
+    buf = st.buf
+    for ci, col in enumerate(columns):
+        for k, (value, suit, face_up) in enumerate(col):
+            buf[OFF_COLS + ci * COL_CAP + k] = (value | (SUIT_BIT if suit == "H" else 0)
+                                                | (FACE_UP if face_up else 0))
+        buf[OFF_HEIGHTS + ci] = len(col)
+    for k, (value, suit, _) in enumerate(stock):
+        buf[OFF_STOCK + k] = value | (SUIT_BIT if suit == "H" else 0)
+    buf[OFF_STOCK_N] = len(stock)
+    buf[OFF_REMOVED] = removed
+    for ci in range(len(columns)):
+        buf[OFF_RUNS + ci] = st._scan_run(ci)
+    return st.to_game(seed=0)
+
+
+# uma carta virada diferente por coluna (o baralho de 2 naipes tem 4 cópias de cada)
+DOWN = [down(v, s) for v in (7, 8, 9, 10, 11) for s in "SH"]
+# oito ases e dois 3 no topo: nada recebe nada
+STUCK = ([[DOWN[ci], up(1, "S" if ci < 4 else "H")] for ci in range(8)]
+         + [[DOWN[8], up(3)], [up(3, "H")]])
+
+
+def test_no_moves_no_stock_is_lost() -> None:
+    game = position(STUCK)
+    assert game.legal_move_count() == 0 and not legal_moves(game)
+    assert not game.can_deal() and game.is_lost()
+    assert dead_end(game) is True
+
+
+def test_one_move_left_is_not_lost() -> None:
+    cols = [list(c) for c in STUCK]
+    cols[9] = [up(2, "H")]           # um ás pode ir para o 2
+    game = position(cols)
+    assert game.legal_move_count() == len(legal_moves(game)) > 0
+    assert not game.is_lost()
+    # o ás sai de cima de uma carta virada: revela, então há progresso
+    assert dead_end(game) is False
+
+
+def test_stock_left_is_not_lost() -> None:
+    game = position(STUCK, stock=[down(4, s) for s in "SH" * 4] + [down(5), down(5, "H")])
+    assert game.legal_move_count() == 0 and game.can_deal()
+    assert not game.is_lost() and dead_end(game) is False
+
+
+def test_won_is_not_lost() -> None:
+    game = position([[]] * 10, removed=8)
+    assert game.is_won() and not game.is_lost()
+
+
+def test_circular_moves_are_a_dead_end() -> None:
+    # o 5♠ só vai e volta entre o 6♥ e o 6♠; nada revela carta nem remove sequência
+    cols = [list(c) for c in STUCK]
+    cols[8] = [DOWN[8], up(6, "H"), up(5)]
+    cols[9] = [DOWN[9], up(6)]
+    game = position(cols)
+    assert game.legal_move_count() > 0 and not game.is_lost()
+    assert dead_end(game) is True
+    # com orçamento curto demais, o veredito fica em aberto
+    assert dead_end(game, max_states=1) is None
@@ -0,0 +1,90 @@
+"""
+Dicas (spider.hints): cache por posição (`Game.zobrist`), troca de posição e
+veredito de beco sem saída, com a thread de busca de verdade.
+
+    python -m pytest tests/test_hints.py
+"""
+
+from __future__ import annotations
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.core import Game  # noqa: E402
+from spider.hints import HintEngine  # noqa: E402
+from spider.solver import apply_move  # noqa: E402
+
+
+def settle(engine: HintEngine, timeout: float = 20.0) -> None:
+    """Espera a thread terminar o que foi pedido (como `poll()` no `on_update`)."""
+    end = time.monotonic() + timeout
+    while engine.busy:
+        engine.poll()
+        if time.monotonic() > end:
+            pytest.fail("busca não terminou")
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def engine():
+    # orçamento mínimo: a busca não acha vitória, só a dica da própria posição entra no cache
+    eng = HintEngine(max_nodes=50, max_time=1.0)
+    yield eng
+    eng.close()
+
+
+def test_cache_hit(engine: HintEngine) -> None:
+    game = Game(seed=3)
+    assert engine.cached(game) is None
+    assert engine.request(game) is None and engine.busy
+    assert engine.request(game) is None           # mesmo pedido: não reenvia
+    settle(engine)
+    hint = engine.request(game)
+    assert hint is not None and hint.move is not None and not hint.solved
+    assert engine.cached(game) is hint and engine.request(game) is hint
+    assert not engine.busy
+
+
+def test_new_position_misses_and_undo_hits(engine: HintEngine) -> None:
+    game = Game(seed=3)
+    engine.request(game)
+    settle(engine)
+    hint = engine.request(game)
+    key = game.zobrist
+
+    assert apply_move(game, hint.move)
+    assert game.zobrist != key
+    assert engine.cached(game) is None
+    assert engine.request(game) is None and engine.busy
+    settle(engine)
+    assert engine.request(game) is not None
+
+    game.undo()
+    assert game.zobrist == key and engine.cached(game) is hint
+
+
+def test_invalidate_drops_pending_search(engine: HintEngine) -> None:
+    game = Game(seed=5)
+    engine.request(game)
+    engine.invalidate()
+    assert not engine.busy
+    # um resultado atrasado não volta a marcar a busca como pendente
+    time.sleep(0.2)
+    engine.poll()
+    assert not engine.busy
+    if engine.request(game) is None:
+        settle(engine)
+    assert engine.request(game) is not None
+
+
+def test_dead_end_verdict_is_cached(engine: HintEngine) -> None:
+    game = Game(seed=3)
+    assert engine.dead_end(game, 1000) == (False, None)
+    settle(engine)
+    ready, verdict = engine.dead_end(game, 1000)
+    assert ready and verdict is False     # posição inicial com jogadas novas
+    assert engine.dead_end(game, 1000) == (True, False) and not engine.busy
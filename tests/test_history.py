@@ -0,0 +1,186 @@
+"""
+Verificação aleatória do histórico (undo/redo/goto).
+
+Joga partidas com movimentos aleatórios (misturados com a melhor jogada
+segundo a ordenação do solver) e repete linhas vencedoras do solver (para
+passar pelas 8 remoções K→A), intercalando undo e redo. A cada passo confere que a posição é exatamente a registrada
+para aquele ponto do histórico (cartas, faces e identidade dos objetos) e
+que o índice incremental das colunas (inclusive o hash de Zobrist) e a
+contagem de jogadas batem com um recálculo completo. No fim,
+salta para posições aleatórias com `Game.goto` (usando checkpoints).
+
+Os testes (pytest) rodam com seeds fixas em cada variante; a linha de comando
+roda rodadas maiores:
+
+    python -m pytest tests
+    python tests/test_history.py [--games 50] [--steps 400] [--seed 0] [--checkpoint-every 16]
+                                 [--solved 4] [--suits 2]
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import random
+import sys
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.core import TWO_SUITS, VARIANTS, Game, Variant  # noqa: E402
+from spider.solver import (DEAL, SOLVED, SolverMove, apply_move, legal_moves,  # noqa: E402
+                           ordered_moves, solve)
+
+
+@dataclass
+class FuzzStats:
+    games: int = 0
+    actions: int = 0
+    undos: int = 0
+    redos: int = 0
+    jumps: int = 0
+    removals: int = 0
+
+
+def check_index(game: Game) -> None:
+    for ci, col in enumerate(game.columns):
+        kept = (col._down, col._run, col._hash)
+        col.reindex()
+        if kept != (col._down, col._run, col._hash):
+            raise AssertionError(f"coluna {ci}: índice {kept} != {(col._down, col._run, col._hash)}")
+    n = len([mv for mv in legal_moves(game) if mv != DEAL])
+    if game.legal_move_count() != n:
+        raise AssertionError(f"contagem de jogadas {game.legal_move_count()} != {n}")
+
+
+def check_position(game: Game, states: List[bytes], where: str) -> None:
+    pos = game.historico.pos
+    if game.snapshot() != states[pos]:
+        raise AssertionError(f"{where}: posição {pos} do histórico não confere")
+    check_index(game)
+
+
+def fuzz_game(seed: int, steps: int, rng: random.Random, checkpoint_every: int,
+              stats: FuzzStats, line: Optional[List[SolverMove]] = None,
+              variant: Variant = TWO_SUITS) -> None:
+    """Uma partida; com `line`, a jogada na posição k do histórico é `line[k]`."""
+    game = Game(seed=seed, checkpoint_every=checkpoint_every, variant=variant)
+    hist = game.historico
+    # states[k] = posição depois de k jogadas do histórico atual
+    states = [game.snapshot()]
+
+    for _ in range(steps):
+        r = rng.random()
+        if r < 0.15 and hist.can_undo():
+            game.undo()
+            stats.undos += 1
+            check_position(game, states, "undo")
+            continue
+        if r < 0.25 and hist.can_redo():
+            game.redo()
+            stats.redos += 1
+            check_position(game, states, "redo")
+            continue
+
+        if line is not None:
+            if hist.pos == len(line):
+                break
+            mv = line[hist.pos]
+        else:
+            moves = ordered_moves(game) if r < 0.9 else legal_moves(game)
+            if not moves:
+                break
+            mv = moves[0] if r < 0.9 else rng.choice(moves)
+        removed = game.removed_sequences
+        if not apply_move(game, mv):
+            raise AssertionError(f"movimento legal recusado: {mv}")
+        stats.actions += 1
+        stats.removals += game.removed_sequences - removed
+        del states[hist.pos:]
+        states.append(game.snapshot())
+        check_index(game)
+        if mv != DEAL and hist.can_redo():
+            raise AssertionError("nova jogada não descartou o redo")
+
+    for _ in range(20):
+        target = rng.randint(0, len(hist.codes))
+        if not game.goto(target):
+            raise AssertionError(f"goto({target}) falhou")
+        stats.jumps += 1
+        check_position(game, states, f"goto({target})")
+
+    game.goto(0)
+    check_position(game, states, "goto(0)")
+    stats.games += 1
+
+
+def run(games: int, steps: int, seed: int = 0, checkpoint_every: int = 16,
+        solved: int = 4, max_nodes: int = 20_000, variant: Variant = TWO_SUITS) -> FuzzStats:
+    """`games` partidas aleatórias e até `solved` linhas vencedoras do solver."""
+    rng = random.Random(seed)
+    stats = FuzzStats()
+    for g in range(games):
+        fuzz_game(seed + g, steps, rng, checkpoint_every, stats, variant=variant)
+
+    found = 0
+    for g in range(games):
+        if found >= solved:
+            break
+        res = solve(Game(seed=seed + g, variant=variant), max_nodes=max_nodes)
+        if res.status != SOLVED:
+            continue
+        found += 1
+        # undo/redo aleatórios alongam o percurso; passos suficientes para terminar
+        fuzz_game(seed + g, 4 * len(res.line), rng, checkpoint_every, stats, line=res.line,
+                  variant=variant)
+    return stats
+
+
+# =========================
+# Testes (seeds fixas)
+# =========================
+
+@pytest.mark.parametrize("suits", sorted(VARIANTS))
+def test_random_play(suits: int) -> None:
+    stats = run(games=6, steps=250, seed=0, checkpoint_every=16, solved=0,
+                variant=VARIANTS[suits])
+    assert stats.games == 6 and stats.undos and stats.redos
+
+
+def test_without_checkpoints() -> None:
+    stats = run(games=4, steps=200, seed=100, checkpoint_every=0, solved=0)
+    assert stats.games == 4 and stats.jumps == 80
+
+
+def test_solved_line() -> None:
+    # linha vencedora inteira: passa pelas 8 remoções K→A com undo/redo no meio
+    stats = run(games=10, steps=0, seed=0, solved=1)
+    assert stats.removals >= 8
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Verificação aleatória de undo/redo do histórico.")
+    parser.add_argument("--games", type=int, default=50)
+    parser.add_argument("--steps", type=int, default=400)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--checkpoint-every", type=int, default=16)
+    parser.add_argument("--solved", type=int, default=4,
+                        help="quantas linhas vencedoras do solver repetir")
+    parser.add_argument("--suits", type=int, choices=sorted(VARIANTS), default=2)
+    args = parser.parse_args(argv)
+
+    try:
+        stats = run(args.games, args.steps, args.seed, args.checkpoint_every, args.solved,
+                    variant=VARIANTS[args.suits])
+    except AssertionError as e:
+        print(f"FALHA: {e}")
+        return 1
+    print(f"ok: {stats.games} partidas, {stats.actions} jogadas, {stats.undos} undo, "
+          f"{stats.redos} redo, {stats.jumps} saltos, {stats.removals} remoções K→A")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
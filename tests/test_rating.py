@@ -0,0 +1,42 @@
+"""
+Índice de dificuldade (spider.rating): limites dos campos e registros por seed.
+
+    python -m pytest tests/test_rating.py
+"""
+
+from __future__ import annotations
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.rating import MAX_MOVES, MAX_ROLLOUTS, DifficultyIndex, build_index, rate_shard  # noqa: E402
+
+
+@pytest.mark.parametrize("rollouts,max_moves", [(0, 300), (MAX_ROLLOUTS + 1, 300),
+                                                (4, 0), (4, MAX_MOVES + 1)])
+def test_rejects_out_of_range_params(tmp_path, rollouts: int, max_moves: int) -> None:
+    out = tmp_path / "idx.spdi"
+    with pytest.raises(ValueError):
+        build_index(range(4), str(out), rollouts=rollouts, max_moves=max_moves)
+    assert not os.listdir(tmp_path)
+
+
+def test_record_does_not_depend_on_shard() -> None:
+    alone = rate_shard([7], rollouts=3, max_moves=200)
+    shard = rate_shard([5, 6, 7, 8], rollouts=3, max_moves=200)
+    assert shard[2].tolist() == alone[0].tolist()
+
+
+def test_build_and_read(tmp_path) -> None:
+    out = str(tmp_path / "idx.spdi")
+    assert build_index(range(40), out, shard_size=16, rollouts=MAX_ROLLOUTS, max_moves=60,
+                       run_size=16) == 40
+    with DifficultyIndex(out) as index:
+        assert (index.rollouts, index.max_moves) == (MAX_ROLLOUTS, 60)
+        scores = [index.record(i)["score"] for i in range(len(index))]
+        assert scores == sorted(scores)
+        assert sorted(index.record(i)["seed"] for i in range(len(index))) == list(range(40))
+        assert all(index.record(i)["wins"] <= MAX_ROLLOUTS for i in range(len(index)))
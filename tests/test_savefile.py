@@ -0,0 +1,135 @@
+"""
+Sessões gravadas (spider.savefile): o arquivo refeito devolve exatamente o
+histórico da partida (códigos, cursor e posição), inclusive depois de undo
+seguido de uma jogada igual à que foi descartada, de vários passos entre duas
+gravações e de uma retomada do arquivo.
+
+    python -m pytest tests/test_savefile.py
+"""
+
+from __future__ import annotations
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.core import VARIANTS, Game  # noqa: E402
+from spider.savefile import (ReplayArchive, SessionWriter, decode_game, encode_game,  # noqa: E402
+                             load_latest, load_latest_record)
+from spider.solver import apply_move, legal_moves  # noqa: E402
+
+
+def assert_same(a: Game, b: Game) -> None:
+    assert list(a.historico.codes) == list(b.historico.codes)
+    assert a.historico.pos == b.historico.pos
+    assert a.snapshot() == b.snapshot()
+
+
+def random_action(game: Game, rng: random.Random) -> None:
+    r = rng.random()
+    if r < 0.5:
+        moves = legal_moves(game)
+        if moves:
+            apply_move(game, rng.choice(moves))
+    elif r < 0.7:
+        game.undo()
+    elif r < 0.8:
+        game.redo()
+    elif r < 0.9 and game.historico.pos:
+        # desfaz e repete a mesma jogada: o código novo é igual ao do redo descartado
+        code = game.historico.codes[game.historico.pos - 1]
+        game.undo()
+        game.play_code(code)
+    else:
+        game.goto(rng.randint(0, len(game.historico.codes)))
+
+
+@pytest.mark.parametrize("trial", range(60))
+def test_round_trip(tmp_path, trial: int) -> None:
+    rng = random.Random(trial)
+    path = str(tmp_path / "s.spdr")
+    game = Game(seed=trial, variant=VARIANTS[(1, 2, 4)[trial % 3]],
+                checkpoint_every=rng.choice((0, 8)))
+    writer = SessionWriter(path)
+    writer.start(game)
+    for step in range(200):
+        for _ in range(rng.choice((1, 1, 1, 2, 4))):   # às vezes várias ações por gravação
+            random_action(game, rng)
+        writer.sync(game, step * 1.5)
+        if rng.random() < 0.03:
+            writer.close()
+            writer = SessionWriter(path)
+            back, rec = load_latest_record(path)
+            assert_same(back, game)
+            writer.resume(game, rec.elapsed)
+    writer.close()
+    assert_same(load_latest(path), game)
+
+
+def test_encode_decode(tmp_path) -> None:
+    rng = random.Random(7)
+    game = Game(seed=7)
+    for _ in range(300):
+        random_action(game, rng)
+    assert_same(decode_game(encode_game(game)), game)
+
+
+def test_elapsed_and_prefix(tmp_path) -> None:
+    path = str(tmp_path / "s.spdr")
+    game = Game(seed=3)
+    snaps = [game.snapshot()]
+    with SessionWriter(path) as writer:
+        writer.start(game)
+        for k in range(30):
+            apply_move(game, legal_moves(game)[0])
+            writer.sync(game, k * 3.0)
+            snaps.append(game.snapshot())
+        writer.write_time(100.4)
+    with ReplayArchive(path) as archive:
+        rec = archive.last_game()
+        assert (rec.n_actions, rec.elapsed) == (30, 100.0)
+        for i in (0, 1, 17, 30):
+            assert archive.position(rec, i).snapshot() == snaps[i]
+
+
+def test_last_record_shortcut(tmp_path) -> None:
+    """`.last` aponta a última partida; sem ele (ou errado) o arquivo é percorrido todo."""
+    path = str(tmp_path / "s.spdr")
+    games = []
+    with SessionWriter(path) as writer:
+        for k in range(5):
+            game = Game(seed=k, variant=VARIANTS[(1, 2, 4)[k % 3]])
+            writer.sync(game)
+            for _ in range(10):
+                apply_move(game, legal_moves(game)[0])
+                writer.sync(game)
+            games.append(game)
+    with ReplayArchive(path) as archive:
+        full = [rec.offset for rec in archive.games()]
+        rec = archive.last_game()
+        assert (rec.index, rec.offset) == (4, full[-1])
+    assert_same(load_latest(path), games[-1])
+    # .last desatualizado (queda antes de gravá-lo), inválido ou ausente
+    with open(path + ".last", "r+b") as f:
+        f.write(b"\0" * 8)
+    assert_same(load_latest(path), games[-1])
+    os.remove(path + ".last")
+    assert_same(load_latest(path), games[-1])
+    # continua a numeração ao reabrir
+    with SessionWriter(path) as writer:
+        writer.sync(Game(seed=9))
+    with ReplayArchive(path) as archive:
+        assert archive.last_game().index == 5 == sum(1 for _ in archive.games()) - 1
+
+
+@pytest.mark.parametrize("seed", [-1, 1 << 63, 1 << 64, True, 1.5])
+def test_seed_range(seed) -> None:
+    with pytest.raises(ValueError):
+        Game(seed=seed)
+    game = Game(seed=(1 << 63) - 1)
+    assert decode_game(encode_game(game)).seed == game.seed
+    with pytest.raises(ValueError):
+        game.reset(seed=seed)
@@ -0,0 +1,146 @@
+"""
+Servidor de partidas (spider.server), sem rede: `GameServer.handle` síncrono.
+
+Diferenças aplicadas pelo cliente, despejo e volta das sessões (memória e
+arquivo, com compactação) e entradas malformadas.
+
+    python -m pytest tests/test_server.py
+"""
+
+from __future__ import annotations
+import json
+import os
+import random
+import sys
+from typing import Dict, List
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.savefile import ReplayArchive  # noqa: E402
+from spider.server import EvictionStore, GameServer, _apply, _client_moves  # noqa: E402
+
+FAR = 1e12   # `evict_idle(now=FAR)` despeja todas as sessões
+
+
+def archived_games(path: str) -> int:
+    with ReplayArchive(path) as archive:
+        return sum(1 for _ in archive.games())
+
+
+def ok(server: GameServer, **req) -> Dict:
+    resp = server.handle(req)
+    assert resp["ok"], resp
+    return resp
+
+
+def play(server: GameServer, sid: int, cols: List[List[int]], rng: random.Random, steps: int) -> None:
+    """Jogadas, distribuições e undo pelo protocolo, conferindo cada diferença com `resume`."""
+    for _ in range(steps):
+        moves = _client_moves(cols)
+        r = rng.random()
+        if r < 0.15:
+            resp = server.handle({"cmd": "undo", "s": sid})
+        elif r < 0.25 or not moves:
+            resp = server.handle({"cmd": "deal", "s": sid})
+        else:
+            i, n, j = rng.choice(moves)
+            resp = server.handle({"cmd": "move", "s": sid, "from": i, "n": n, "to": j})
+        if resp["ok"]:
+            _apply(cols, resp)
+    full = ok(server, cmd="resume", s=sid)
+    assert cols == full["cols"]
+
+
+def test_diffs_match_full_state() -> None:
+    server = GameServer()
+    rng = random.Random(1)
+    for seed in range(5):
+        resp = ok(server, cmd="open", seed=seed)
+        cols = resp["cols"]
+        play(server, resp["s"], cols, rng, 150)
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+def test_evict_and_restore(tmp_path, on_disk: bool) -> None:
+    store = EvictionStore(str(tmp_path / "evicted.spdr") if on_disk else None)
+    server = GameServer(store=store)
+    rng = random.Random(2)
+    clients = {}
+    for seed in range(6):
+        resp = ok(server, cmd="open", seed=seed)
+        clients[resp["s"]] = resp["cols"]
+        play(server, resp["s"], resp["cols"], rng, 60)
+    before = {sid: ok(server, cmd="resume", s=sid) for sid in clients}
+
+    assert server.evict_idle(now=FAR) == len(clients)
+    assert not server.sessions and len(store) == len(clients)
+    if on_disk:
+        store._f.flush()
+        assert archived_games(store.path) == len(clients)
+    for sid, full in before.items():
+        assert ok(server, cmd="resume", s=sid) == full
+    assert server.stats["restored"] == len(clients) and not len(store)
+
+    # depois de voltar, a sessão continua (inclusive o histórico para undo)
+    for sid, cols in clients.items():
+        if before[sid]["pos"]:
+            _apply(cols, ok(server, cmd="undo", s=sid))
+        play(server, sid, cols, rng, 20)
+
+
+def test_close_evicted_session() -> None:
+    server = GameServer()
+    sid = ok(server, cmd="open", seed=3)["s"]
+    server.evict_idle(now=FAR)
+    ok(server, cmd="close", s=sid)
+    assert not len(server.store)
+    assert not server.handle({"cmd": "resume", "s": sid})["ok"]
+
+
+def test_evict_file_is_compacted(tmp_path) -> None:
+    path = str(tmp_path / "evicted.spdr")
+    store = EvictionStore(path, compact_min=4096)
+    server = GameServer(store=store)
+    rng = random.Random(3)
+    sids = [ok(server, cmd="open", seed=s)["s"] for s in range(4)]
+    sizes = []
+    for _ in range(60):
+        for sid in sids:
+            play(server, sid, ok(server, cmd="resume", s=sid)["cols"], rng, 5)
+        server.evict_idle(now=FAR)
+        store._f.flush()
+        sizes.append(os.path.getsize(path))
+    assert store.compactions
+    # só os registros vivos (e no máximo outro tanto de mortos) ficam no arquivo
+    assert max(sizes[-10:]) < 4 * sizes[0] + 2 * 4096
+    assert archived_games(path) >= len(sids)
+    for sid in sids:
+        ok(server, cmd="resume", s=sid)
+
+
+@pytest.mark.parametrize("line", [
+    b"nada de json",
+    b"[1, 2]",
+    b'{"cmd": 5}',
+    b'{"cmd": "mover"}',
+    b'{"cmd": "move", "s": "1", "from": 0, "n": 1, "to": 1}',
+    b'{"cmd": "move", "s": 1, "from": "x", "n": 1, "to": 1}',
+    b'{"cmd": "move", "s": 1, "from": 0, "n": 1e400, "to": 1}',
+    b'{"cmd": "move", "s": 1, "from": 0, "n": NaN, "to": 1}',
+    b'{"cmd": "move", "s": 1, "from": 0, "n": 99, "to": 1}',
+    b'{"cmd": "open", "seed": -1}',
+    b'{"cmd": "open", "seed": 18446744073709551616}',
+    b'{"cmd": "open", "seed": true}',
+    b'{"cmd": "reset", "s": 1, "seed": 1.5}',
+    b'{"cmd": "close", "s": 99}',
+])
+def test_malformed_input(line: bytes) -> None:
+    server = GameServer()
+    sid = ok(server, cmd="open", seed=0)["s"]
+    resp = json.loads(server.handle_line(line))
+    assert resp["ok"] is False and resp["err"]
+    # o servidor segue respondendo e a sessão não mudou
+    assert ok(server, cmd="resume", s=sid)["pos"] == 0
+    assert server.stats["errors"] == 1
@@ -0,0 +1,81 @@
+"""
+Solver (spider.solver): poda de `useful_moves` e linhas vencedoras.
+
+    python -m pytest tests/test_solver.py
+"""
+
+from __future__ import annotations
+import os
+import random
+import sys
+from typing import Iterator, Tuple
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.core import VARIANTS, Game  # noqa: E402
+from spider.solver import (BUDGET_EXHAUSTED, DEAL, SOLVED, UNSOLVED, Solver,  # noqa: E402
+                           apply_move, legal_moves, solve, useful_moves)
+
+
+def positions(suits: int, games: int = 30, steps: int = 120) -> Iterator[Game]:
+    for seed in range(games):
+        game = Game(seed=seed, variant=VARIANTS[suits])
+        rng = random.Random(seed)
+        for _ in range(steps):
+            moves = legal_moves(game)
+            if not moves:
+                break
+            apply_move(game, rng.choice(moves))
+            yield game
+
+
+def classify(game: Game, mv) -> Tuple[bool, bool]:
+    """(sequência inteira saindo de pai de outro naipe, parte de sequência do mesmo naipe), para outro naipe."""
+    i, idx, j = mv
+    src, dest = game.columns[i].cards, game.columns[j].cards
+    if mv == DEAL or not dest or idx == 0 or dest[-1].suit == src[idx].suit:
+        return False, False
+    below, base = src[idx - 1], src[idx]
+    if not below.face_up or below.value != base.value + 1:
+        return False, False
+    return below.suit != base.suit, below.suit == base.suit
+
+
+@pytest.mark.parametrize("suits", [2, 4])
+def test_useful_moves_keeps_lateral_moves(suits: int) -> None:
+    lateral = split = 0
+    for game in positions(suits):
+        useful = set(useful_moves(game))
+        for mv in legal_moves(game):
+            off_parent, part = classify(game, mv)
+            if off_parent:
+                lateral += 1
+                assert mv in useful  # único jeito de liberar o pai
+            elif part:
+                split += 1
+                assert mv not in useful
+    assert lateral and split
+
+
+def test_solved_line_wins() -> None:
+    for seed in range(10):
+        game = Game(seed=seed)
+        result = solve(game, max_nodes=20_000)
+        if result.status == SOLVED:
+            for mv in result.line:
+                assert apply_move(game, mv)
+            assert game.is_won()
+            return
+    pytest.fail("nenhuma seed resolvida")
+
+
+def test_no_unsolved_claim_under_pruning() -> None:
+    # com poda, a busca esgotada não prova derrota
+    for seed in range(4):
+        solver = Solver(Game(seed=seed), max_nodes=5_000, max_idle=1)
+        result = solver.solve()
+        if solver._pruned:
+            assert result.status != UNSOLVED
+        assert result.status in (SOLVED, UNSOLVED, BUDGET_EXHAUSTED)
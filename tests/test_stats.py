@@ -0,0 +1,87 @@
+"""
+Estatísticas (spider.stats): totais, recordes e resumo por seed depois de `flush()`.
+
+    python -m pytest tests/test_stats.py
+"""
+
+from __future__ import annotations
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.core import VARIANTS, Game  # noqa: E402
+from spider.stats import ABANDONED, LOST, WON, StatsFormatError, StatsStore  # noqa: E402
+
+# (seed, naipes, resultado, movimentos, tempo)
+GAMES = [
+    (1, 2, WON, 300, 400.0),
+    (1, 2, WON, 250, 500.0),
+    (1, 2, LOST, 120, 90.0),
+    (2, 2, WON, 280, 350.0),
+    (2, 2, ABANDONED, 10, 5.0),
+    (3, 4, WON, 500, 900.0),
+    (3, 4, LOST, 200, 300.0),
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    st = StatsStore(str(tmp_path / "stats.sqlite"), batch_size=3)
+    for seed, suits, outcome, moves, elapsed in GAMES:
+        st.record(seed, suits, outcome, moves, elapsed, finished_at=1.0)
+    st.flush()
+    yield st
+    st.close()
+
+
+def test_totals(store: StatsStore) -> None:
+    t = store.totals(2)
+    assert (t.games, t.won, t.lost, t.abandoned) == (5, 3, 1, 1)
+    assert t.moves == 960 and t.elapsed == pytest.approx(1345.0)
+    assert t.win_rate == pytest.approx(0.6) and t.best_time == 350.0
+    t = store.totals(4)
+    assert (t.games, t.won, t.lost) == (2, 1, 1) and t.best_time == 900.0
+    assert store.totals().games == len(store) == len(GAMES)
+    assert store.totals(1).games == 0 and store.totals(1).best_time is None
+    assert store.written == len(GAMES) and store.batches >= 3 and not store.dropped
+
+
+def test_personal_bests(store: StatsStore) -> None:
+    assert [g.elapsed for g in store.personal_bests(2)] == [350.0, 400.0, 500.0]
+    assert [g.moves for g in store.personal_bests(2, by="moves")] == [250, 280, 300]
+    assert [(g.seed, g.moves) for g in store.personal_bests(2, limit=1)] == [(2, 280)]
+    assert [g.seed for g in store.personal_bests(4)] == [3]
+    with pytest.raises(ValueError):
+        store.personal_bests(2, by="seed")
+
+
+def test_seed_queries(store: StatsStore) -> None:
+    assert store.fastest(1).elapsed == 400.0
+    assert store.fastest(3, suits=2) is None
+    t = store.seed_totals(1)
+    assert (t.games, t.won, t.lost, t.best_time) == (3, 2, 1, 400.0)
+
+
+def test_record_game_and_reopen(tmp_path) -> None:
+    path = str(tmp_path / "stats.sqlite")
+    with StatsStore(path) as st:
+        st.record_game(Game(seed=9, variant=VARIANTS[1]), WON, 200, 120.0)
+        with pytest.raises(ValueError):
+            st.record(9, 1, "empate", 0, 0.0)
+    # close() gravou a fila: outra loja no mesmo arquivo vê a partida
+    with StatsStore(path) as st:
+        assert st.totals(1).won == 1
+        assert st.fastest(9, suits=1).moves == 200
+
+
+def test_rejects_unknown_version(tmp_path) -> None:
+    path = str(tmp_path / "stats.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA user_version = 99")
+    conn.close()
+    with pytest.raises(StatsFormatError):
+        StatsStore(path)
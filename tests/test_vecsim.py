@@ -0,0 +1,106 @@
+"""
+Simulador em lote (spider.vecsim) contra `Game`: mesmas jogadas válidas e mesmo estado.
+
+    python -m pytest tests/test_vecsim.py
+"""
+
+from __future__ import annotations
+import os
+import sys
+from typing import List, Set, Tuple
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spider.core import VARIANTS, Game  # noqa: E402
+from spider.solver import DEAL, apply_move, legal_moves  # noqa: E402
+from spider.vecsim import (DEAL_ACTION, EMPTY_ACTION, N_COLS, RUN_MAX, BatchSim,  # noqa: E402
+                           RowRandom, choose_greedy, choose_random, seed_keys)
+
+
+def actions(game: Game) -> Set[int]:
+    """`legal_moves` na codificação de `BatchSim.legal`."""
+    out = set()
+    for mv in legal_moves(game):
+        if mv == DEAL:
+            out.add(DEAL_ACTION)
+            continue
+        i, idx, j = mv
+        q = len(game.columns[i].cards) - idx
+        if game.columns[j].cards:
+            out.add(i * N_COLS + j)
+        else:
+            out.add(EMPTY_ACTION + i * RUN_MAX + q - 1)
+    return out
+
+
+def to_solver_move(game: Game, action: int, count: int) -> Tuple[int, int, int]:
+    if action == DEAL_ACTION:
+        return DEAL
+    if action >= EMPTY_ACTION:
+        i, q = divmod(action - EMPTY_ACTION, RUN_MAX)
+        j = next(c for c, col in enumerate(game.columns) if not col.cards)
+        q += 1
+    else:
+        i, j = divmod(action, N_COLS)
+        q = count
+    return i, len(game.columns[i].cards) - q, j
+
+
+def state(game: Game) -> List:
+    cols = [[(c.value, c.suit, c.face_up) for c in col.cards] for col in game.columns]
+    return [cols, len(game.stock.cards), game.removed_sequences]
+
+
+@pytest.mark.parametrize("group", range(4))
+def test_legal_and_step_match_game(group: int) -> None:
+    """Política gulosa (que esvazia colunas), trocando metade das jogadas por uma
+    parte da sequência para a coluna vazia quando há."""
+    seeds = range(group * 10, group * 10 + 10)
+    sim = BatchSim(seeds)
+    games = [Game(seed=s) for s in seeds]
+    policy_rng = RowRandom(seed_keys(seeds))
+    rng = np.random.default_rng(group)
+    to_empty = 0
+    for _ in range(300):
+        mask, qty = sim.legal()
+        act, count = choose_greedy(sim, policy_rng)
+        for k, game in enumerate(games):
+            assert set(np.nonzero(mask[k])[0]) == actions(game)
+            empty = np.nonzero(mask[k, EMPTY_ACTION:])[0]
+            if len(empty) and rng.random() < 0.5:
+                act[k] = EMPTY_ACTION + int(rng.choice(empty))
+                to_empty += 1
+            if act[k] >= 0:
+                apply_move(game, to_solver_move(game, int(act[k]), int(count[k])))
+        sim.step(act, count)
+        for k, game in enumerate(games):
+            assert state(sim.to_game(k)) == state(game)
+    assert to_empty
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_choose_random_is_legal(seed: int) -> None:
+    seeds = range(seed * 50, seed * 50 + 50)
+    sim = BatchSim(seeds)
+    rng = RowRandom(seed_keys(seeds))
+    for _ in range(200):
+        mask, qty = sim.legal()
+        act, count = choose_random(sim, rng)
+        for k in range(len(sim)):
+            a = int(act[k])
+            if a < 0:
+                assert not mask[k].any()
+            elif a < DEAL_ACTION and not sim.height[k, a % N_COLS]:
+                assert mask[k, EMPTY_ACTION + (a // N_COLS) * RUN_MAX + int(count[k]) - 1]
+            else:
+                assert mask[k, a] and (a == DEAL_ACTION or count[k] == qty[k, a])
+        sim.step(act, count)
+
+
+@pytest.mark.parametrize("suits", [1, 4])
+def test_rejects_other_variants(suits: int) -> None:
+    with pytest.raises(ValueError):
+        BatchSim([0], variant=VARIANTS[suits])